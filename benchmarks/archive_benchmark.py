@@ -0,0 +1,165 @@
+"""Indexing and query latency of the BM25 article archive over months of news.
+
+Fills a fresh archive with synthetic articles for ``--tickers`` tickers over
+``--days`` days, then times searches by ticker, by ticker and date range and
+across all tickers. It also compares the size of the returned passages with
+the whole articles an agent would otherwise be handed.
+
+    python -m benchmarks.archive_benchmark [--days 90] [--tickers 5]
+        [--per-day 4] [--queries 200] [--json OUT]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from market_research.tools.article_archive import ArticleArchive
+from market_research.tools.articles import Article
+
+# Heavy-tailed vocabulary, a handful of words are everywhere and most are rare
+_VOCABULARY = (
+    "shares rose fell percent quarter revenue guidance analysts expect earnings "
+    "margin growth outlook demand supply data center power nuclear contract "
+    "deal billion million investors market stock price target upgrade downgrade "
+    "federal reserve rates inflation energy capacity customers forecast"
+).split() + [f"term{i}" for i in range(20000)]
+
+
+def _word(rng: random.Random) -> str:
+    return _VOCABULARY[min(len(_VOCABULARY) - 1, int(rng.paretovariate(1.0)) - 1)]
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(_word(rng) for _ in range(words))
+
+
+def build_corpus(
+    days: int, tickers: int, per_day: int, words: int = 600, seed: int = 0
+) -> list[Article]:
+    rng = random.Random(seed)
+    start = date(2026, 10, 17) - timedelta(days=days)
+    articles = []
+    for day in range(days):
+        published = (start + timedelta(days=day)).isoformat() + "T14:00:00+00:00"
+        for t in range(tickers):
+            for i in range(per_day):
+                articles.append(
+                    Article(
+                        ticker=f"TCK{t}",
+                        title=_text(rng, 9),
+                        url=f"https://finance.yahoo.com/news/story-{day}-{t}-{i}.html",
+                        source="Yahoo Finance",
+                        published_at=published,
+                        content=_text(rng, words),
+                    )
+                )
+    return articles
+
+
+def _latency(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "median_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def run(
+    days: int = 90, tickers: int = 5, per_day: int = 4, queries: int = 200
+) -> dict[str, Any]:
+    articles = build_corpus(days, tickers, per_day)
+    directory = Path(tempfile.mkdtemp(prefix="market-research-archive-"))
+    archive = ArticleArchive(directory / "archive.sqlite3")
+
+    start = time.perf_counter()
+    # Add a day's worth at a time, like daily scrapes
+    batch = tickers * per_day
+    for i in range(0, len(articles), batch):
+        archive.add(articles[i : i + batch])
+    index_seconds = time.perf_counter() - start
+    # Re-adding unchanged articles should only cost the lookups
+    start = time.perf_counter()
+    archive.add(articles[-batch:])
+    readd_seconds = time.perf_counter() - start
+
+    rng = random.Random(1)
+    last_day = date(2026, 10, 16)
+    kinds: dict[str, list[float]] = {"ticker": [], "ticker_30d": [], "all": []}
+    hit_chars = []
+    for _ in range(queries):
+        query = _text(rng, 4)
+        ticker = f"TCK{rng.randrange(tickers)}"
+        for kind, kwargs in (
+            ("ticker", {"ticker": ticker}),
+            (
+                "ticker_30d",
+                {
+                    "ticker": ticker,
+                    "since": (last_day - timedelta(days=30)).isoformat(),
+                },
+            ),
+            ("all", {}),
+        ):
+            start = time.perf_counter()
+            hits = archive.search(query, top_k=5, **kwargs)
+            kinds[kind].append(time.perf_counter() - start)
+            if kind == "ticker":
+                hit_chars.append(sum(len(hit.text) for hit in hits))
+
+    article_chars = statistics.mean(len(article.content) for article in articles)
+    return {
+        "benchmark": "archive",
+        "params": {
+            "days": days,
+            "tickers": tickers,
+            "per_day": per_day,
+            "queries": queries,
+        },
+        "archive": archive.stats(),
+        "db_bytes": (directory / "archive.sqlite3").stat().st_size,
+        "index_seconds": round(index_seconds, 3),
+        "articles_per_s": round(len(articles) / index_seconds, 1),
+        "readd_day_ms": round(readd_seconds * 1000, 3),
+        "queries": {kind: _latency(samples) for kind, samples in kinds.items()},
+        "top5_chars": round(statistics.mean(hit_chars)),
+        "five_articles_chars": round(5 * article_chars),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--tickers", type=int, default=5)
+    parser.add_argument("--per-day", type=int, default=4, help="Articles per ticker")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--json", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.days, args.tickers, args.per_day, args.queries)
+    stats = results["archive"]
+    print(
+        f"{stats['articles']} articles, {stats['passages']} passages, "
+        f"{results['db_bytes'] / 1e6:.1f} MB, indexed at {results['articles_per_s']} articles/s"
+    )
+    print(f"{'query':<12}{'median ms':>11}{'p95 ms':>9}{'max ms':>9}")
+    for kind, row in results["queries"].items():
+        print(
+            f"{kind:<12}{row['median_ms']:>11.2f}{row['p95_ms']:>9.2f}{row['max_ms']:>9.2f}"
+        )
+    print(
+        f"top 5 passages: {results['top5_chars']} chars, "
+        f"5 whole articles: {results['five_articles_chars']} chars"
+    )
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Tokens and information density of compacted article content.
+
+Parses generated article pages, pads them with the boilerplate found on the
+live site, and compares cutting every body at ``--max-content-length``
+characters with sentence-level compaction under ``--budget`` tokens: tokens
+sent, figures (numbers, percentages, amounts) kept per 100 tokens, and time.
+
+    python -m benchmarks.compaction_benchmark [--articles 5] [--budget 1500]
+        [--max-content-length 1000] [--repeat 20] [--json OUT]
+"""
+
+import argparse
+import copy
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.fixtures import article_page
+from market_research.tools.articles import Article, truncate
+from market_research.tools.compaction import (
+    compact_articles,
+    count_figures,
+    estimate_tokens,
+)
+from market_research.tools.html_parsing import get_parser_backend
+
+BOILERPLATE = (
+    "Sign up for our daily newsletter to get the latest market news. ",
+    "Story continues below this ad. ",
+    "The views and opinions expressed herein are the views and opinions of the author. ",
+)
+
+
+def build_articles(count: int) -> list[Article]:
+    parser = get_parser_backend("auto")
+    articles = []
+    for index in range(count):
+        body, title = parser.parse_article(article_page(index))
+        # Syndicated articles carry the site chrome before and after the story
+        content = BOILERPLATE[0] + body + " " + BOILERPLATE[1] + BOILERPLATE[2]
+        articles.append(
+            Article("BENCH", title, f"https://example.com/{index}", "", "", content)
+        )
+    return articles
+
+
+def _measure(articles: list[Article]) -> dict[str, Any]:
+    tokens = sum(estimate_tokens(article.content) for article in articles)
+    figures = sum(count_figures(article.content) for article in articles)
+    return {
+        "tokens": tokens,
+        "figures": figures,
+        "figures_per_100_tokens": round(100 * figures / tokens, 2) if tokens else 0,
+    }
+
+
+def run(
+    count: int = 5, budget: int = 1500, max_content_length: int = 1000, repeat: int = 20
+) -> dict[str, Any]:
+    articles = build_articles(count)
+
+    truncated = copy.deepcopy(articles)
+    for article in truncated:
+        article.content = truncate(article.content, max_content_length)
+
+    samples = []
+    for _ in range(repeat):
+        compacted = copy.deepcopy(articles)
+        start = time.perf_counter()
+        compact_articles(compacted, "BENCH", budget, max_content_length)
+        samples.append(time.perf_counter() - start)
+
+    return {
+        "benchmark": "compaction",
+        "params": {
+            "articles": count,
+            "budget": budget,
+            "max_content_length": max_content_length,
+            "repeat": repeat,
+        },
+        "raw": _measure(articles),
+        "truncated": _measure(truncated),
+        "compacted": _measure(compacted),
+        "compact_ms": round(statistics.median(samples) * 1000, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=5)
+    parser.add_argument("--budget", type=int, default=1500, help="Tokens")
+    parser.add_argument("--max-content-length", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--json", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.articles, args.budget, args.max_content_length, args.repeat)
+    print(f"{'content':<11}{'tokens':>8}{'figures':>9}{'per 100 tokens':>16}")
+    for name in ("raw", "truncated", "compacted"):
+        row = results[name]
+        print(
+            f"{name:<11}{row['tokens']:>8}{row['figures']:>9}{row['figures_per_100_tokens']:>16.2f}"
+        )
+    print(f"compaction: {results['compact_ms']:.2f} ms per run")
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Yahoo Finance shaped HTML pages for offline benchmarks.
+
+Saved pages can be dropped into a directory as ``latest-news*.html`` and
+``article*.html``; when none are available, deterministic pages with the same
+structure and roughly the same weight as the live site are generated.
+"""
+
+import random
+from pathlib import Path
+from typing import Optional
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+_WORDS = (
+    "shares rose fell percent quarter revenue guidance analysts expect earnings "
+    "margin growth outlook demand supply data center power nuclear contract "
+    "deal billion million investors market stock price target upgrade downgrade "
+    "federal reserve rates inflation energy capacity customers forecast"
+).split()
+
+_SOURCES = ["Reuters", "Bloomberg", "Zacks", "Motley Fool", "Barrons", "Yahoo Finance"]
+
+
+def _sentence(rng: random.Random, words: int = 18) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + f" {rng.randint(1, 999)}.{rng.randint(0, 9)}%."
+
+
+def _page_chrome(rng: random.Random, kb: int) -> tuple[str, str]:
+    """Head and trailing scripts padding a page to roughly ``kb`` kilobytes"""
+    css = "".join(
+        f".yf-{i:04x}{{margin:{i % 7}px;padding:{i % 5}px;color:#{i:06x}}}"
+        for i in range(kb * 8)
+    )
+    state = ",".join(
+        f'"k{i}":{{"v":{rng.random():.6f},"s":"{_sentence(rng, 6)}"}}'
+        for i in range(kb * 4)
+    )
+    head = (
+        "<!DOCTYPE html><html lang='en-US'><head><meta charset='utf-8'>"
+        f"<title>Yahoo Finance</title><style>{css}</style>"
+        "<script>window.YAHOO={};window.YAHOO.context={};</script></head><body>"
+        "<header class='yf-header'><nav><ul>"
+        + "".join(
+            f"<li class='nav-item'><a href='/n{i}'>Nav {i}</a></li>" for i in range(40)
+        )
+        + "</ul></nav></header>"
+    )
+    tail = (
+        "<footer class='yf-footer'>"
+        + "".join(f"<a href='/f{i}'>Footer {i}</a>" for i in range(60))
+        + f"</footer><script type='application/json' id='state'>{{{state}}}</script>"
+        "</body></html>"
+    )
+    return head, tail
+
+
+def article_url(index: int) -> str:
+    return f"/news/story-{index:04d}-{index * 7919 % 100000:05d}.html"
+
+
+def news_stream_page(ticker: str = "AAPL", n_items: int = 50, seed: int = 0) -> str:
+    """A latest-news page with ``n_items`` story items"""
+    rng = random.Random(seed)
+    head, tail = _page_chrome(rng, 200)
+    items = []
+    for i in range(n_items):
+        source = rng.choice(_SOURCES)
+        age = f"{i // 3 + 1} hours ago" if i < 60 else f"{i // 60} days ago"
+        items.append(
+            "<li class='stream-item story-item yf-1usaaz9'>"
+            "<section class='container sz-x-large yf-1x' data-testid='storyitem'>"
+            f"<a href='{article_url(i)}' class='subtle-link fin-size-small thumb yf-1xqzjha'"
+            f" title='{_sentence(rng, 8)}'><div class='image-wrapper'>"
+            f"<img src='https://s.yimg.com/img/{i}.jpg' alt=''></div></a>"
+            "<div class='content yf-1y7058a'>"
+            f"<a href='{article_url(i)}' class='subtle-link fin-size-small titles noUnderline yf-1xqzjha'>"
+            f"<h3 class='clamp yf-1y7058a'>{ticker} {_sentence(rng, 10)}</h3>"
+            f"<p class='clamp yf-1y7058a'>{_sentence(rng)} {_sentence(rng)}</p></a>"
+            "<div class='footer yf-1y7058a'><div class='publishing yf-1weyqlp'>"
+            f"{source}<i class='dot yf-1weyqlp'></i>{age}</div>"
+            "<div class='taxonomy-links yf-1y7058a'>"
+            f"<a href='/quote/{ticker}' class='ticker-link'><span>{ticker}</span></a>"
+            "</div></div></div></section></li>"
+        )
+    stream = (
+        "<main><div class='news-stream yf-1x'><ul class='stream-items yf-1x'>"
+        + "".join(items)
+        + "</ul></div></main>"
+    )
+    return head + stream + tail
+
+
+def article_page(index: int = 0, paragraphs: int = 12, seed: int = 0) -> str:
+    """An article page with a cover title and a body of ``paragraphs`` paragraphs"""
+    rng = random.Random(seed * 100003 + index)
+    head, tail = _page_chrome(rng, 150)
+    body = "".join(
+        f"<p class='yf-1pe5jgt'>{_sentence(rng, 30)} {_sentence(rng, 25)}</p>"
+        for _ in range(paragraphs)
+    )
+    article = (
+        "<main><div class='article yf-l7apfj'><div class='cover-wrap yf-1at0uqp'>"
+        f"<div class='cover-title yf-1at0uqp'>{_sentence(rng, 9)}</div>"
+        "<div class='byline yf-1k5w6kz'><time class='byline-attr-meta-time'"
+        f" datetime='2026-10-{index % 28 + 1:02d}T13:45:00.000Z'>Oct {index % 28 + 1}, 2026</time>"
+        "</div></div><div class='body-wrap yf-40hgrf'>"
+        f"<div class='body yf-tsvcyu'>{body}</div></div></div></main>"
+    )
+    return head + article + tail
+
+
+def load_pages(
+    directory: Optional[Path] = None, n_articles: int = 20
+) -> tuple[list[str], list[str]]:
+    """Return (news stream pages, article pages), preferring saved pages on disk"""
+    directory = directory or FIXTURES_DIR
+    news = [p.read_text() for p in sorted(directory.glob("latest-news*.html"))]
+    articles = [p.read_text() for p in sorted(directory.glob("article*.html"))]
+    if not news:
+        news = [news_stream_page(n_items=50)]
+    if not articles:
+        articles = [article_page(i) for i in range(n_articles)]
+    return news, articles
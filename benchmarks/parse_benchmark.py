@@ -0,0 +1,203 @@
+"""Parse + extract time per page for each HTML parser backend.
+
+Compares the original full-tree BeautifulSoup extraction ("legacy") with the
+restricted, precompiled backends in market_research.tools.html_parsing and
+checks that every backend extracts the same data.
+
+    python -m benchmarks.parse_benchmark [--pages-dir DIR] [--json OUT]
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from bs4 import BeautifulSoup, Tag
+
+from benchmarks.fixtures import load_pages
+from market_research.tools.html_parsing import (
+    PARSER_BACKENDS,
+    TIME_SELECTORS,
+    get_parser_backend,
+)
+from market_research.tools.published_dates import parse_published_at
+
+# Relative dates on the pages are resolved against this fetch time
+FETCHED_AT = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+DATE_TEXT_HINTS = [
+    "ago",
+    "min",
+    "hour",
+    "day",
+    "week",
+    "month",
+    "year",
+    "am",
+    "pm",
+    "2024",
+    "2023",
+]
+
+
+def legacy_parse_story_items(html: str, limit: Optional[int] = None) -> list[dict]:
+    """The extraction _scrape_news_async did before parser backends existed"""
+    soup = BeautifulSoup(html, "html.parser")
+    items = []
+    for article in soup.find_all(
+        "li", class_=lambda x: x is not None and "story-item" in str(x)
+    ):
+        if limit is not None and len(items) >= limit:
+            break
+        title_elem = article.find("h3")
+        if not isinstance(title_elem, Tag):
+            continue
+        url_elem = article.find("a")
+        href = url_elem.get("href") if isinstance(url_elem, Tag) else ""
+        summary_elem = article.find("p")
+        published_at = "Unknown"
+        for selector in TIME_SELECTORS:
+            time_elem = article.select_one(selector)
+            if time_elem:
+                value = (
+                    time_elem.get("datetime")
+                    or time_elem.get("title")
+                    or time_elem.get_text(strip=True)
+                )
+                if value and value != "Unknown":
+                    published_at = value
+                    break
+        if published_at == "Unknown":
+            for text in article.find_all(string=True):
+                text_lower = text.lower().strip()
+                if (
+                    text_lower
+                    and any(pattern in text_lower for pattern in DATE_TEXT_HINTS)
+                    and len(text.strip()) < 50
+                ):
+                    published_at = text.strip()
+                    break
+        items.append(
+            {
+                "title": title_elem.get_text(strip=True),
+                "href": href or "",
+                "summary": summary_elem.get_text(strip=True)
+                if isinstance(summary_elem, Tag)
+                else "",
+                "published_at": published_at,
+            }
+        )
+    return items
+
+
+def legacy_parse_article(html: str) -> Optional[tuple[str, str]]:
+    soup = BeautifulSoup(html, "html.parser")
+    title_elem = soup.find(
+        name=("div", "h1"), class_=lambda x: x is not None and "cover-title" in str(x)
+    )
+    body_elem = soup.find("div", class_=lambda x: x is not None and "body" in str(x))
+    body = body_elem.get_text(strip=True) if isinstance(body_elem, Tag) else ""
+    if not body:
+        return None
+    title = title_elem.get_text(strip=True) if isinstance(title_elem, Tag) else ""
+    return body, title
+
+
+def _normalize_dates(pages: list[list[dict]]) -> list[list[dict]]:
+    """Legacy story items with published_at resolved the way the backends do it"""
+    normalized = []
+    for items in pages:
+        normalized.append([])
+        for item in items:
+            published = parse_published_at(item["published_at"], FETCHED_AT)
+            normalized[-1].append(
+                {
+                    **item,
+                    "published_at": published.isoformat() if published else "Unknown",
+                }
+            )
+    return normalized
+
+
+def _time_per_page(
+    func: Callable[[str], Any], pages: list[str], repeat: int
+) -> tuple[float, list[Any]]:
+    results = [func(page) for page in pages]  # warm up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            func(page)
+        samples.append((time.perf_counter() - start) / len(pages))
+    return statistics.median(samples), results
+
+
+def run(pages_dir: Optional[Path] = None, repeat: int = 5) -> dict[str, Any]:
+    news_pages, article_pages = load_pages(pages_dir)
+    extractors: dict[str, tuple[Callable, Callable]] = {
+        "legacy": (legacy_parse_story_items, legacy_parse_article)
+    }
+    for name in PARSER_BACKENDS:
+        try:
+            backend = get_parser_backend(name)
+        except ImportError:
+            continue
+        extractors[name] = (
+            partial(backend.parse_story_items, fetched_at=FETCHED_AT),
+            backend.parse_article,
+        )
+
+    results: dict[str, Any] = {
+        "news_pages": len(news_pages),
+        "article_pages": len(article_pages),
+        "news_page_bytes": sum(len(page) for page in news_pages) // len(news_pages),
+        "article_page_bytes": sum(len(page) for page in article_pages)
+        // len(article_pages),
+        "backends": {},
+    }
+    reference: Optional[tuple[list, list]] = None
+    for name, (parse_story_items, parse_article) in extractors.items():
+        news_time, news_out = _time_per_page(parse_story_items, news_pages, repeat)
+        article_time, article_out = _time_per_page(parse_article, article_pages, repeat)
+        if name == "legacy":
+            news_out = _normalize_dates(news_out)
+        if reference is None:
+            reference = (news_out, article_out)
+        results["backends"][name] = {
+            "news_ms_per_page": round(news_time * 1000, 3),
+            "article_ms_per_page": round(article_time * 1000, 3),
+            "matches_legacy": (news_out, article_out) == reference,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages-dir", type=Path, help="Directory of saved pages")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.pages_dir, args.repeat)
+    legacy = results["backends"]["legacy"]
+    print(
+        f"{'backend':<12}{'news ms/page':>14}{'article ms/page':>17}{'speedup':>9}  same"
+    )
+    for name, row in results["backends"].items():
+        speedup = (legacy["news_ms_per_page"] + legacy["article_ms_per_page"]) / (
+            row["news_ms_per_page"] + row["article_ms_per_page"]
+        )
+        print(
+            f"{name:<12}{row['news_ms_per_page']:>14.2f}{row['article_ms_per_page']:>17.2f}"
+            f"{speedup:>8.1f}x  {row['matches_legacy']}"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
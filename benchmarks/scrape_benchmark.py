@@ -0,0 +1,269 @@
+"""End-to-end scrape latency against the local Yahoo Finance stand-in server.
+
+Runs YahooNewsScraper for each article count in ``--sizes`` against
+benchmarks.server with injected latency, adds the parse throughput of every
+parser backend, and emits everything as JSON for comparison between commits.
+
+    python -m benchmarks.scrape_benchmark [--sizes 5 50 200] [--latency 0.05]
+        [--jitter 0.02] [--repeat 3] [--fetch-strategy http] [--json OUT]
+
+``--throttle-rate`` makes the server answer 429 above that many requests per
+second, and ``--rate-limit`` turns on the scraper's per-host limiter, to see
+how much of the news survives a site that blocks bursts.
+
+``--slow-rate`` makes that fraction of article pages ``--slow-latency``
+seconds slower. Compare runs with and without ``--hedge`` and a tighter
+``--article-deadline`` to see how far the tail of the article fetch
+latencies (p50/p95/p99) comes down.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from benchmarks import parse_benchmark
+from benchmarks.server import StandInServer
+from market_research.tools.fetch_budget import DEFAULT_ARTICLE_DEADLINE
+
+DEFAULT_SIZES = [5, 50, 200]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+def run_scale(
+    server: StandInServer,
+    sizes: list[int],
+    repeat: int = 3,
+    max_concurrency: int = 5,
+    fetch_strategy: str = "http",
+) -> list[dict[str, Any]]:
+    """Scrape ``size`` articles ``repeat`` times per size and time each run"""
+    from market_research.tools.yahoo_news import YahooNewsScraper
+    from market_research.utils.profiling import disable_profiling, enable_profiling
+
+    results = []
+    for size in sizes:
+        samples = []
+        articles = 0
+        requests_before, bytes_before = server.requests, server.bytes_sent
+        throttled_before = server.throttled
+        # Article fetch latencies come from the scraper's spans
+        enable_profiling()
+        for _ in range(repeat):
+            scraper = YahooNewsScraper(base_url=server.url)
+            start = time.perf_counter()
+            scraped = scraper.scrape_articles(
+                "BENCH",
+                max_articles=size,
+                max_concurrency=max_concurrency,
+                fetch_strategy=fetch_strategy,
+            )
+            samples.append(time.perf_counter() - start)
+            articles = len(scraped)
+        profiler = disable_profiling()
+        fetches = [
+            entry["duration"]
+            for entry in (profiler.spans if profiler else [])
+            if entry["name"] == "fetch.article"
+        ]
+        median = statistics.median(samples)
+        results.append(
+            {
+                "max_articles": size,
+                "articles": articles,
+                "runs": repeat,
+                "median_s": round(median, 4),
+                "p95_s": round(_percentile(samples, 0.95), 4),
+                "min_s": round(min(samples), 4),
+                "max_s": round(max(samples), 4),
+                "articles_per_s": round(articles / median, 2) if median else None,
+                "requests_per_run": (server.requests - requests_before) / repeat,
+                "bytes_per_run": (server.bytes_sent - bytes_before) // repeat,
+                "throttled_per_run": (server.throttled - throttled_before) / repeat,
+                "article_fetch_s": {
+                    f"p{round(q * 100)}": round(_percentile(fetches, q), 4)
+                    for q in (0.5, 0.95, 0.99)
+                }
+                if fetches
+                else {},
+            }
+        )
+    return results
+
+
+def run(
+    sizes: list[int],
+    latency: float = 0.05,
+    jitter: float = 0.02,
+    repeat: int = 3,
+    max_concurrency: int = 5,
+    fetch_strategy: str = "http",
+    pages_dir: Optional[Path] = None,
+    parse: bool = True,
+    rate_limit: Optional[float] = None,
+    throttle_rate: Optional[float] = None,
+    slow_rate: float = 0.0,
+    slow_latency: float = 0.0,
+    article_deadline: Optional[float] = DEFAULT_ARTICLE_DEADLINE,
+    hedge: bool = False,
+) -> dict[str, Any]:
+    # Start every benchmark from an empty article cache and scrape state
+    from market_research.tools.article_cache import configure_article_cache
+    from market_research.tools.fetch_budget import configure_fetch_budget
+    from market_research.tools.rate_limit import configure_rate_limit
+
+    configure_article_cache(enabled=False)
+    configure_fetch_budget(article_deadline=article_deadline, hedge=hedge)
+    # Measures the scraper, not the per-host limit, unless asked to
+    configure_rate_limit(rate_limit)
+    results: dict[str, Any] = {
+        "benchmark": "scrape",
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "params": {
+            "sizes": sizes,
+            "latency": latency,
+            "jitter": jitter,
+            "repeat": repeat,
+            "max_concurrency": max_concurrency,
+            "fetch_strategy": fetch_strategy,
+            "pages_dir": str(pages_dir) if pages_dir else None,
+            "rate_limit": rate_limit,
+            "throttle_rate": throttle_rate,
+            "slow_rate": slow_rate,
+            "slow_latency": slow_latency,
+            "article_deadline": article_deadline,
+            "hedge": hedge,
+        },
+    }
+    with StandInServer(
+        latency=latency,
+        jitter=jitter,
+        n_items=max(sizes),
+        pages_dir=pages_dir,
+        throttle_rate=throttle_rate,
+        slow_rate=slow_rate,
+        slow_latency=slow_latency,
+    ) as server:
+        results["scale"] = run_scale(
+            server, sizes, repeat, max_concurrency, fetch_strategy
+        )
+    if parse:
+        results["parse"] = parse_benchmark.run(pages_dir, repeat)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="Seconds")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument(
+        "--fetch-strategy", default="http", choices=["auto", "http", "browser"]
+    )
+    parser.add_argument("--pages-dir", type=Path, help="Directory of saved pages")
+    parser.add_argument("--no-parse", action="store_true", help="Skip parse timing")
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        help="Requests per second per host, off unless given",
+    )
+    parser.add_argument(
+        "--throttle-rate",
+        type=float,
+        help="Stand-in server answers 429 above this many requests/s",
+    )
+    parser.add_argument(
+        "--slow-rate", type=float, default=0.0, help="Fraction of slow article pages"
+    )
+    parser.add_argument(
+        "--slow-latency", type=float, default=0.0, help="Extra seconds of a slow page"
+    )
+    parser.add_argument(
+        "--article-deadline",
+        type=float,
+        default=DEFAULT_ARTICLE_DEADLINE,
+        help="Seconds per article page, 0 for no limit",
+    )
+    parser.add_argument(
+        "--hedge", action="store_true", help="Hedge article pages slower than p95"
+    )
+    parser.add_argument("--json", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    os.environ.setdefault(
+        "MARKET_RESEARCH_CACHE_DIR", tempfile.mkdtemp(prefix="market-research-bench-")
+    )
+    results = run(
+        args.sizes,
+        args.latency,
+        args.jitter,
+        args.repeat,
+        args.concurrency,
+        args.fetch_strategy,
+        args.pages_dir,
+        parse=not args.no_parse,
+        rate_limit=args.rate_limit,
+        throttle_rate=args.throttle_rate,
+        slow_rate=args.slow_rate,
+        slow_latency=args.slow_latency,
+        article_deadline=args.article_deadline,
+        hedge=args.hedge,
+    )
+
+    print(
+        f"{'articles':>8}{'scraped':>9}{'median s':>10}{'p95 s':>8}"
+        f"{'articles/s':>12}{'requests':>10}{'throttled':>11}"
+        f"{'fetch p50':>11}{'p95':>7}{'p99':>7}"
+    )
+    for row in results["scale"]:
+        print(
+            f"{row['max_articles']:>8}{row['articles']:>9}{row['median_s']:>10.3f}"
+            f"{row['p95_s']:>8.3f}{row['articles_per_s'] or 0:>12.1f}"
+            f"{row['requests_per_run']:>10.0f}{row['throttled_per_run']:>11.0f}"
+            + "".join(
+                f"{row['article_fetch_s'].get(name, 0):>{width}.3f}"
+                for name, width in (("p50", 11), ("p95", 7), ("p99", 7))
+            )
+        )
+    for name, row in results.get("parse", {}).get("backends", {}).items():
+        print(
+            f"parse {name:<11}{row['news_ms_per_page']:>8.2f} ms/news page"
+            f"{row['article_ms_per_page']:>8.2f} ms/article page"
+        )
+    output = json.dumps(results, indent=2)
+    if args.json:
+        args.json.write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
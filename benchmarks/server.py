@@ -0,0 +1,234 @@
+"""Local stand-in for finance.yahoo.com serving recorded or generated pages.
+
+Every response is delayed by ``latency`` seconds plus uniform ``jitter`` to
+mimic a remote site. With ``throttle_rate`` it answers 429 to requests above
+that many per second, like a site that blocks aggressive scrapers. With
+``slow_rate`` that fraction of article pages takes ``slow_latency`` seconds
+longer, like slow CDN edges and heavy embeds. Point the scraper at it with the ``base_url`` argument of
+YahooNewsScraper or the MARKET_RESEARCH_YAHOO_URL environment variable.
+
+    python -m benchmarks.server [--port 8765] [--latency 0.05] [--jitter 0.02] [--throttle-rate 5]
+        [--slow-rate 0.05] [--slow-latency 3]
+"""
+
+import argparse
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+from benchmarks.fixtures import FIXTURES_DIR, article_page, news_stream_page
+
+_NEWS_PATH = re.compile(r"^/quote/([A-Za-z0-9.\-^=]+)/latest-news/?$")
+_ARTICLE_PATH = re.compile(r"^/news/story-(\d+)-\d+\.html$")
+
+
+class StandInServer:
+    """Threaded HTTP server for the latest-news stream and its article pages.
+
+    Recorded pages in ``pages_dir`` (``latest-news*.html`` and
+    ``article*.html``) are served when present, generated fixtures otherwise.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        n_items: int = 50,
+        pages_dir: Optional[Path] = None,
+        seed: int = 0,
+        throttle_rate: Optional[float] = None,
+        slow_rate: float = 0.0,
+        slow_latency: float = 0.0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.n_items = n_items
+        self.seed = seed
+        self.requests = 0
+        self.bytes_sent = 0
+        self.throttled = 0
+        self.throttle_rate = throttle_rate
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.slow = 0
+        # Token bucket allowing a second's worth of requests at once
+        self._allowance = throttle_rate or 0.0
+        self._allowance_updated = time.monotonic()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        # Generated pages, built on first request
+        self._news_pages: dict[str, str] = {}
+        self._article_pages: dict[int, str] = {}
+
+        pages_dir = pages_dir or FIXTURES_DIR
+        self._recorded_news = [
+            p.read_text() for p in sorted(pages_dir.glob("latest-news*.html"))
+        ]
+        self._recorded_articles = [
+            p.read_text() for p in sorted(pages_dir.glob("article*.html"))
+        ]
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _delay(self) -> float:
+        with self._lock:
+            offset = self._rng.uniform(-self.jitter, self.jitter)
+        return max(0.0, self.latency + offset)
+
+    def _slow_delay(self, path: str) -> float:
+        """Extra delay of a request that hit a slow edge"""
+        if not self.slow_rate or not _ARTICLE_PATH.match(path.split("?", 1)[0]):
+            return 0.0
+        with self._lock:
+            if self._rng.random() >= self.slow_rate:
+                return 0.0
+            self.slow += 1
+        return self.slow_latency
+
+    def _admit(self) -> bool:
+        """Whether a request fits in ``throttle_rate``"""
+        if not self.throttle_rate:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(
+                self.throttle_rate,
+                self._allowance + (now - self._allowance_updated) * self.throttle_rate,
+            )
+            self._allowance_updated = now
+            if self._allowance < 1:
+                self.throttled += 1
+                return False
+            self._allowance -= 1
+            return True
+
+    def _news_page(self, ticker: str) -> str:
+        if self._recorded_news:
+            return self._recorded_news[0]
+        if ticker not in self._news_pages:
+            self._news_pages[ticker] = news_stream_page(
+                ticker, n_items=self.n_items, seed=self.seed
+            )
+        return self._news_pages[ticker]
+
+    def _article_page(self, index: int) -> str:
+        if self._recorded_articles:
+            return self._recorded_articles[index % len(self._recorded_articles)]
+        if index not in self._article_pages:
+            self._article_pages[index] = article_page(index, seed=self.seed)
+        return self._article_pages[index]
+
+    def _page(self, path: str) -> Optional[str]:
+        path = path.split("?", 1)[0]
+        match = _NEWS_PATH.match(path)
+        if match:
+            return self._news_page(match.group(1).upper())
+        match = _ARTICLE_PATH.match(path)
+        if match:
+            return self._article_page(int(match.group(1)))
+        return None
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        time.sleep(self._delay() + self._slow_delay(handler.path))
+        if not self._admit():
+            body = b"Too many requests"
+            handler.send_response(429)
+            handler.send_header("Retry-After", "1")
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+            return
+        page = self._page(handler.path)
+        body = (page or "Not found").encode("utf-8")
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += len(body)
+        handler.send_response(200 if page is not None else 404)
+        handler.send_header("Content-Type", "text/html; charset=utf-8")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="stand-in-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="Seconds")
+    parser.add_argument("--items", type=int, default=50, help="Story items per page")
+    parser.add_argument("--pages-dir", type=Path, help="Directory of saved pages")
+    parser.add_argument(
+        "--throttle-rate", type=float, help="Answer 429 above this many requests/s"
+    )
+    parser.add_argument(
+        "--slow-rate", type=float, default=0.0, help="Fraction of slow article pages"
+    )
+    parser.add_argument(
+        "--slow-latency", type=float, default=0.0, help="Extra seconds of a slow page"
+    )
+    args = parser.parse_args()
+
+    server = StandInServer(
+        args.host,
+        args.port,
+        args.latency,
+        args.jitter,
+        args.items,
+        args.pages_dir,
+        throttle_rate=args.throttle_rate,
+        slow_rate=args.slow_rate,
+        slow_latency=args.slow_latency,
+    )
+    print(f"Serving Yahoo Finance stand-in on {server.url} (Ctrl+C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Cold-start time of the market_research CLI.
+
+Runs ``--help``, ``scrape --help`` and a small ``scrape`` against the local
+stand-in server in fresh interpreters, reports the median wall time of each
+and whether crewai was imported, and exits non-zero when a command is slower
+than ``--budget`` seconds or any of them loads crewai.
+
+    python -m benchmarks.startup_benchmark [--repeat 5] [--budget 1.0] [--json OUT]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.server import StandInServer
+
+COMMANDS = {
+    "help": ["--help"],
+    "scrape_help": ["scrape", "--help"],
+    "scrape": [
+        "scrape",
+        "--ticker",
+        "BENCH",
+        "--format",
+        "json",
+        "--max-articles",
+        "5",
+        "--fetch-strategy",
+        "http",
+    ],
+}
+
+
+def _imported_modules(importtime: str) -> set[str]:
+    """Top-level package names from ``python -X importtime`` output"""
+    modules = set()
+    for line in importtime.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip().split(".", 1)[0])
+    return modules
+
+
+def time_command(args: list[str], repeat: int, env: dict[str, str]) -> dict[str, Any]:
+    command = [sys.executable, "-m", "market_research.main", *args]
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(command, capture_output=True, text=True, env=env)
+        samples.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(args)} failed: {result.stderr[-500:]}")
+    # One more run only to see what gets imported, its timing is skewed
+    traced = subprocess.run(
+        [sys.executable, "-X", "importtime", *command[1:]],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    modules = _imported_modules(traced.stderr)
+    return {
+        "median_s": round(statistics.median(samples), 4),
+        "min_s": round(min(samples), 4),
+        "max_s": round(max(samples), 4),
+        "modules": len(modules),
+        "imports_crewai": "crewai" in modules,
+    }
+
+
+def time_interpreter(repeat: int, env: dict[str, str]) -> float:
+    """Median start-up time of a bare interpreter, the floor for every command"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], env=env, check=True)
+        samples.append(time.perf_counter() - start)
+    return round(statistics.median(samples), 4)
+
+
+def run(repeat: int = 5) -> dict[str, Any]:
+    env = dict(
+        os.environ,
+        MARKET_RESEARCH_CACHE_DIR=tempfile.mkdtemp(prefix="market-research-bench-"),
+    )
+    results: dict[str, Any] = {
+        "benchmark": "startup",
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+    }
+    with StandInServer(n_items=5) as server:
+        env["MARKET_RESEARCH_YAHOO_URL"] = server.url
+        results["interpreter_s"] = time_interpreter(repeat, env)
+        results["commands"] = {
+            name: time_command(args, repeat, env) for name, args in COMMANDS.items()
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget", type=float, default=1.0, help="Maximum median seconds per command"
+    )
+    parser.add_argument("--json", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    failures = []
+    print(f"{'command':<14}{'median s':>10}{'modules':>9}  crewai")
+    for name, row in results["commands"].items():
+        print(
+            f"{name:<14}{row['median_s']:>10.3f}{row['modules']:>9}  {row['imports_crewai']}"
+        )
+        if row["median_s"] > args.budget:
+            failures.append(f"{name} took {row['median_s']}s (budget {args.budget}s)")
+        if row["imports_crewai"]:
+            failures.append(f"{name} imported crewai")
+    print(f"bare interpreter: {results['interpreter_s']:.3f}s")
+    results["failures"] = failures
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Peak memory of reading a deep news stream at once or as it is scrolled.
+
+Builds news stream pages of ``--items`` story items and compares parsing the
+whole page after scrolling to its end, as ``page.content()`` would return it,
+with parsing only the items appended by each scroll of ``--batch`` items.
+
+    python -m benchmarks.stream_benchmark [--items 100,400,1600] [--batch 20]
+        [--json OUT]
+"""
+
+import argparse
+import json
+import re
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.fixtures import news_stream_page
+from market_research.tools.html_parsing import ParserBackend, get_parser_backend
+from market_research.tools.news_stream import parse_story_batch
+
+_STORY_ITEM = re.compile(r"<li class='stream-item.*?</li>")
+
+
+def _measure(read: Callable[[], int]) -> dict[str, Any]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = read()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"items": items, "peak_kb": peak // 1024, "ms": round(seconds * 1000, 1)}
+
+
+def read_whole_page(parser: ParserBackend, page: str, now: datetime) -> int:
+    return len(parser.parse_story_items(page, fetched_at=now))
+
+
+def read_scrolled(
+    parser: ParserBackend, items_html: list[str], batch: int, now: datetime
+) -> int:
+    count = 0
+    for start in range(0, len(items_html), batch):
+        count += len(parse_story_batch(parser, items_html[start : start + batch], now))
+    return count
+
+
+def run(sizes: list[int], batch: int = 20) -> dict[str, Any]:
+    parser = get_parser_backend("auto")
+    now = datetime.now(timezone.utc)
+    rows = []
+    for size in sizes:
+        page = news_stream_page("BENCH", n_items=size)
+        items_html = _STORY_ITEM.findall(page)
+        whole = _measure(lambda: read_whole_page(parser, page, now))
+        scrolled = _measure(lambda: read_scrolled(parser, items_html, batch, now))
+        rows.append({"items": size, "whole_page": whole, "scrolled": scrolled})
+    return {
+        "benchmark": "stream",
+        "params": {"items": sizes, "batch": batch, "parser": parser.name},
+        "results": rows,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--items", default="100,400,1600", help="Comma-separated stream lengths"
+    )
+    parser.add_argument("--batch", type=int, default=20, help="Items per scroll")
+    parser.add_argument("--json", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.items.split(",")]
+    results = run(sizes, args.batch)
+    print(f"{'items':>6}{'whole page KB':>15}{'ms':>8}{'scrolled KB':>13}{'ms':>8}")
+    for row in results["results"]:
+        whole, scrolled = row["whole_page"], row["scrolled"]
+        print(
+            f"{row['items']:>6}{whole['peak_kb']:>15}{whole['ms']:>8.1f}"
+            f"{scrolled['peak_kb']:>13}{scrolled['ms']:>8.1f}"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import json
+import logging
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from market_research.tools.article_cache import configure_article_cache
+from market_research.tools.fetch_budget import configure_fetch_budget
+from market_research.tools.rate_limit import DEFAULT_RATE, configure_rate_limit
+
+BATCH_MODES = ("thread", "process")
+
+
+def read_tickers(
+    tickers: Iterable[str] = (), ticker_file: Optional[Union[str, Path]] = None
+) -> list[str]:
+    """Collect unique, upper-cased tickers from comma lists and a watchlist file.
+
+    The file holds one or more tickers per line separated by commas or
+    whitespace; ``#`` starts a comment.
+    """
+    raw: list[str] = []
+    for value in tickers:
+        raw.extend(value.split(","))
+    if ticker_file:
+        for line in Path(ticker_file).read_text().splitlines():
+            raw.extend(line.split("#", 1)[0].replace(",", " ").split())
+
+    seen: dict[str, None] = {}
+    for ticker in raw:
+        ticker = ticker.strip().upper()
+        if ticker:
+            seen.setdefault(ticker, None)
+    return list(seen)
+
+
+def run_ticker(
+    ticker: str,
+    report_file: str,
+    cache: bool = True,
+    refresh: bool = False,
+    since_last: bool = False,
+    task_cache: bool = True,
+    rate_limit: Optional[float] = None,
+    fetch_budget: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """Run one crew and report its outcome instead of raising.
+
+    ``rate_limit`` and ``fetch_budget`` (the arguments of
+    configure_fetch_budget) configure the worker process; threads share the
+    settings configured by their caller.
+    """
+    # crewAI is only imported once a crew actually runs
+    from market_research.crew import MarketResearch
+    from market_research.task_cache import configure_task_cache
+
+    configure_article_cache(enabled=cache, refresh=refresh)
+    configure_task_cache(enabled=task_cache)
+    if rate_limit is not None:
+        configure_rate_limit(rate_limit)
+    if fetch_budget is not None:
+        configure_fetch_budget(**fetch_budget)
+    started = time.perf_counter()
+    result: dict[str, Any] = {"ticker": ticker, "output": report_file}
+    try:
+        MarketResearch(report_file=report_file, since_last=since_last).crew().kickoff(
+            inputs={"ticker": ticker}
+        )
+        result["status"] = "success"
+    except Exception as e:
+        logging.error(f"Market research for {ticker} failed: {e}")
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def run_batch(
+    tickers: list[str],
+    output_dir: Union[str, Path] = "reports",
+    workers: int = 4,
+    mode: str = "thread",
+    cache: bool = True,
+    refresh: bool = False,
+    since_last: bool = False,
+    task_cache: bool = True,
+    rate_limit: Optional[float] = DEFAULT_RATE,
+    fetch_budget: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """Run a crew per ticker concurrently and write a summary.json next to the reports.
+
+    A failing ticker is recorded in the summary and never aborts the batch.
+    ``rate_limit`` is the request rate per news host for the whole batch:
+    threads share one limiter, worker processes each get their share of it.
+    ``fetch_budget`` holds the arguments of configure_fetch_budget.
+    """
+    if mode not in BATCH_MODES:
+        raise ValueError(
+            f"Unknown batch mode '{mode}', expected one of: {', '.join(BATCH_MODES)}"
+        )
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    executor_cls: type[Executor] = (
+        ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
+    )
+    workers = max(1, workers)
+    worker_rate_limit = None
+    worker_fetch_budget = None
+    if mode == "thread":
+        configure_rate_limit(rate_limit)
+        if fetch_budget is not None:
+            configure_fetch_budget(**fetch_budget)
+    else:
+        worker_fetch_budget = fetch_budget
+        # 0 keeps limiting off in the workers, None would leave their default on
+        worker_rate_limit = rate_limit / workers if rate_limit else 0.0
+    started_at = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    results: dict[str, dict[str, Any]] = {}
+    with executor_cls(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                run_ticker,
+                ticker,
+                str(output_dir / f"{ticker}.md"),
+                cache,
+                refresh,
+                since_last,
+                task_cache,
+                worker_rate_limit,
+                worker_fetch_budget,
+            ): ticker
+            for ticker in tickers
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                results[ticker] = future.result()
+            except Exception as e:
+                # e.g. a crashed worker process
+                results[ticker] = {
+                    "ticker": ticker,
+                    "status": "failed",
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            logging.info(
+                f"Batch progress: {len(results)}/{len(tickers)} "
+                f"({ticker}: {results[ticker]['status']})"
+            )
+
+    ordered = [results[ticker] for ticker in tickers]
+    summary = {
+        "started_at": started_at.isoformat(),
+        "seconds": round(time.perf_counter() - started, 3),
+        "workers": workers,
+        "mode": mode,
+        "total": len(ordered),
+        "succeeded": sum(1 for r in ordered if r["status"] == "success"),
+        "failed": sum(1 for r in ordered if r["status"] != "success"),
+        "results": ordered,
+    }
+    (output_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+    return summary
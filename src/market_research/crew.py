@@ -1,9 +1,20 @@
-from typing import List
+import copy
+import functools
+from pathlib import Path
+from typing import Any, List, Optional
 
+import yaml
 from crewai import Agent, Crew, Process, Task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from crewai.project import CrewBase, agent, crew, task
+from crewai.project import CrewBase, after_kickoff, agent, before_kickoff, crew, task
+from crewai.tasks.task_output import TaskOutput
 
+from market_research.crew_profiling import record_task
+from market_research.task_cache import MemoizedTask, fingerprint
+from market_research.task_graph import log_task_timeline, schedule_tasks
+from market_research.tools.article_archive import get_article_archive
+from market_research.tools.article_search import ArticleSearchTool
+from market_research.tools.yahoo_news import YahooNewsScraper, YahooNewsScraperError
 from market_research.tools.yahoo_news_scraper import YahooNewsScraperTool
 
 # If you want to run a snippet of code before or after the crew starts,
@@ -18,6 +29,55 @@ class MarketResearch:
     agents: List[BaseAgent]
     tasks: List[Task]
 
+    def __init__(self, report_file: str = "report.md", since_last: bool = False):
+        # Where reporting_task writes its output, may contain {ticker}
+        self.report_file = report_file
+        # Only hand articles to the agents that were not seen in an earlier run
+        self.since_last = since_last
+        self.ticker: Optional[str] = None
+        self._archive_fingerprint: Optional[str] = None
+
+    @before_kickoff
+    def remember_inputs(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        self.ticker = inputs.get("ticker")
+        # Taken before the news task runs alongside the research task and
+        # archives what it scrapes
+        self._archive_fingerprint = None
+        if self.ticker:
+            archive = get_article_archive()
+            # Without an archive the search tool returns the same text every time
+            self._archive_fingerprint = (
+                archive.fingerprint(self.ticker) if archive is not None else ""
+            )
+        return inputs
+
+    @after_kickoff
+    def report_task_timeline(self, output: Any) -> Any:
+        log_task_timeline(self.tasks)
+        return output
+
+    def on_task_completed(self, output: TaskOutput):
+        for completed in self.tasks:
+            if completed.name == output.name:
+                record_task(completed)
+
+    def news_fingerprint(self) -> Optional[str]:
+        """Fingerprint of the news the scraper agent will read, None if it cannot be known"""
+        # An incremental scrape depends on what earlier runs saw, never reuse it
+        if self.since_last or not self.ticker:
+            return None
+        try:
+            # Only the listing, a full scrape would fetch detail pages and
+            # record them as seen
+            articles = YahooNewsScraper().list_articles(self.ticker, max_articles=5)
+        except YahooNewsScraperError:
+            return None
+        return fingerprint([(article.url, article.title) for article in articles])
+
+    def archive_fingerprint(self) -> Optional[str]:
+        """Fingerprint of the archived news the researcher can search, as of kickoff"""
+        return self._archive_fingerprint
+
     # Learn more about YAML configuration files here:
     # Agents: https://docs.crewai.com/concepts/agents#yaml-configuration-recommended
     # Tasks: https://docs.crewai.com/concepts/tasks#yaml-configuration-recommended
@@ -29,7 +89,7 @@ class MarketResearch:
         return Agent(
             config=self.agents_config["market_news_scraper"],  # type: ignore[index]
             verbose=True,
-            tools=[YahooNewsScraperTool()],
+            tools=[YahooNewsScraperTool(since_last=self.since_last)],
         )
 
     @agent
@@ -37,6 +97,7 @@ class MarketResearch:
         return Agent(
             config=self.agents_config["market_researcher"],  # type: ignore[index]
             verbose=True,
+            tools=[ArticleSearchTool()],
         )
 
     @agent
@@ -51,21 +112,23 @@ class MarketResearch:
     # https://docs.crewai.com/concepts/tasks#overview-of-a-task
     @task
     def market_news_gathering_task(self) -> Task:
-        return Task(
+        return MemoizedTask(
             config=self.tasks_config["market_news_gathering_task"],  # type: ignore[index]
+            fingerprint_source=self.news_fingerprint,
         )
 
     @task
     def market_research_task(self) -> Task:
-        return Task(
+        return MemoizedTask(
             config=self.tasks_config["market_research_task"],  # type: ignore[index]
+            fingerprint_source=self.archive_fingerprint,
         )
 
     @task
     def reporting_task(self) -> Task:
-        return Task(
+        return MemoizedTask(
             config=self.tasks_config["reporting_task"],  # type: ignore[index]
-            output_file="report.md",
+            output_file=self.report_file,
         )
 
     @crew
@@ -76,8 +139,30 @@ class MarketResearch:
 
         return Crew(
             agents=self.agents,  # Automatically created by the @agent decorator
-            tasks=self.tasks,  # Automatically created by the @task decorator
+            # Created by the @task decorator, ordered by depends_on in tasks.yaml
+            tasks=schedule_tasks(self.tasks, self.tasks_config),  # type: ignore[arg-type]
             process=Process.sequential,
             verbose=True,
+            task_callback=self.on_task_completed,
             # process=Process.hierarchical, # In case you wanna use that instead https://docs.crewai.com/how-to/Hierarchical/
         )
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_config(path: str, mtime: float) -> Any:
+    with open(path, "r", encoding="utf-8") as file:
+        return yaml.safe_load(file)
+
+
+def load_config(config_path: Path) -> Any:
+    """Agent or task YAML, parsed once per version of the file.
+
+    crewAI fills the loaded dicts in with agents, tools and LLMs, so every
+    crew gets its own copy. A service builds a crew per job and skips the
+    parsing that way.
+    """
+    return copy.deepcopy(_parse_config(str(config_path), config_path.stat().st_mtime))
+
+
+# CrewBase reads both YAML files whenever a MarketResearch is created
+MarketResearch.load_yaml = staticmethod(load_config)  # type: ignore[method-assign]
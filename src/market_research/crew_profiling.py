@@ -0,0 +1,83 @@
+import threading
+import time
+from typing import Any, Optional
+
+from crewai import Crew, Task
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.event_types import (
+    LLMCallCompletedEvent,
+    LLMCallFailedEvent,
+    LLMCallStartedEvent,
+)
+
+from market_research.utils.profiling import get_profiler
+
+_installed = False
+_install_lock = threading.Lock()
+# perf_counter() at the start of each LLM call, by (thread, task)
+_llm_calls: dict[tuple[int, Optional[str]], float] = {}
+
+
+def usage_attrs(usage: Any) -> dict[str, int]:
+    """Token counts of a crewAI UsageMetrics object as span attributes"""
+    if usage is None:
+        return {}
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+        "llm_requests": usage.successful_requests,
+    }
+
+
+def _finish_llm_call(event: Any, **attrs: Any):
+    started = _llm_calls.pop((threading.get_ident(), event.task_id), None)
+    profiler = get_profiler()
+    if profiler is None or started is None:
+        return
+    profiler.record(
+        "llm.call",
+        time.perf_counter() - started,
+        start=started,
+        task=event.task_name,
+        model=getattr(event, "model", None),
+        **attrs,
+    )
+
+
+def install_llm_listeners():
+    """Record every LLM call as an ``llm.call`` span while profiling is enabled"""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        _installed = True
+
+    @crewai_event_bus.on(LLMCallStartedEvent)
+    def _on_llm_call_started(source: Any, event: LLMCallStartedEvent):
+        if get_profiler() is not None:
+            _llm_calls[(threading.get_ident(), event.task_id)] = time.perf_counter()
+
+    @crewai_event_bus.on(LLMCallCompletedEvent)
+    def _on_llm_call_completed(source: Any, event: LLMCallCompletedEvent):
+        _finish_llm_call(event)
+
+    @crewai_event_bus.on(LLMCallFailedEvent)
+    def _on_llm_call_failed(source: Any, event: LLMCallFailedEvent):
+        _finish_llm_call(event, error=event.error)
+
+
+def record_task(task: Task):
+    """Record a finished crew task as a ``crew.task`` span with its agent's token usage"""
+    profiler = get_profiler()
+    if profiler is None or not task.start_time or not task.end_time:
+        return
+    duration = (task.end_time - task.start_time).total_seconds()
+    token_process = getattr(task.agent, "_token_process", None)
+    usage = token_process.get_summary() if token_process is not None else None
+    profiler.record("crew.task", duration, task=task.name, **usage_attrs(usage))
+
+
+def crew_usage_attrs(crew: Crew) -> dict[str, int]:
+    """Token usage of a finished crew, summed over its agents"""
+    return usage_attrs(crew.usage_metrics or crew.calculate_usage_metrics())
@@ -1,10 +1,30 @@
 #!/usr/bin/env python
+import json
 import logging
 import warnings
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
 
 import click
 
-from market_research.crew import MarketResearch
+from market_research.batch import BATCH_MODES, read_tickers, run_batch
+from market_research.tools.article_cache import configure_article_cache
+from market_research.tools.articles import OUTPUT_FORMATS, Article, format_articles
+from market_research.tools.compaction import DEFAULT_TOKEN_BUDGET
+from market_research.tools.fetch_budget import (
+    DEFAULT_ARTICLE_DEADLINE,
+    DEFAULT_RETRIES,
+    DEFAULT_RUN_DEADLINE,
+    configure_fetch_budget,
+)
+from market_research.tools.fetch_strategy import FETCH_STRATEGIES
+from market_research.tools.rate_limit import DEFAULT_RATE, configure_rate_limit
+from market_research.utils.profiling import disable_profiling, enable_profiling, span
+
+# crewAI and the crew are imported inside the commands that run a crew, so
+# --help and scrape start without loading them
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
@@ -14,6 +34,133 @@ logging.basicConfig(
 )
 
 
+profile_option = click.option(
+    "--profile",
+    "profile_path",
+    is_flag=False,
+    flag_value="profile.json",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="Write a JSON timing trace (profile.json if no path is given) and print a per-stage summary",
+)
+
+rate_limit_option = click.option(
+    "--rate-limit",
+    type=float,
+    default=DEFAULT_RATE,
+    help="Requests per second to each news host, slowed down further when throttled; 0 turns it off",
+    show_default=True,
+)
+
+
+def fetch_budget_options(command=None, *, run_deadline: bool = True):
+    """Deadline, retry and hedging options of the commands that scrape detail pages.
+
+    Use as ``@fetch_budget_options``, or ``@fetch_budget_options(run_deadline=False)``
+    for commands without a run deadline.
+    """
+    if command is None:
+        return lambda command: fetch_budget_options(command, run_deadline=run_deadline)
+    options = [
+        click.option(
+            "--article-deadline",
+            type=float,
+            default=DEFAULT_ARTICLE_DEADLINE,
+            help="Seconds an article page may take across retries before its summary is used; 0 for no limit",
+            show_default=True,
+        ),
+        click.option(
+            "--retries",
+            type=int,
+            default=DEFAULT_RETRIES,
+            help="Retries of an article page that failed to load, with jittered backoff",
+            show_default=True,
+        ),
+        click.option(
+            "--hedge/--no-hedge",
+            default=False,
+            help="Race a second request for article pages slower than the p95 of recent ones",
+            show_default=True,
+        ),
+    ]
+    if run_deadline:
+        options.insert(
+            1,
+            click.option(
+                "--run-deadline",
+                type=float,
+                default=DEFAULT_RUN_DEADLINE,
+                help="Seconds all article pages of a scrape may take together; 0 for no limit",
+                show_default=True,
+            ),
+        )
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+record_option = click.option(
+    "--record",
+    "record_path",
+    is_flag=False,
+    flag_value="cassette.json",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="Record tool calls to a cassette (cassette.json if no path is given) and replay the ones already on it",
+)
+
+replay_option = click.option(
+    "--replay",
+    "replay_path",
+    is_flag=False,
+    flag_value="cassette.json",
+    default=None,
+    type=click.Path(dir_okay=False, exists=True),
+    help="Replay tool calls from a cassette (cassette.json if no path is given) instead of scraping",
+)
+
+
+@contextmanager
+def cassette(record_path: Optional[str], replay_path: Optional[str]) -> Iterator[None]:
+    """Record or replay the crew's tool calls while the block runs"""
+    from market_research.tools.cassette import configure_cassette
+
+    if record_path and replay_path:
+        raise click.UsageError("--record and --replay cannot be used together")
+    if not (record_path or replay_path):
+        yield
+        return
+    active = configure_cassette(
+        record_path or replay_path, "record" if record_path else "replay"
+    )
+    try:
+        yield
+    finally:
+        active.log_summary()
+        configure_cassette(None)
+
+
+@contextmanager
+def profiling(path: Optional[str], llm_calls: bool = True) -> Iterator[None]:
+    """Collect spans while the block runs and write them to ``path``"""
+    if not path:
+        yield
+        return
+    enable_profiling()
+    if llm_calls:
+        from market_research.crew_profiling import install_llm_listeners
+
+        install_llm_listeners()
+    try:
+        yield
+    finally:
+        profiler = disable_profiling()
+        if profiler is not None:
+            profiler.write(path)
+            click.echo(profiler.format_table())
+            click.echo(f"📊 Profile written to {path}")
+
+
 @click.group()
 @click.version_option()
 def cli():
@@ -29,19 +176,546 @@ def cli():
     help="Stock ticker symbol to analyze (e.g., AAPL, TSLA)",
     show_default=True,
 )
-def run(ticker: str):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Do not read or write the local article cache",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-scrape cached articles and update the article cache",
+)
+@click.option(
+    "--since-last",
+    is_flag=True,
+    help="Only scrape news published since the last run for the ticker",
+)
+@click.option(
+    "--no-task-cache",
+    is_flag=True,
+    help="Always run every task through the LLM instead of reusing unchanged outputs",
+)
+@rate_limit_option
+@fetch_budget_options
+@profile_option
+def run(
+    ticker: str,
+    no_cache: bool,
+    refresh: bool,
+    since_last: bool,
+    no_task_cache: bool,
+    rate_limit: float,
+    article_deadline: float,
+    run_deadline: float,
+    retries: int,
+    hedge: bool,
+    profile_path: Optional[str],
+):
     """Run the market research crew with the specified ticker."""
+    from market_research.crew import MarketResearch
+    from market_research.crew_profiling import crew_usage_attrs
+    from market_research.task_cache import configure_task_cache
+
     inputs = {"ticker": ticker.upper()}
+    configure_article_cache(enabled=not no_cache, refresh=refresh)
+    configure_task_cache(enabled=not no_task_cache)
+    configure_rate_limit(rate_limit)
+    configure_fetch_budget(article_deadline, run_deadline, retries, hedge)
 
     try:
         click.echo(f"🚀 Starting market research for ticker: {ticker.upper()}")
-        MarketResearch().crew().kickoff(inputs=inputs)
+        with profiling(profile_path):
+            crew = MarketResearch(since_last=since_last).crew()
+            with span("crew.kickoff", ticker=ticker.upper()) as s:
+                crew.kickoff(inputs=inputs)
+                s.set(**crew_usage_attrs(crew))
         click.echo("✅ Market research completed successfully!")
     except Exception as e:
         click.echo(f"❌ An error occurred while running the crew: {e}", err=True)
         raise click.ClickException(str(e))
 
 
+@cli.command()
+@click.option(
+    "--ticker",
+    "-t",
+    required=True,
+    help="Stock ticker symbol to scrape news for (e.g., AAPL, TSLA)",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="markdown",
+    help="Output format of the articles",
+    show_default=True,
+)
+@click.option(
+    "--max-articles",
+    "-n",
+    type=int,
+    default=5,
+    help="Maximum number of articles to scrape",
+    show_default=True,
+)
+@click.option(
+    "--max-content-length",
+    type=int,
+    default=1000,
+    help="Maximum length of the content of each article",
+    show_default=True,
+)
+@click.option(
+    "--token-budget",
+    type=int,
+    default=DEFAULT_TOKEN_BUDGET,
+    help="Approximate tokens of article content across all articles, 0 for no total limit",
+    show_default=True,
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    default=5,
+    help="Maximum number of article pages fetched concurrently",
+    show_default=True,
+)
+@click.option(
+    "--fetch-strategy",
+    type=click.Choice(FETCH_STRATEGIES),
+    default="auto",
+    help="Fetch pages over plain HTTP first ('auto'), or only over 'http' or 'browser'",
+    show_default=True,
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    help="Write the articles to a file instead of stdout",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Do not read or write the local article cache",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-scrape cached articles and update the article cache",
+)
+@click.option(
+    "--since-last",
+    is_flag=True,
+    help="Only scrape news published since the last run for the ticker",
+)
+@rate_limit_option
+@fetch_budget_options
+@profile_option
+def scrape(
+    ticker: str,
+    output_format: str,
+    max_articles: int,
+    max_content_length: int,
+    token_budget: int,
+    concurrency: int,
+    fetch_strategy: str,
+    output: Optional[str],
+    no_cache: bool,
+    refresh: bool,
+    since_last: bool,
+    rate_limit: float,
+    article_deadline: float,
+    run_deadline: float,
+    retries: int,
+    hedge: bool,
+    profile_path: Optional[str],
+):
+    """Scrape Yahoo Finance news for a ticker without running the crew."""
+    from market_research.tools.yahoo_news import (
+        YahooNewsScraper,
+        YahooNewsScraperError,
+    )
+
+    ticker = ticker.upper()
+    configure_article_cache(enabled=not no_cache, refresh=refresh)
+    configure_rate_limit(rate_limit)
+    configure_fetch_budget(article_deadline, run_deadline, retries, hedge)
+    try:
+        with profiling(profile_path, llm_calls=False):
+            articles = YahooNewsScraper().scrape_articles(
+                ticker,
+                max_articles=max_articles,
+                max_content_length=max_content_length,
+                max_concurrency=concurrency,
+                fetch_strategy=fetch_strategy,
+                since_last=since_last,
+                token_budget=token_budget or None,
+            )
+    except YahooNewsScraperError as e:
+        raise click.ClickException(str(e))
+
+    result = format_articles(ticker, articles, output_format)
+    if not articles and since_last:
+        # Tell an empty incremental scrape apart from a failed one
+        notice = f"No new articles for {ticker} since the last scrape"
+        if output_format == "markdown":
+            result = notice
+        else:
+            click.echo(notice, err=True)
+    if output:
+        Path(output).write_text(result)
+        click.echo(f"✅ {len(articles)} articles written to {output}", err=True)
+    else:
+        click.echo(result)
+
+
+@cli.command()
+@click.option(
+    "--ticker",
+    "-t",
+    required=True,
+    help="Stock ticker symbol to backfill news for (e.g., AAPL, TSLA)",
+)
+@click.option(
+    "--max-articles",
+    "-n",
+    type=int,
+    default=100,
+    help="Maximum number of articles to stream, 0 for the whole news stream",
+    show_default=True,
+)
+@click.option(
+    "--since",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="Stop at news published before this date (YYYY-MM-DD)",
+)
+@click.option(
+    "--since-last",
+    is_flag=True,
+    help="Stop at the first article seen in an earlier scrape of the ticker",
+)
+@click.option(
+    "--max-scrolls",
+    type=int,
+    help="Stop after scrolling the news stream this many times",
+)
+@click.option(
+    "--max-content-length",
+    type=int,
+    default=0,
+    help="Maximum length of the content of each article, 0 for no limit",
+    show_default=True,
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    default=5,
+    help="Maximum number of article pages fetched concurrently",
+    show_default=True,
+)
+@click.option(
+    "--fetch-strategy",
+    type=click.Choice(FETCH_STRATEGIES),
+    default="auto",
+    help="How article pages are fetched; the news stream itself is only scrolled in the browser",
+    show_default=True,
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    help="Append the articles as JSON Lines to a file instead of stdout",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Do not read or write the local article cache",
+)
+@rate_limit_option
+# A backfill runs as long as the stream goes, only its pages have deadlines
+@fetch_budget_options(run_deadline=False)
+@profile_option
+def backfill(
+    ticker: str,
+    max_articles: int,
+    since: Optional[datetime],
+    since_last: bool,
+    max_scrolls: Optional[int],
+    max_content_length: int,
+    concurrency: int,
+    fetch_strategy: str,
+    output: Optional[str],
+    no_cache: bool,
+    rate_limit: float,
+    article_deadline: float,
+    retries: int,
+    hedge: bool,
+    profile_path: Optional[str],
+):
+    """Stream a ticker's news far back as JSON Lines and add it to the archive."""
+    from market_research.tools.yahoo_news import (
+        YahooNewsScraper,
+        YahooNewsScraperError,
+    )
+
+    ticker = ticker.upper()
+    configure_article_cache(enabled=not no_cache)
+    configure_rate_limit(rate_limit)
+    configure_fetch_budget(article_deadline, None, retries, hedge)
+    with ExitStack() as stack:
+        out = stack.enter_context(open(output, "a")) if output else None
+
+        def _write(article: Article):
+            line = json.dumps(article.to_dict(), ensure_ascii=False)
+            if out is not None:
+                out.write(line + "\n")
+                out.flush()
+            else:
+                click.echo(line)
+
+        try:
+            with profiling(profile_path, llm_calls=False):
+                count = YahooNewsScraper().backfill(
+                    ticker,
+                    _write,
+                    max_articles=max_articles or None,
+                    since=since,
+                    since_last=since_last,
+                    max_content_length=max_content_length or None,
+                    max_concurrency=concurrency,
+                    fetch_strategy=fetch_strategy,
+                    max_scrolls=max_scrolls,
+                )
+        except YahooNewsScraperError as e:
+            raise click.ClickException(str(e))
+    click.echo(f"✅ {count} articles streamed for {ticker}", err=True)
+
+
+@cli.command()
+@click.argument("query")
+@click.option("--ticker", "-t", help="Only search news scraped for this ticker")
+@click.option(
+    "--since", help="Only search news published on or after this date (YYYY-MM-DD)"
+)
+@click.option(
+    "--until", help="Only search news published on or before this date (YYYY-MM-DD)"
+)
+@click.option(
+    "--top-k",
+    "-k",
+    type=int,
+    default=5,
+    help="Number of passages to return",
+    show_default=True,
+)
+def search(
+    query: str,
+    ticker: Optional[str],
+    since: Optional[str],
+    until: Optional[str],
+    top_k: int,
+):
+    """Search the archive of scraped articles for the most relevant passages."""
+    from market_research.tools.article_archive import format_hits, get_article_archive
+
+    archive = get_article_archive()
+    if archive is None:
+        raise click.ClickException("The article archive is unavailable")
+    click.echo(format_hits(query, archive.search(query, ticker, since, until, top_k)))
+
+
+@cli.command("run-batch")
+@click.option(
+    "--tickers",
+    "-t",
+    multiple=True,
+    help="Comma-separated ticker symbols, can be repeated (e.g., -t AAPL,TSLA -t MSFT)",
+)
+@click.option(
+    "--file",
+    "-f",
+    "ticker_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Watchlist file with ticker symbols, one per line",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=4,
+    help="Number of crews to run concurrently",
+    show_default=True,
+)
+@click.option(
+    "--mode",
+    type=click.Choice(BATCH_MODES),
+    default="thread",
+    help="Run crews in a thread pool or a process pool",
+    show_default=True,
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    default="reports",
+    help="Directory for the per-ticker reports and summary.json",
+    show_default=True,
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Do not read or write the local article cache",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-scrape cached articles and update the article cache",
+)
+@click.option(
+    "--since-last",
+    is_flag=True,
+    help="Only scrape news published since the last run for the ticker",
+)
+@click.option(
+    "--no-task-cache",
+    is_flag=True,
+    help="Always run every task through the LLM instead of reusing unchanged outputs",
+)
+@rate_limit_option
+@fetch_budget_options
+def run_batch_command(
+    tickers: tuple[str, ...],
+    ticker_file: str,
+    workers: int,
+    mode: str,
+    output_dir: str,
+    no_cache: bool,
+    refresh: bool,
+    since_last: bool,
+    no_task_cache: bool,
+    rate_limit: float,
+    article_deadline: float,
+    run_deadline: float,
+    retries: int,
+    hedge: bool,
+):
+    """Run the market research crew for many tickers concurrently."""
+    symbols = read_tickers(tickers, ticker_file)
+    if not symbols:
+        raise click.UsageError("Provide tickers with --tickers or --file")
+
+    click.echo(
+        f"🚀 Starting market research for {len(symbols)} tickers with {workers} {mode} workers"
+    )
+    summary = run_batch(
+        symbols,
+        output_dir=output_dir,
+        workers=workers,
+        mode=mode,
+        cache=not no_cache,
+        refresh=refresh,
+        since_last=since_last,
+        task_cache=not no_task_cache,
+        rate_limit=rate_limit,
+        fetch_budget={
+            "article_deadline": article_deadline,
+            "run_deadline": run_deadline,
+            "retries": retries,
+            "hedge": hedge,
+        },
+    )
+    for result in summary["results"]:
+        if result["status"] == "success":
+            click.echo(
+                f"✅ {result['ticker']}: {result['output']} ({result['seconds']}s)"
+            )
+        else:
+            click.echo(f"❌ {result['ticker']}: {result['error']}", err=True)
+    click.echo(
+        f"Finished {summary['succeeded']}/{summary['total']} tickers in {summary['seconds']}s, "
+        f"summary written to {Path(output_dir) / 'summary.json'}"
+    )
+
+
+@cli.command()
+@click.option(
+    "--host", default="127.0.0.1", help="Address to listen on", show_default=True
+)
+@click.option(
+    "--port", "-p", type=int, default=8000, help="Port to listen on", show_default=True
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Listen on a Unix socket instead of a TCP port",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=2,
+    help="Number of jobs run concurrently",
+    show_default=True,
+)
+@click.option(
+    "--max-queue",
+    type=int,
+    default=16,
+    help="Jobs that may wait for a worker before new ones are rejected with 429",
+    show_default=True,
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    default="reports",
+    help="Directory for the reports of research jobs",
+    show_default=True,
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Do not read or write the local article cache",
+)
+@click.option(
+    "--no-task-cache",
+    is_flag=True,
+    help="Always run every task through the LLM instead of reusing unchanged outputs",
+)
+@rate_limit_option
+@fetch_budget_options
+def serve(
+    host: str,
+    port: int,
+    socket_path: Optional[str],
+    workers: int,
+    max_queue: int,
+    output_dir: str,
+    no_cache: bool,
+    no_task_cache: bool,
+    rate_limit: float,
+    article_deadline: float,
+    run_deadline: float,
+    retries: int,
+    hedge: bool,
+):
+    """Run a long-lived service that takes research and scrape jobs over HTTP."""
+    from market_research.service import ResearchService
+    from market_research.service import serve as serve_forever
+
+    configure_rate_limit(rate_limit)
+    configure_fetch_budget(article_deadline, run_deadline, retries, hedge)
+    service = ResearchService(
+        workers=workers,
+        max_queue=max_queue,
+        output_dir=output_dir,
+        cache=not no_cache,
+        task_cache=not no_task_cache,
+    )
+    click.echo(f"🚀 Starting market research service with {workers} workers")
+    serve_forever(service, host, port, socket_path)
+
+
 @cli.command()
 @click.option(
     "--ticker",
@@ -63,17 +737,31 @@ def run(ticker: str):
     required=True,
     help="Filename to save training results",
 )
-def train(ticker: str, iterations: int, filename: str):
+@record_option
+@replay_option
+def train(
+    ticker: str,
+    iterations: int,
+    filename: str,
+    record_path: Optional[str],
+    replay_path: Optional[str],
+):
     """Train the crew for a specified number of iterations."""
+    from market_research.crew import MarketResearch
+    from market_research.task_cache import configure_task_cache
+
     inputs = {"ticker": ticker.upper()}
+    # Every iteration has to reach the LLM
+    configure_task_cache(enabled=False)
 
     try:
         click.echo(
             f"🎯 Training crew for {iterations} iterations with ticker: {ticker.upper()}"
         )
-        MarketResearch().crew().train(
-            n_iterations=iterations, filename=filename, inputs=inputs
-        )
+        with cassette(record_path, replay_path):
+            MarketResearch().crew().train(
+                n_iterations=iterations, filename=filename, inputs=inputs
+            )
         click.echo(f"✅ Training completed! Results saved to: {filename}")
     except Exception as e:
         click.echo(f"❌ An error occurred while training the crew: {e}", err=True)
@@ -82,11 +770,18 @@ def train(ticker: str, iterations: int, filename: str):
 
 @cli.command()
 @click.argument("task_id", required=True)
-def replay(task_id: str):
+@record_option
+@replay_option
+def replay(task_id: str, record_path: Optional[str], replay_path: Optional[str]):
     """Replay the crew execution from a specific task ID."""
+    from market_research.crew import MarketResearch
+    from market_research.task_cache import configure_task_cache
+
+    configure_task_cache(enabled=False)
     try:
         click.echo(f"🔄 Replaying task: {task_id}")
-        MarketResearch().crew().replay(task_id=task_id)
+        with cassette(record_path, replay_path):
+            MarketResearch().crew().replay(task_id=task_id)
         click.echo("✅ Replay completed successfully!")
     except Exception as e:
         click.echo(f"❌ An error occurred while replaying the crew: {e}", err=True)
@@ -114,17 +809,34 @@ def replay(task_id: str):
     required=True,
     help="LLM model to use for evaluation",
 )
-def test(ticker: str, iterations: int, eval_llm: str):
+@record_option
+@replay_option
+@profile_option
+def test(
+    ticker: str,
+    iterations: int,
+    eval_llm: str,
+    record_path: Optional[str],
+    replay_path: Optional[str],
+    profile_path: Optional[str],
+):
     """Test the crew execution and return the results."""
+    from market_research.crew import MarketResearch
+    from market_research.crew_profiling import crew_usage_attrs
+    from market_research.task_cache import configure_task_cache
+
     inputs = {"ticker": ticker.upper()}
+    configure_task_cache(enabled=False)
 
     try:
         click.echo(
             f"🧪 Testing crew for {iterations} iterations with ticker: {ticker.upper()}"
         )
-        MarketResearch().crew().test(
-            n_iterations=iterations, eval_llm=eval_llm, inputs=inputs
-        )
+        with cassette(record_path, replay_path), profiling(profile_path):
+            crew = MarketResearch().crew()
+            with span("crew.test", iterations=iterations) as s:
+                crew.test(n_iterations=iterations, eval_llm=eval_llm, inputs=inputs)
+                s.set(**crew_usage_attrs(crew))
         click.echo("✅ Testing completed successfully!")
     except Exception as e:
         click.echo(f"❌ An error occurred while testing the crew: {e}", err=True)
@@ -0,0 +1,408 @@
+import json
+import logging
+import queue
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Any, Optional, Union
+
+from market_research.batch import run_ticker
+from market_research.tools.article_cache import configure_article_cache
+from market_research.tools.compaction import DEFAULT_TOKEN_BUDGET
+from market_research.tools.fetch_strategy import FETCH_STRATEGIES
+
+JOB_KINDS = ("research", "scrape")
+# Finished jobs kept for the status and result endpoints, oldest dropped first
+MAX_FINISHED_JOBS = 1000
+
+_JOB_PATH = re.compile(r"^/jobs/([0-9a-f]{32})(/result)?$")
+
+
+@dataclass
+class Job:
+    """A queued research or scrape request and, once finished, its outcome"""
+
+    kind: str
+    ticker: str
+    options: dict[str, Any] = field(default_factory=dict)
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    result: Any = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed", "cancelled")
+
+    def to_dict(self, result: bool = False) -> dict[str, Any]:
+        data = {
+            "id": self.id,
+            "kind": self.kind,
+            "ticker": self.ticker,
+            "options": self.options,
+            "status": self.status,
+            "created_at": _isoformat(self.created_at),
+            "started_at": _isoformat(self.started_at),
+            "finished_at": _isoformat(self.finished_at),
+            "queued_seconds": _seconds(self.created_at, self.started_at),
+            "run_seconds": _seconds(self.started_at, self.finished_at),
+            "error": self.error,
+        }
+        if result:
+            data["result"] = self.result
+        return data
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def _seconds(start: Optional[float], end: Optional[float]) -> Optional[float]:
+    if start is None or end is None:
+        return None
+    return round(end - start, 3)
+
+
+def _check_options(options: dict[str, Any]):
+    """Raise ValueError for job options a worker could not run with"""
+    if not isinstance(options.get("since_last", False), bool):
+        raise ValueError("since_last must be true or false")
+    max_articles = options.get("max_articles", 1)
+    if isinstance(max_articles, bool) or not isinstance(max_articles, int):
+        raise ValueError("max_articles must be a positive integer")
+    if max_articles < 1:
+        raise ValueError("max_articles must be a positive integer")
+    fetch_strategy = options.get("fetch_strategy", "auto")
+    if fetch_strategy not in FETCH_STRATEGIES:
+        raise ValueError(
+            f"Unknown fetch strategy '{fetch_strategy}', "
+            f"expected one of: {', '.join(FETCH_STRATEGIES)}"
+        )
+    token_budget = options.get("token_budget")
+    if token_budget is not None and (
+        isinstance(token_budget, bool)
+        or not isinstance(token_budget, int)
+        or token_budget < 0
+    ):
+        raise ValueError("token_budget must be a non-negative integer or null")
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a job is submitted while the queue is at its limit"""
+
+
+class ServiceStoppedError(RuntimeError):
+    """Raised when a job is submitted to a service that is shutting down"""
+
+
+class ResearchService:
+    """Runs research and scrape jobs on a fixed pool of worker threads.
+
+    Jobs wait in a bounded queue; submitting to a full queue raises
+    QueueFullError instead of piling up work. Everything that is expensive to
+    set up (crewAI, the parsed agent and task configs, the browser and HTTP
+    pools) is loaded once by ``start`` and reused by every job; each job
+    still builds its own crew from the cached configs.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_queue: int = 16,
+        output_dir: Union[str, Path] = "reports",
+        cache: bool = True,
+        task_cache: bool = True,
+    ):
+        self.workers = max(1, workers)
+        self.max_queue = max_queue
+        self.output_dir = Path(output_dir)
+        self.cache = cache
+        self.task_cache = task_cache
+        self.jobs: OrderedDict[str, Job] = OrderedDict()
+        self._queue: queue.Queue[Optional[Job]] = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._running = 0
+        self._stopping = threading.Event()
+
+    def warm_up(self):
+        """Import crewAI, parse the agent and task configs and start the browser pool"""
+        started = time.perf_counter()
+        from market_research.crew import MarketResearch
+        from market_research.tools.browser_pool import get_browser_pool
+        from market_research.tools.fetch_strategy import get_http_fetcher
+        from market_research.utils.funcs import run_sync
+
+        async def _start_browser_pool() -> bool:
+            # The pool belongs to the loop it is created on
+            return await get_browser_pool().start()
+
+        MarketResearch().crew()
+        get_http_fetcher()
+        if not run_sync(_start_browser_pool()):
+            logging.warning(
+                "Browser pool could not start, jobs that need a browser will fail"
+            )
+        logging.info(f"Service warmed up in {time.perf_counter() - started:.1f}s")
+
+    def start(self, warm_up: bool = True):
+        self._stopping.clear()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        configure_article_cache(enabled=self.cache)
+        if warm_up:
+            self.warm_up()
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"research-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """Stop taking jobs, cancel the queued ones and let the workers finish their current job"""
+        with self._lock:
+            self._stopping.set()
+        cancelled = 0
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                self._cancel(job)
+                cancelled += 1
+        if cancelled:
+            logging.info(f"Cancelled {cancelled} queued jobs")
+        # Workers take these once their current job is done
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+    def submit(self, kind: str, ticker: str, **options: Any) -> Job:
+        if kind not in JOB_KINDS:
+            raise ValueError(
+                f"Unknown job kind '{kind}', expected one of: {', '.join(JOB_KINDS)}"
+            )
+        ticker = str(ticker).upper().strip()
+        if not ticker:
+            raise ValueError("No ticker symbol provided")
+        _check_options(options)
+        job = Job(kind=kind, ticker=ticker, options=options)
+        with self._lock:
+            if self._stopping.is_set():
+                raise ServiceStoppedError("Service is shutting down")
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                raise QueueFullError(
+                    f"Job queue is full ({self.max_queue} jobs waiting)"
+                ) from None
+            self.jobs[job.id] = job
+            self._evict()
+        logging.info(f"Queued {kind} job {job.id} for {ticker}")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "running": self._running,
+                "queued": self._queue.qsize(),
+                "max_queue": self.max_queue,
+                "jobs": len(self.jobs),
+            }
+
+    def _evict(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.done]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job_id]
+
+    def _cancel(self, job: Job):
+        job.error = "Service stopped before the job started"
+        job.finished_at = time.time()
+        job.status = "cancelled"
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            if self._stopping.is_set():
+                self._cancel(job)
+                continue
+            with self._lock:
+                self._running += 1
+            job.status = "running"
+            job.started_at = time.time()
+            status = "succeeded"
+            try:
+                job.result = self._run(job)
+            except Exception as e:
+                logging.error(f"Job {job.id} for {job.ticker} failed: {e}")
+                job.error = f"{type(e).__name__}: {e}"
+                status = "failed"
+            job.finished_at = time.time()
+            # Set last, a finished status means the rest of the job is final
+            job.status = status
+            with self._lock:
+                self._running -= 1
+            logging.info(
+                f"Job {job.id} for {job.ticker} {job.status} in "
+                f"{job.finished_at - job.started_at:.1f}s"
+            )
+
+    def _run(self, job: Job) -> Any:
+        since_last = job.options.get("since_last", False)
+        if job.kind == "scrape":
+            from market_research.tools.yahoo_news import YahooNewsScraper
+
+            articles = YahooNewsScraper().scrape_articles(
+                job.ticker,
+                max_articles=job.options.get("max_articles", 5),
+                fetch_strategy=job.options.get("fetch_strategy", "auto"),
+                since_last=since_last,
+                # 0 or null for no total limit
+                token_budget=job.options.get("token_budget", DEFAULT_TOKEN_BUDGET)
+                or None,
+            )
+            return {"articles": [article.to_dict() for article in articles]}
+
+        report_file = self.output_dir / f"{job.ticker}-{job.id}.md"
+        outcome = run_ticker(
+            job.ticker,
+            str(report_file),
+            cache=self.cache,
+            since_last=since_last,
+            task_cache=self.task_cache,
+        )
+        if outcome["status"] != "success":
+            raise RuntimeError(outcome["error"])
+        return {"output": str(report_file), "report": report_file.read_text()}
+
+
+class _ServiceHandler(BaseHTTPRequestHandler):
+    """JSON API of a ResearchService, see ``serve``"""
+
+    service: ResearchService
+
+    def _reply(self, status: int, body: Any, headers: Optional[dict] = None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/health":
+            return self._reply(200, {"status": "ok", **self.service.stats()})
+        match = _JOB_PATH.match(path)
+        job = self.service.get(match.group(1)) if match else None
+        if job is None:
+            return self._reply(404, {"error": "Job not found"})
+        if match.group(2) and not job.done:
+            # Not finished yet, poll again
+            return self._reply(202, job.to_dict())
+        return self._reply(200, job.to_dict(result=bool(match.group(2))))
+
+    def do_POST(self):
+        if self.path.split("?", 1)[0] != "/jobs":
+            return self._reply(404, {"error": "Not found"})
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("Request body must be a JSON object")
+            options = {
+                key: request[key]
+                for key in (
+                    "since_last",
+                    "max_articles",
+                    "fetch_strategy",
+                    "token_budget",
+                )
+                if key in request
+            }
+            job = self.service.submit(
+                request.get("kind", "research"), request.get("ticker", ""), **options
+            )
+        except QueueFullError as e:
+            return self._reply(429, {"error": str(e)}, {"Retry-After": "5"})
+        except ServiceStoppedError as e:
+            return self._reply(503, {"error": str(e)})
+        except (ValueError, AttributeError) as e:
+            return self._reply(400, {"error": str(e)})
+        self._reply(202, job.to_dict(), {"Location": f"/jobs/{job.id}"})
+
+    def log_message(self, format, *args):
+        # Unix socket clients have no address
+        logging.debug(f"{self.command} {self.path}")
+
+
+class _ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(
+    service: ResearchService,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: Optional[str] = None,
+) -> Union[ThreadingHTTPServer, _ThreadingUnixHTTPServer]:
+    """HTTP server for the service on a TCP port, or on a Unix socket if one is given"""
+    handler = type("Handler", (_ServiceHandler,), {"service": service})
+    if socket_path:
+        Path(socket_path).unlink(missing_ok=True)
+        return _ThreadingUnixHTTPServer(socket_path, handler)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def serve(
+    service: ResearchService,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: Optional[str] = None,
+):
+    """Start the service and answer API requests until interrupted.
+
+    POST /jobs {"ticker": "AAPL", "kind": "research"|"scrape"} queues a job and
+    returns 202 with its id, or 429 when the queue is full.
+    GET /jobs/<id> returns its status, GET /jobs/<id>/result its status and
+    result (202 while it is not finished) and GET /health the queue state.
+    """
+    service.start()
+    server = make_server(service, host, port, socket_path)
+    address = socket_path or f"http://{host}:{server.server_address[1]}"
+    logging.info(f"Market research service listening on {address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path:
+            Path(socket_path).unlink(missing_ok=True)
+        service.stop()
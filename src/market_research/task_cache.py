@@ -0,0 +1,261 @@
+import datetime
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from crewai import Task
+from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.event_types import TaskCompletedEvent, TaskStartedEvent
+from crewai.tasks.task_output import TaskOutput
+from pydantic import Field
+
+from market_research.utils.funcs import get_cache_dir
+
+DEFAULT_TTL = 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS task_outputs (
+    key TEXT PRIMARY KEY,
+    task_name TEXT NOT NULL,
+    output TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS task_outputs_last_access ON task_outputs (last_access);
+"""
+
+
+def fingerprint(value: Any) -> str:
+    """Stable sha256 of a JSON-serializable value"""
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def agent_fingerprint(agent: BaseAgent) -> str:
+    """Hash of the agent settings that shape its answers"""
+    llm = getattr(agent, "llm", None)
+    return fingerprint(
+        {
+            "role": agent.role,
+            "goal": agent.goal,
+            "backstory": agent.backstory,
+            "llm": getattr(llm, "model", None) or str(llm),
+            "temperature": getattr(llm, "temperature", None),
+            "tools": sorted(tool.name for tool in agent.tools or []),
+            "allow_delegation": agent.allow_delegation,
+        }
+    )
+
+
+class TaskCache:
+    """SQLite store of task outputs keyed by everything the output depends on.
+
+    Entries expire after their TTL and the least recently used ones are
+    evicted once the cache holds more than ``max_entries`` outputs.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored output for a key, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT output, expires_at FROM task_outputs WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE task_outputs SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+        self.hits += 1
+        return row[0]
+
+    def put(self, key: str, task_name: str, output: str, ttl: Optional[float] = None):
+        """Store a task output, evicting old entries if the cache is full"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO task_outputs "
+                "(key, task_name, output, created_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    task_name,
+                    output,
+                    now,
+                    now + (self.ttl if ttl is None else ttl),
+                    now,
+                ),
+            )
+            self._conn.execute("DELETE FROM task_outputs WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM task_outputs WHERE key IN ("
+                "SELECT key FROM task_outputs ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM task_outputs").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM task_outputs")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class MemoizedTask(Task):
+    """Task that reuses its stored output when none of its inputs changed.
+
+    The key covers the task name, its rendered description and expected
+    output, the agent configuration and the upstream context. A task without
+    upstream context whose agent has tools depends on the outside world, so
+    it is only memoized when ``fingerprint_source`` describes that world
+    (e.g. the scraped news).
+    """
+
+    fingerprint_source: Optional[Callable[[], Optional[str]]] = Field(
+        default=None,
+        description="Returns a fingerprint of the external data the task reads, or None to skip the cache",
+    )
+
+    def _cache_key(self, agent: BaseAgent, context: Optional[str]) -> Optional[str]:
+        if context:
+            upstream = fingerprint(context)
+        elif self.fingerprint_source is not None:
+            upstream = self.fingerprint_source()
+        else:
+            # Without tools the output only depends on the rendered inputs
+            upstream = None if agent.tools else ""
+        if upstream is None:
+            return None
+        return fingerprint(
+            {
+                "task": self.name,
+                "description": self.description,
+                "expected_output": self.expected_output,
+                "agent": agent_fingerprint(agent),
+                "upstream": upstream,
+            }
+        )
+
+    def _execute_core(
+        self,
+        agent: Optional[BaseAgent],
+        context: Optional[str],
+        tools: Optional[list[Any]],
+    ) -> TaskOutput:
+        cache = get_task_cache()
+        agent = agent or self.agent
+        key = (
+            self._cache_key(agent, context)
+            if cache is not None and agent is not None
+            else None
+        )
+        if cache is None or key is None:
+            return super()._execute_core(agent, context, tools)
+
+        cached = cache.get(key)
+        if cached is None:
+            output = super()._execute_core(agent, context, tools)
+            cache.put(key, self.name or "", output.raw)
+            return output
+
+        logging.info(f"Reusing cached output of task '{self.name}'")
+        return self._reuse_output(agent, context, cached)
+
+    def _reuse_output(
+        self, agent: BaseAgent, context: Optional[str], raw: str
+    ) -> TaskOutput:
+        """Complete the task with a stored output, the same way a fresh run would"""
+        self.agent = agent
+        self.prompt_context = context
+        self.start_time = datetime.datetime.now()
+        self.processed_by_agents.add(agent.role)
+        crewai_event_bus.emit(self, TaskStartedEvent(context=context, task=self))
+        self.output = TaskOutput(
+            name=self.name or self.description,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=raw,
+            agent=agent.role,
+            output_format=self._get_output_format(),
+        )
+        self.end_time = datetime.datetime.now()
+
+        if self.callback:
+            self.callback(self.output)
+        crew = agent.crew
+        if crew and crew.task_callback and crew.task_callback != self.callback:
+            crew.task_callback(self.output)
+        if self.output_file:
+            self._save_file(raw)
+        crewai_event_bus.emit(self, TaskCompletedEvent(output=self.output, task=self))
+        return self.output
+
+
+_cache: Optional[TaskCache] = None
+_cache_lock = threading.Lock()
+_cache_enabled = True
+_cache_directory: Optional[Path] = None
+
+
+def configure_task_cache(
+    enabled: bool = True, directory: Optional[Union[str, Path]] = None
+):
+    """Turn task output memoization on or off for this process"""
+    global _cache, _cache_enabled, _cache_directory
+    with _cache_lock:
+        _cache_enabled = enabled
+        if directory is not None:
+            _cache_directory = Path(directory)
+            if _cache is not None:
+                _cache.close()
+                _cache = None
+
+
+def get_task_cache() -> Optional[TaskCache]:
+    """Return the process-wide task cache, or None when memoization is disabled"""
+    global _cache
+    with _cache_lock:
+        if not _cache_enabled:
+            return None
+        if _cache is None:
+            directory = _cache_directory or get_cache_dir()
+            directory.mkdir(parents=True, exist_ok=True)
+            try:
+                _cache = TaskCache(directory / "tasks.sqlite3")
+            except sqlite3.Error as e:
+                logging.warning(f"Task cache unavailable: {e}")
+                return None
+        return _cache
@@ -0,0 +1,126 @@
+import logging
+from typing import Any, Mapping, Optional, Sequence
+
+from crewai import Task
+
+
+def task_dependencies(
+    tasks_config: Mapping[str, Mapping[str, Any]],
+) -> dict[str, Optional[list[str]]]:
+    """Read the ``depends_on`` lists of tasks.yaml, None where a task declares none"""
+    dependencies: dict[str, Optional[list[str]]] = {}
+    for name, config in tasks_config.items():
+        depends_on = config.get("depends_on")
+        if depends_on is None:
+            dependencies[name] = None
+            continue
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        for dependency in depends_on:
+            if dependency not in tasks_config:
+                raise ValueError(
+                    f"Task '{name}' depends on unknown task '{dependency}'"
+                )
+        dependencies[name] = list(depends_on)
+    return dependencies
+
+
+def task_levels(
+    names: Sequence[str], dependencies: Mapping[str, Optional[list[str]]]
+) -> list[list[str]]:
+    """Group tasks into levels whose tasks only depend on earlier levels.
+
+    A task without ``depends_on`` keeps the sequential behaviour and depends
+    on every task defined before it.
+    """
+    resolved = {
+        name: dependencies.get(name)
+        if dependencies.get(name) is not None
+        else list(names[:i])
+        for i, name in enumerate(names)
+    }
+    levels: list[list[str]] = []
+    placed: set[str] = set()
+    while len(placed) < len(names):
+        level = [
+            name
+            for name in names
+            if name not in placed
+            and all(dependency in placed for dependency in resolved[name] or ())
+        ]
+        if not level:
+            cycle = [name for name in names if name not in placed]
+            raise ValueError(f"Task dependencies contain a cycle: {', '.join(cycle)}")
+        levels.append(level)
+        placed.update(level)
+    return levels
+
+
+def schedule_tasks(
+    tasks: Sequence[Task], tasks_config: Mapping[str, Mapping[str, Any]]
+) -> list[Task]:
+    """Order tasks by their dependencies and run independent ones concurrently.
+
+    A sequential crew runs consecutive asynchronous tasks in parallel and a
+    synchronous task first waits for all of them, so tasks sharing a level
+    become asynchronous and a task reading their output joins them.
+    """
+    by_name = {task.name: task for task in tasks}
+    names = [task.name for task in tasks if task.name]
+    dependencies = task_dependencies(tasks_config)
+    levels = task_levels(names, dependencies)
+
+    ordered: list[Task] = []
+    pending: set[str] = set()
+    for level in levels:
+        for name in level:
+            task = by_name[name]
+            depends_on = dependencies.get(name)
+            if depends_on is not None:
+                task.context = [by_name[dependency] for dependency in depends_on]
+            joins = pending.intersection(pending if depends_on is None else depends_on)
+            task.async_execution = len(level) > 1 and not joins
+            if task.async_execution:
+                pending.add(name)
+            else:
+                pending.clear()
+            ordered.append(task)
+
+    # The crew output comes from the last task, which must not run in the background
+    if ordered and ordered[-1].async_execution:
+        ordered[-1].async_execution = False
+    return ordered
+
+
+def task_timeline(tasks: Sequence[Task]) -> list[dict[str, Any]]:
+    """Start and end of each executed task, in seconds since the first one started"""
+    started = [task.start_time for task in tasks if task.start_time]
+    if not started:
+        return []
+    origin = min(started)
+    timeline = []
+    for task in tasks:
+        if not task.start_time or not task.end_time:
+            continue
+        timeline.append(
+            {
+                "task": task.name,
+                "async": task.async_execution,
+                "start": round((task.start_time - origin).total_seconds(), 3),
+                "end": round((task.end_time - origin).total_seconds(), 3),
+                "seconds": round(task.execution_duration or 0.0, 3),
+            }
+        )
+    return sorted(timeline, key=lambda entry: entry["start"])
+
+
+def log_task_timeline(tasks: Sequence[Task]):
+    timeline = task_timeline(tasks)
+    if not timeline:
+        return
+    for entry in timeline:
+        logging.info(
+            f"Task {entry['task']}: {entry['start']:.2f}s -> {entry['end']:.2f}s "
+            f"({entry['seconds']:.2f}s{', async' if entry['async'] else ''})"
+        )
+    logging.info(f"Crew tasks finished after {max(e['end'] for e in timeline):.2f}s")
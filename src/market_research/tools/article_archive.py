@@ -0,0 +1,356 @@
+import hashlib
+import heapq
+import logging
+import math
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from market_research.tools.articles import Article
+from market_research.tools.published_dates import parse_iso_datetime
+from market_research.utils.funcs import canonicalize_url, get_cache_dir
+
+# BM25 term frequency saturation and length normalization
+K1 = 1.2
+B = 0.75
+# Articles are indexed and returned in passages of about this many words
+PASSAGE_WORDS = 80
+DEFAULT_TOP_K = 5
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be been but by for from had has have he her his i if in "
+    "into is it its more not of on or our said she so than that the their them "
+    "then there these they this to was we were what when which while who will "
+    "with would you".split()
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    day TEXT NOT NULL,
+    title TEXT NOT NULL,
+    published_at TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    archived_at REAL NOT NULL,
+    UNIQUE (url, ticker)
+);
+CREATE TABLE IF NOT EXISTS passages (
+    id INTEGER PRIMARY KEY,
+    article_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS passages_article ON passages (article_id);
+-- Clustered by ticker, term and day, so each query term reads one contiguous range
+CREATE TABLE IF NOT EXISTS postings (
+    ticker TEXT NOT NULL,
+    term TEXT NOT NULL,
+    day TEXT NOT NULL,
+    passage_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    PRIMARY KEY (ticker, term, day, passage_id)
+) WITHOUT ROWID;
+-- Passage count and total length of every ticker and day, for N and avgdl
+CREATE TABLE IF NOT EXISTS partitions (
+    ticker TEXT NOT NULL,
+    day TEXT NOT NULL,
+    passages INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    PRIMARY KEY (ticker, day)
+) WITHOUT ROWID;
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased words of a text without stopwords and single letters"""
+    return [
+        token
+        for token in _TOKEN.findall(text.lower())
+        if token not in STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+def split_passages(text: str, words: int = PASSAGE_WORDS) -> list[str]:
+    """Consecutive runs of ``words`` words, the last one folded in when it is short"""
+    tokens = text.split()
+    passages = [" ".join(tokens[i : i + words]) for i in range(0, len(tokens), words)]
+    if len(passages) > 1 and len(passages[-1].split()) < words // 4:
+        last = passages.pop()
+        passages[-1] += " " + last
+    return passages
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """A passage of an archived article and its BM25 score for a query"""
+
+    score: float
+    ticker: str
+    day: str
+    title: str
+    url: str
+    published_at: str
+    text: str
+
+
+class ArticleArchive:
+    """On-disk BM25 index of every scraped article, partitioned by ticker and day.
+
+    Articles are split into passages of about ``PASSAGE_WORDS`` words, and
+    searches return the best passages rather than whole articles. Re-adding
+    an unchanged article is a no-op and a changed one replaces its passages,
+    so the archive grows incrementally with every scrape.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def _day(article: Article) -> str:
+        published = parse_iso_datetime(article.published_at)
+        return (published or datetime.now(timezone.utc)).date().isoformat()
+
+    def _postings(self, title: str, text: str) -> tuple[Counter[str], int]:
+        # Title words count towards every passage, they say what all of it is about
+        tokens = tokenize(title) + tokenize(text)
+        return Counter(tokens), len(tokens)
+
+    def _remove(self, article_id: int, ticker: str, day: str, title: str):
+        """Drop the passages and postings of an article that is being replaced"""
+        rows = self._conn.execute(
+            "SELECT id, text FROM passages WHERE article_id = ?", (article_id,)
+        ).fetchall()
+        length = 0
+        for passage_id, text in rows:
+            counts, passage_length = self._postings(title, text)
+            length += passage_length
+            self._conn.executemany(
+                "DELETE FROM postings WHERE ticker = ? AND term = ? AND day = ? AND passage_id = ?",
+                [(ticker, term, day, passage_id) for term in counts],
+            )
+        self._conn.execute("DELETE FROM passages WHERE article_id = ?", (article_id,))
+        self._conn.execute(
+            "UPDATE partitions SET passages = passages - ?, length = length - ? "
+            "WHERE ticker = ? AND day = ?",
+            (len(rows), length, ticker, day),
+        )
+
+    def add(self, articles: Iterable[Article]) -> int:
+        """Index new and changed articles, returning how many were (re)indexed"""
+        added = 0
+        now = time.time()
+        with self._lock, self._conn:
+            for article in articles:
+                if not article.content:
+                    continue
+                url = canonicalize_url(article.url) if article.url else article.title
+                content_hash = hashlib.sha256(
+                    f"{article.title}\0{article.content}".encode("utf-8")
+                ).hexdigest()
+                row = self._conn.execute(
+                    "SELECT id, day, title, content_hash FROM articles WHERE url = ? AND ticker = ?",
+                    (url, article.ticker),
+                ).fetchone()
+                if row is not None and row[3] == content_hash:
+                    continue
+                if row is not None:
+                    self._remove(row[0], article.ticker, row[1], row[2])
+                    self._conn.execute("DELETE FROM articles WHERE id = ?", (row[0],))
+
+                day = self._day(article)
+                article_id = self._conn.execute(
+                    "INSERT INTO articles (url, ticker, day, title, published_at, content_hash, archived_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        url,
+                        article.ticker,
+                        day,
+                        article.title,
+                        article.published_at,
+                        content_hash,
+                        now,
+                    ),
+                ).lastrowid
+                passages = split_passages(article.content)
+                total_length = 0
+                for position, text in enumerate(passages):
+                    passage_id = self._conn.execute(
+                        "INSERT INTO passages (article_id, position, text) VALUES (?, ?, ?)",
+                        (article_id, position, text),
+                    ).lastrowid
+                    counts, length = self._postings(article.title, text)
+                    total_length += length
+                    self._conn.executemany(
+                        "INSERT INTO postings VALUES (?, ?, ?, ?, ?, ?)",
+                        [
+                            (article.ticker, term, day, passage_id, tf, length)
+                            for term, tf in counts.items()
+                        ],
+                    )
+                self._conn.execute(
+                    "INSERT INTO partitions VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (ticker, day) DO UPDATE SET "
+                    "passages = passages + excluded.passages, length = length + excluded.length",
+                    (article.ticker, day, len(passages), total_length),
+                )
+                added += 1
+        return added
+
+    def search(
+        self,
+        query: str,
+        ticker: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        top_k: int = DEFAULT_TOP_K,
+    ) -> list[SearchHit]:
+        """Best BM25 passages for a query, optionally within a ticker and a day range.
+
+        ``since`` and ``until`` are inclusive ISO dates such as '2026-10-01'.
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        since = since or "0000-00-00"
+        until = until or "9999-99-99"
+        with self._lock:
+            tickers = (
+                [ticker.upper()]
+                if ticker
+                else [
+                    row[0]
+                    for row in self._conn.execute(
+                        "SELECT DISTINCT ticker FROM partitions"
+                    )
+                ]
+            )
+            placeholders = ", ".join("?" * len(tickers))
+            n, total_length = self._conn.execute(
+                f"SELECT SUM(passages), SUM(length) FROM partitions "
+                f"WHERE ticker IN ({placeholders}) AND day BETWEEN ? AND ?",
+                (*tickers, since, until),
+            ).fetchone()
+            if not n:
+                return []
+            avgdl = total_length / n
+
+            scores: defaultdict[int, float] = defaultdict(float)
+            for term in terms:
+                postings = [
+                    posting
+                    for t in tickers
+                    for posting in self._conn.execute(
+                        "SELECT passage_id, tf, length FROM postings "
+                        "WHERE ticker = ? AND term = ? AND day BETWEEN ? AND ?",
+                        (t, term, since, until),
+                    )
+                ]
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                for passage_id, tf, length in postings:
+                    scores[passage_id] += (
+                        idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avgdl))
+                    )
+
+            best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+            hits = []
+            for passage_id, score in best:
+                row = self._conn.execute(
+                    "SELECT a.ticker, a.day, a.title, a.url, a.published_at, p.text "
+                    "FROM passages p JOIN articles a ON a.id = p.article_id WHERE p.id = ?",
+                    (passage_id,),
+                ).fetchone()
+                hits.append(SearchHit(round(score, 4), *row))
+            return hits
+
+    def fingerprint(self, ticker: str) -> str:
+        """Changes whenever articles of the ticker are added or replaced"""
+        with self._lock:
+            count, last = self._conn.execute(
+                "SELECT COUNT(*), MAX(id) FROM articles WHERE ticker = ?",
+                (ticker.upper(),),
+            ).fetchone()
+        return f"{count}:{last}"
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            articles, tickers, days = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT ticker), COUNT(DISTINCT day) FROM articles"
+            ).fetchone()
+            passages = self._conn.execute("SELECT COUNT(*) FROM passages").fetchone()[0]
+        return {
+            "articles": articles,
+            "passages": passages,
+            "tickers": tickers,
+            "days": days,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def format_hits(query: str, hits: list[SearchHit]) -> str:
+    """Render search hits as a compact list for agents"""
+    if not hits:
+        return f"No archived news passages match '{query}'."
+    parts = [f"Top {len(hits)} archived news passages for '{query}':\n\n"]
+    for i, hit in enumerate(hits, 1):
+        parts.append(f"{i}. **{hit.title}** ({hit.ticker}, {hit.day})\n")
+        parts.append(f"   {hit.text}\n")
+        if hit.url.startswith("http"):
+            parts.append(f"   Link: {hit.url}\n")
+        parts.append("\n")
+    return "".join(parts)
+
+
+_archive: Optional[ArticleArchive] = None
+_archive_enabled = True
+_archive_directory: Optional[Path] = None
+_archive_lock = threading.Lock()
+
+
+def configure_article_archive(
+    enabled: bool = True, directory: Optional[Union[str, Path]] = None
+):
+    """Turn archiving of scraped articles on or off for this process"""
+    global _archive, _archive_enabled, _archive_directory
+    with _archive_lock:
+        _archive_enabled = enabled
+        if directory is not None:
+            _archive_directory = Path(directory)
+            if _archive is not None:
+                _archive.close()
+                _archive = None
+
+
+def get_article_archive() -> Optional[ArticleArchive]:
+    """Return the process-wide article archive, or None when archiving is disabled"""
+    global _archive
+    with _archive_lock:
+        if not _archive_enabled:
+            return None
+        if _archive is None:
+            directory = _archive_directory or get_cache_dir()
+            directory.mkdir(parents=True, exist_ok=True)
+            try:
+                _archive = ArticleArchive(directory / "archive.sqlite3")
+            except sqlite3.Error as e:
+                logging.warning(f"Article archive unavailable: {e}")
+                return None
+        return _archive
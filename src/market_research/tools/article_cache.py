@@ -0,0 +1,160 @@
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from market_research.utils.funcs import canonicalize_url, get_cache_dir
+
+DEFAULT_TTL = 30 * 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    content_hash TEXT NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_last_access ON articles (last_access);
+"""
+
+
+class ArticleCache:
+    """SQLite cache of scraped article bodies keyed by canonical URL.
+
+    Entries expire after their TTL and the least recently used ones are
+    evicted once the cache holds more than ``max_entries`` articles.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, url: str) -> Optional[tuple[str, str]]:
+        """Return the cached (body, title) for a URL, or None if missing or expired"""
+        key = canonicalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, title, expires_at FROM articles WHERE url = ?", (key,)
+            ).fetchone()
+            if row is None or row[2] <= now:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE articles SET last_access = ? WHERE url = ?", (now, key)
+            )
+            self._conn.commit()
+        self.hits += 1
+        return row[0], row[1]
+
+    def put(self, url: str, body: str, title: str, ttl: Optional[float] = None):
+        """Store an article body and title, evicting old entries if the cache is full"""
+        key = canonicalize_url(url)
+        now = time.time()
+        content_hash = hashlib.sha256(body.encode("utf-8")).hexdigest()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO articles "
+                "(url, title, body, fetched_at, expires_at, content_hash, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    title,
+                    body,
+                    now,
+                    now + (self.ttl if ttl is None else ttl),
+                    content_hash,
+                    now,
+                ),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float):
+        self._conn.execute("DELETE FROM articles WHERE expires_at <= ?", (now,))
+        self._conn.execute(
+            "DELETE FROM articles WHERE url IN ("
+            "SELECT url FROM articles ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM articles")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[ArticleCache] = None
+_cache_lock = threading.Lock()
+_cache_enabled = True
+_cache_refresh = False
+_cache_directory: Optional[Path] = None
+
+
+def configure_article_cache(
+    enabled: bool = True,
+    refresh: bool = False,
+    directory: Optional[Union[str, Path]] = None,
+):
+    """Turn the article cache on or off for this process.
+
+    With ``refresh`` the cache is not read, but freshly scraped articles are
+    still stored in it.
+    """
+    global _cache, _cache_enabled, _cache_refresh, _cache_directory
+    with _cache_lock:
+        _cache_enabled = enabled
+        _cache_refresh = refresh
+        if directory is not None:
+            _cache_directory = Path(directory)
+            if _cache is not None:
+                _cache.close()
+                _cache = None
+
+
+def article_cache_refresh() -> bool:
+    """Whether cached articles should be ignored and re-scraped"""
+    return _cache_refresh
+
+
+def get_article_cache() -> Optional[ArticleCache]:
+    """Return the process-wide article cache, or None when caching is disabled"""
+    global _cache
+    with _cache_lock:
+        if not _cache_enabled:
+            return None
+        if _cache is None:
+            directory = _cache_directory or get_cache_dir()
+            directory.mkdir(parents=True, exist_ok=True)
+            try:
+                _cache = ArticleCache(directory / "articles.sqlite3")
+            except sqlite3.Error as e:
+                logging.warning(f"Article cache unavailable: {e}")
+                return None
+        return _cache
@@ -0,0 +1,77 @@
+import logging
+from typing import Optional, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from market_research.tools.article_archive import (
+    DEFAULT_TOP_K,
+    format_hits,
+    get_article_archive,
+)
+from market_research.tools.cassette import recorded
+
+# Passages returned per call at most, however many the agent asks for
+MAX_TOP_K = 20
+
+
+class ArticleSearchInput(BaseModel):
+    query: str = Field(
+        ...,
+        description="What to look for, e.g. 'guidance cut data center demand'",
+    )
+    ticker: Optional[str] = Field(
+        default=None,
+        description="Only search news scraped for this ticker symbol (e.g., AAPL)",
+    )
+    since: Optional[str] = Field(
+        default=None,
+        description="Only search news published on or after this date (YYYY-MM-DD)",
+    )
+    until: Optional[str] = Field(
+        default=None,
+        description="Only search news published on or before this date (YYYY-MM-DD)",
+    )
+    top_k: int = Field(
+        default=DEFAULT_TOP_K,
+        description=f"Number of passages to return (at most {MAX_TOP_K})",
+    )
+
+
+class ArticleSearchTool(BaseTool):
+    name: str = "article_search"
+    description: str = (
+        "Searches the local archive of every news article scraped so far and returns "
+        "the most relevant passages with their title, date and link. "
+        "Use this to look up past news, earlier events and trends for a ticker."
+    )
+    args_schema: Type[BaseModel] = ArticleSearchInput
+
+    @recorded(
+        match_on=("query", "ticker"),
+        failure_prefixes=("ArticleSearchTool._run failed",),
+    )
+    def _run(
+        self,
+        query: str,
+        ticker: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        top_k: int = DEFAULT_TOP_K,
+    ) -> str:
+        """Search the archive and format the best passages"""
+        archive = get_article_archive()
+        if archive is None:
+            return "The article archive is disabled."
+        try:
+            hits = archive.search(
+                query, ticker, since, until, max(1, min(top_k, MAX_TOP_K))
+            )
+            logging.info(
+                f"ArticleSearchTool._run found {len(hits)} passages for query={query!r}, ticker={ticker}"
+            )
+            return format_hits(query, hits)
+        except Exception as e:
+            error_msg = f"ArticleSearchTool._run failed: {type(e).__name__}: {str(e)}"
+            logging.error(error_msg)
+            return error_msg
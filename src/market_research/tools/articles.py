@@ -0,0 +1,67 @@
+import json
+from dataclasses import asdict, dataclass
+from typing import Any, Iterable
+
+OUTPUT_FORMATS = ("markdown", "json", "jsonl")
+
+
+@dataclass(slots=True)
+class Article:
+    """A scraped news article"""
+
+    ticker: str
+    title: str
+    url: str
+    source: str
+    published_at: str
+    content: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def truncate(text: str, max_length: int) -> str:
+    """Cut text to ``max_length`` characters, marking the cut with '...'"""
+    return text[:max_length] + "..." if len(text) > max_length else text
+
+
+def format_markdown(ticker: str, articles: Iterable[Article]) -> str:
+    parts = [f"Latest news for {ticker} from Yahoo Finance:\n\n"]
+    for i, article in enumerate(articles, 1):
+        parts.append(f"{i}. **{article.title}**\n")
+        parts.append(f"   Published: {article.published_at}\n")
+        parts.append(f"   Source: {article.source}\n")
+        if article.content:
+            parts.append(f"   Summary: {article.content}\n")
+        if article.url:
+            parts.append(f"   Link: {article.url}\n")
+        parts.append("\n")
+    return "".join(parts)
+
+
+def format_json(ticker: str, articles: Iterable[Article]) -> str:
+    return json.dumps(
+        {"ticker": ticker, "articles": [article.to_dict() for article in articles]},
+        ensure_ascii=False,
+    )
+
+
+def format_jsonl(ticker: str, articles: Iterable[Article]) -> str:
+    return "\n".join(
+        json.dumps(article.to_dict(), ensure_ascii=False) for article in articles
+    )
+
+
+def format_articles(
+    ticker: str, articles: Iterable[Article], format: str = "markdown"
+) -> str:
+    """Render articles as markdown for agents, or as JSON / JSON Lines for pipelines"""
+    if format == "markdown":
+        return format_markdown(ticker, articles)
+    if format == "json":
+        return format_json(ticker, articles)
+    if format == "jsonl":
+        return format_jsonl(ticker, articles)
+    raise ValueError(
+        f"Unknown output format '{format}', expected one of: {', '.join(OUTPUT_FORMATS)}"
+    )
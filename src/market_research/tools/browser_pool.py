@@ -0,0 +1,262 @@
+import asyncio
+import atexit
+import logging
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from market_research.utils.funcs import current_background_loop
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+]
+
+
+class _BrowserSlot:
+    """A launched browser and context together with their warm pages"""
+
+    def __init__(self, browser: Any, context: Any):
+        self.browser = browser
+        self.context = context
+        self.created_at = time.monotonic()
+        self.uses = 0
+        self.in_use = 0
+        self.idle_pages: list[Any] = []
+
+    def is_healthy(self) -> bool:
+        return self.browser.is_connected()
+
+    def is_expired(self, max_age: float, max_uses: int) -> bool:
+        return (
+            time.monotonic() - self.created_at > max_age
+            or self.uses >= max_uses
+            or not self.is_healthy()
+        )
+
+    async def close(self):
+        for page in self.idle_pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        self.idle_pages.clear()
+        try:
+            await self.context.close()
+        except Exception:
+            pass
+        try:
+            await self.browser.close()
+        except Exception:
+            pass
+
+
+class BrowserPool:
+    """Pool of a Playwright browser, its context and warm pages.
+
+    The browser is launched lazily on first use and recycled once it is older
+    than ``max_age`` seconds, has served ``max_uses`` pages or lost its
+    connection. Playwright objects are bound to the event loop they were
+    created on, so a pool must only be used from a single loop.
+    """
+
+    def __init__(
+        self,
+        max_idle_pages: int = 5,
+        max_age: float = 600.0,
+        max_uses: int = 200,
+        headless: bool = True,
+    ):
+        self.max_idle_pages = max_idle_pages
+        self.max_age = max_age
+        self.max_uses = max_uses
+        self.headless = headless
+        self.launches = 0
+        self._playwright_manager: Any = None
+        self._playwright: Any = None
+        # Weak, so that the per-loop pool registry does not keep loops alive
+        self._loop: Optional["weakref.ref[asyncio.AbstractEventLoop]"] = None
+        self._slot: Optional[_BrowserSlot] = None
+        self._retired: list[_BrowserSlot] = []
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def _start_playwright(self) -> bool:
+        """Start the Playwright driver on the current event loop"""
+        if self._playwright is not None:
+            return True
+        # Created before the first await, so concurrent callers share one lock
+        # and only the first of them starts the driver
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._playwright is not None:
+                return True
+
+            try:
+                from playwright.async_api import async_playwright
+            except ImportError:
+                logging.warning(
+                    "Playwright not available. Install with: pip install playwright"
+                )
+                return False
+
+            manager = async_playwright()
+            self._playwright = await manager.__aenter__()
+            self._playwright_manager = manager
+            self._loop = weakref.ref(asyncio.get_running_loop())
+            return True
+
+    async def _launch_slot(self) -> _BrowserSlot:
+        """Launch a new browser with a shared context"""
+        browser = await self._playwright.chromium.launch(
+            headless=self.headless, args=LAUNCH_ARGS
+        )
+        context = await browser.new_context(user_agent=USER_AGENT)
+        self.launches += 1
+        logging.info(f"Launched pooled Chromium browser (launch #{self.launches})")
+        return _BrowserSlot(browser, context)
+
+    async def _current_slot(self) -> _BrowserSlot:
+        """Return a healthy browser slot, recycling the current one if needed"""
+        assert self._lock is not None
+        async with self._lock:
+            slot = self._slot
+            if slot is not None and slot.is_expired(self.max_age, self.max_uses):
+                logging.info("Recycling pooled Chromium browser")
+                self._slot = None
+                if slot.in_use:
+                    self._retired.append(slot)
+                else:
+                    await slot.close()
+            if self._slot is None:
+                self._slot = await self._launch_slot()
+            return self._slot
+
+    async def start(self) -> bool:
+        """Make sure the driver and a browser are running, return False if unavailable"""
+        try:
+            if not await self._start_playwright():
+                return False
+            await self._current_slot()
+            return True
+        except Exception as e:
+            logging.error(f"Failed to setup Playwright: {e}")
+            return False
+
+    async def acquire_page(self) -> tuple[_BrowserSlot, Any]:
+        """Borrow a warm page from the pool, opening a new one if none is idle"""
+        if not await self._start_playwright():
+            raise RuntimeError("Playwright not available")
+        slot = await self._current_slot()
+        slot.uses += 1
+        slot.in_use += 1
+        while slot.idle_pages:
+            page = slot.idle_pages.pop()
+            if not page.is_closed():
+                return slot, page
+        try:
+            return slot, await slot.context.new_page()
+        except Exception:
+            slot.in_use -= 1
+            raise
+
+    async def release_page(self, slot: _BrowserSlot, page: Any, reusable: bool = True):
+        """Return a borrowed page, keeping it warm when the slot is still current"""
+        slot.in_use -= 1
+        keep = (
+            reusable
+            and slot is self._slot
+            and not page.is_closed()
+            and len(slot.idle_pages) < self.max_idle_pages
+        )
+        if keep:
+            try:
+                await page.goto("about:blank")
+                slot.idle_pages.append(page)
+            except Exception:
+                keep = False
+        if not keep:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        if slot in self._retired and not slot.in_use:
+            self._retired.remove(slot)
+            await slot.close()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """Context manager that borrows a page and returns it to the pool"""
+        slot, page = await self.acquire_page()
+        reusable = True
+        try:
+            yield page
+        except BaseException:
+            reusable = False
+            raise
+        finally:
+            await self.release_page(slot, page, reusable)
+
+    async def close(self):
+        """Close all browsers and stop the Playwright driver"""
+        slots = self._retired + ([self._slot] if self._slot else [])
+        self._slot = None
+        self._retired = []
+        for slot in slots:
+            await slot.close()
+        if self._playwright_manager is not None:
+            try:
+                await self._playwright_manager.__aexit__(None, None, None)
+            except Exception:
+                pass
+        self._playwright_manager = None
+        self._playwright = None
+
+    def shutdown(self):
+        """Synchronously close the pool if its event loop can still run"""
+        loop = self._loop() if self._loop else None
+        if self._playwright is None or loop is None or loop.is_closed():
+            return
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(self.close(), loop).result(timeout=10)
+            else:
+                loop.run_until_complete(self.close())
+        except Exception as e:
+            logging.warning(f"Error shutting down browser pool: {e}")
+
+
+# Playwright objects cannot cross event loops, so there is one pool per loop
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool]" = (
+    weakref.WeakKeyDictionary()
+)
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the browser pool of the running event loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    with _pools_lock:
+        pool = _pools.get(loop)
+        if pool is None:
+            pool = _pools[loop] = BrowserPool()
+            runner = current_background_loop()
+            if runner is not None:
+                # Close the browser before the background loop stops
+                runner.add_shutdown_callback(pool.close)
+        return pool
+
+
+@atexit.register
+def _shutdown_browser_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.shutdown()
@@ -0,0 +1,202 @@
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+CASSETTE_MODES = ("record", "replay")
+CASSETTE_VERSION = 1
+
+
+class CassetteMissError(RuntimeError):
+    """Raised in replay mode when a tool call was never recorded"""
+
+
+def _key(tool: str, inputs: dict[str, Any]) -> str:
+    data = json.dumps({"tool": tool, "inputs": inputs}, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """Tool calls and their outputs, kept in a JSON file.
+
+    In ``record`` mode a call that is on the cassette is replayed, and any
+    other call runs for real and is added, so the first iteration of a crew
+    records and later ones replay. ``replay`` mode never runs a tool: a call
+    that was not recorded with the same inputs falls back to the latest
+    recording of that tool with the same ``match_on`` inputs, e.g. the same
+    ticker, and raises CassetteMissError when there is none. Failed calls are
+    never recorded, so they run again next time.
+    """
+
+    def __init__(self, path: Union[str, Path], mode: str = "record"):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(
+                f"Unknown cassette mode '{mode}', expected one of: {', '.join(CASSETTE_MODES)}"
+            )
+        self.path = Path(path)
+        self.mode = mode
+        self.interactions: dict[str, dict[str, Any]] = {}
+        self.replayed = 0
+        self.recorded = 0
+        self.failed = 0
+        self.saved_seconds = 0.0
+        self._lock = threading.Lock()
+        try:
+            data = json.loads(self.path.read_text())
+            self.interactions = {item["key"]: item for item in data["interactions"]}
+        except FileNotFoundError:
+            if mode == "replay":
+                raise
+        except (OSError, ValueError, KeyError) as e:
+            raise ValueError(f"Unreadable cassette {self.path}: {e}") from None
+
+    def _find(
+        self, tool: str, inputs: dict[str, Any], match_on: tuple[str, ...]
+    ) -> Optional[dict[str, Any]]:
+        interaction = self.interactions.get(_key(tool, inputs))
+        if interaction is not None or self.mode != "replay" or not match_on:
+            return interaction
+        for candidate in reversed(self.interactions.values()):
+            if candidate["tool"] == tool and all(
+                candidate["inputs"].get(name) == inputs.get(name) for name in match_on
+            ):
+                logging.info(
+                    f"Replaying {tool} recorded with other inputs: {candidate['inputs']}"
+                )
+                return candidate
+        return None
+
+    def play(
+        self,
+        tool: str,
+        inputs: dict[str, Any],
+        call: Callable[[], Any],
+        match_on: tuple[str, ...] = (),
+        failure_prefixes: tuple[str, ...] = (),
+    ) -> Any:
+        """Return the recorded output of a tool call, or make and record it.
+
+        An output starting with one of ``failure_prefixes`` reports a failure,
+        it is returned but not recorded.
+        """
+        with self._lock:
+            interaction = self._find(tool, inputs, match_on)
+            if interaction is not None:
+                self.replayed += 1
+                self.saved_seconds += interaction["seconds"]
+                return interaction["output"]
+        if self.mode == "replay":
+            raise CassetteMissError(
+                f"No recording of {tool} with {json.dumps(inputs, default=str)} on {self.path}"
+            )
+
+        started = time.perf_counter()
+        output = call()
+        if isinstance(output, str) and output.startswith(failure_prefixes):
+            logging.info(f"Not recording failed {tool} call: {output[:200]}")
+            with self._lock:
+                self.failed += 1
+            return output
+        interaction = {
+            "key": _key(tool, inputs),
+            "tool": tool,
+            "inputs": inputs,
+            "output": output,
+            "seconds": round(time.perf_counter() - started, 3),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+        }
+        with self._lock:
+            self.interactions[interaction["key"]] = interaction
+            self.recorded += 1
+            self._save()
+        return output
+
+    def _save(self):
+        # Write to a temporary file first so a crash never leaves half a file behind
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "version": CASSETTE_VERSION,
+                    "interactions": list(self.interactions.values()),
+                },
+                f,
+                indent=2,
+                default=str,
+            )
+        os.replace(tmp, self.path)
+
+    def log_summary(self):
+        logging.info(
+            f"Cassette {self.path} ({self.mode}): {self.replayed} tool calls replayed, "
+            f"{self.recorded} recorded, {self.failed} failed and not recorded, "
+            f"{self.saved_seconds:.1f}s of tool time saved"
+        )
+
+
+def recorded(
+    match_on: tuple[str, ...] = (), failure_prefixes: tuple[str, ...] = ()
+) -> Callable[[Callable], Callable]:
+    """Route a tool's ``_run`` through the active cassette, if there is one.
+
+    Inputs are keyed with their defaults filled in, so a call that spells out
+    a default matches one that leaves it out. Outputs starting with one of
+    ``failure_prefixes`` are the tool's error messages and are not recorded.
+    In replay mode a missing recording is returned to the agent as an error
+    message.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            cassette = get_cassette()
+            if cassette is None:
+                return func(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            inputs = dict(list(bound.arguments.items())[1:])
+            try:
+                return cassette.play(
+                    self.name,
+                    inputs,
+                    lambda: func(self, *args, **kwargs),
+                    match_on,
+                    failure_prefixes,
+                )
+            except CassetteMissError as e:
+                logging.error(str(e))
+                return f"Error: {e}"
+
+        return wrapper
+
+    return decorator
+
+
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+
+
+def configure_cassette(
+    path: Optional[Union[str, Path]] = None, mode: str = "record"
+) -> Optional[Cassette]:
+    """Record or replay tool calls of this process on a cassette, None turns it off"""
+    global _cassette
+    with _cassette_lock:
+        _cassette = Cassette(path, mode) if path else None
+        return _cassette
+
+
+def get_cassette() -> Optional[Cassette]:
+    """Return the active cassette, or None when tools run for real"""
+    return _cassette
@@ -0,0 +1,245 @@
+import logging
+import math
+import re
+from collections import Counter
+from typing import Iterable, Optional
+
+from market_research.tools.articles import Article, truncate
+
+# Tokens of article content handed to the agents per scrape, across all articles
+DEFAULT_TOKEN_BUDGET = 1500
+# Rough size of an LLM token in English text, close enough to budget with offline
+CHARS_PER_TOKEN = 4
+
+# Weights of what makes a sentence worth keeping
+NUMBER_WEIGHT = 1.0
+TICKER_WEIGHT = 2.0
+ENTITY_WEIGHT = 0.5
+TITLE_WEIGHT = 2.0
+LEAD_WEIGHT = 1.0
+# At most this many numbers or entities count towards a sentence's score
+MAX_FEATURES = 4
+# Sentences shorter than this are usually captions, bylines or fragments
+MIN_SENTENCE_WORDS = 6
+
+# A sentence ends at . ! or ? followed by whitespace and a capital, digit or
+# quote, or glued to the next sentence when paragraphs were joined without a space
+_SENTENCE_END = re.compile(
+    r"(?:(?<=[.!?])|(?<=[.!?][\"')\]]))\s+(?=[A-Z0-9\"'(\[$])"
+    r"|(?<=[a-z0-9%)][.!?])(?=[A-Z][a-z])"
+)
+# Periods that do not end a sentence: titles, company suffixes, months, initials
+_ABBREVIATION = re.compile(
+    r"(?:\b(?:Mr|Mrs|Ms|Dr|Prof|Inc|Corp|Co|Ltd|Jr|Sr|St|vs|etc|No|Jan|Feb|Mar|Apr"
+    r"|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)|\b[A-Z](?:\.[A-Z])*)\.[\"')\]]*$"
+)
+_NUMBER = re.compile(
+    r"[$€£]?\d[\d,]*(?:\.\d+)?(?:\s?(?:%|percent|[kKmMbB]n?\b|billion|million|trillion))?"
+)
+_WORD = re.compile(r"[A-Za-z][A-Za-z'&.-]*")
+_TITLE_TERM = re.compile(r"[a-z0-9]{3,}")
+
+BOILERPLATE_PATTERNS = (
+    r"\bsign (?:in|up)\b",
+    r"\bsubscribe\b",
+    r"\bnewsletter\b",
+    r"\bclick here\b",
+    r"\bread (?:more|next|the full)\b",
+    r"\bstory continues\b",
+    r"\badvertisement\b",
+    r"\ball rights reserved\b",
+    r"\bterms (?:of (?:service|use)|and privacy)\b",
+    r"\bprivacy (?:policy|dashboard)\b",
+    r"\boriginally (?:published|appeared)\b",
+    r"\bview comments\b",
+    r"\brecommended stories\b",
+    r"\bmost read from\b",
+    r"\bfollow us\b",
+    r"\bdownload (?:the|our) app\b",
+    r"\bviews and opinions expressed\b",
+    r"\bnot investment advice\b",
+    r"\bhas no position in\b",
+    r"\bwant the latest recommendations\b",
+)
+_BOILERPLATE = re.compile("|".join(BOILERPLATE_PATTERNS), re.IGNORECASE)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate LLM token count of a text, deterministic and offline"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split article text into sentences, keeping abbreviations and decimals intact"""
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        if _ABBREVIATION.search(text, start, match.start()):
+            continue
+        sentence = text[start : match.start()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+    rest = text[start:].strip()
+    if rest:
+        sentences.append(rest)
+    return sentences
+
+
+def _normalize(sentence: str) -> str:
+    return " ".join(sentence.lower().split())
+
+
+def count_figures(text: str) -> int:
+    """Numbers, percentages and amounts in a text"""
+    return len(_NUMBER.findall(text))
+
+
+def is_boilerplate(sentence: str) -> bool:
+    """Navigation, subscription, disclaimer and other text that is never news"""
+    return bool(_BOILERPLATE.search(sentence))
+
+
+def score_sentence(
+    sentence: str, position: int, count: int, ticker: str, title_terms: set[str]
+) -> float:
+    """How much information a sentence carries for the ticker.
+
+    Figures, mentions of the ticker, named entities and words of the title
+    raise the score; the lead of an article gets a bonus that fades with
+    position, and fragments are penalized.
+    """
+    words = _WORD.findall(sentence)
+    score = NUMBER_WEIGHT * min(count_figures(sentence), MAX_FEATURES)
+    if ticker and re.search(rf"(?<![A-Za-z]){re.escape(ticker)}(?![A-Za-z])", sentence):
+        score += TICKER_WEIGHT
+    # Capitalized words past the first are mostly names of companies, people and places
+    entities = sum(1 for word in words[1:] if word[0].isupper())
+    score += ENTITY_WEIGHT * min(entities, MAX_FEATURES)
+    if title_terms:
+        overlap = title_terms & set(_TITLE_TERM.findall(sentence.lower()))
+        score += TITLE_WEIGHT * len(overlap) / len(title_terms)
+    score += LEAD_WEIGHT * (1 - position / max(count, 1))
+    if len(sentence.split()) < MIN_SENTENCE_WORDS:
+        score -= 1.0
+    return score
+
+
+def _content_sentences(text: str, repeated: frozenset[str] = frozenset()) -> list[str]:
+    """Sentences of a text without boilerplate, shared and duplicate sentences"""
+    sentences = []
+    seen = set(repeated)
+    for sentence in split_sentences(text):
+        key = _normalize(sentence)
+        if key not in seen and not is_boilerplate(sentence):
+            sentences.append(sentence)
+            seen.add(key)
+    return sentences
+
+
+def compact_text(
+    text: str,
+    ticker: str = "",
+    title: str = "",
+    max_tokens: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    repeated: frozenset[str] = frozenset(),
+) -> str:
+    """Keep the most informative sentences of a text within a token and character limit.
+
+    Boilerplate and sentences in ``repeated`` (normalized, e.g. shared by
+    several articles) are dropped. The best scoring sentences that fit are
+    kept in their original order.
+    """
+    sentences = _content_sentences(text, repeated)
+    limit = len(text)
+    if max_tokens is not None:
+        limit = min(limit, max_tokens * CHARS_PER_TOKEN)
+    if max_chars is not None:
+        limit = min(limit, max_chars)
+    if sum(len(sentence) + 1 for sentence in sentences) - 1 <= limit:
+        return " ".join(sentences)
+    if limit <= 0:
+        return ""
+
+    title_terms = set(_TITLE_TERM.findall(title.lower()))
+    ranked = sorted(
+        range(len(sentences)),
+        key=lambda i: (
+            -score_sentence(sentences[i], i, len(sentences), ticker, title_terms),
+            i,
+        ),
+    )
+    kept: list[int] = []
+    used = 0
+    for i in ranked:
+        size = len(sentences[i]) + (1 if kept else 0)
+        if used + size <= limit:
+            kept.append(i)
+            used += size
+    if not kept and sentences:
+        # Not even the best sentence fits, cut it rather than return nothing
+        return truncate(sentences[ranked[0]], max(0, limit - 3))
+    return " ".join(sentences[i] for i in sorted(kept))
+
+
+def repeated_sentences(texts: Iterable[str]) -> frozenset[str]:
+    """Normalized sentences that occur in more than one text, e.g. shared disclaimers"""
+    counts: Counter[str] = Counter()
+    for text in texts:
+        counts.update({_normalize(sentence) for sentence in split_sentences(text)})
+    return frozenset(
+        sentence
+        for sentence, count in counts.items()
+        if count > 1 and len(sentence.split()) >= MIN_SENTENCE_WORDS
+    )
+
+
+def compact_articles(
+    articles: list[Article],
+    ticker: str,
+    token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+    max_content_length: Optional[int] = None,
+) -> tuple[int, int]:
+    """Compact the content of articles in place so together they fit ``token_budget``.
+
+    The budget is shared out evenly, and whatever an article leaves unused of
+    its share goes to the longer ones. A budget of 0 or None means no total
+    limit, ``max_content_length`` still caps every article. Returns the
+    estimated tokens before and after.
+    """
+    before = sum(estimate_tokens(article.content) for article in articles)
+    repeated = repeated_sentences(article.content for article in articles)
+
+    # What each article would need without a budget
+    demands = []
+    for article in articles:
+        text = " ".join(_content_sentences(article.content, repeated))
+        if max_content_length is not None:
+            text = text[:max_content_length]
+        demands.append(estimate_tokens(text))
+
+    # Smallest first, so what an article leaves of its share goes to the next ones
+    remaining = token_budget or None
+    order = sorted(range(len(articles)), key=lambda i: demands[i])
+    for rank, i in enumerate(order):
+        article = articles[i]
+        share = None
+        if remaining is not None:
+            share = min(demands[i], remaining // (len(articles) - rank))
+        article.content = compact_text(
+            article.content,
+            ticker,
+            article.title,
+            max_tokens=share,
+            max_chars=max_content_length,
+            repeated=repeated,
+        )
+        if remaining is not None:
+            remaining -= estimate_tokens(article.content)
+    after = sum(estimate_tokens(article.content) for article in articles)
+    if articles:
+        logging.info(
+            f"Compacted {len(articles)} articles from ~{before} to ~{after} tokens"
+        )
+    return before, after
@@ -0,0 +1,222 @@
+import hashlib
+import logging
+import random
+import re
+from collections import Counter
+from typing import Any, Optional
+
+from market_research.utils.funcs import canonicalize_url
+
+SIMHASH_BITS = 64
+
+# Body fingerprints within this many differing bits are treated as the same story
+CONTENT_MAX_DISTANCE = 3
+
+# Titles sharing this fraction of their words are treated as the same story.
+# SimHash is too noisy for a dozen words, so titles use MinHash instead.
+TITLE_MIN_SIMILARITY = 0.75
+MINHASH_BANDS = 16
+MINHASH_ROWS = 4
+
+# Texts shorter than this are only deduplicated on an exact match
+MIN_TOKENS = 4
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_MINHASH_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(_MERSENNE_PRIME))
+    for _ in range(MINHASH_BANDS * MINHASH_ROWS)
+]
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def shingles(tokens: list[str], size: int) -> list[str]:
+    """Overlapping word n-grams, or the whole text if it is shorter than ``size``"""
+    if len(tokens) <= size:
+        return [" ".join(tokens)] if tokens else []
+    return [" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)]
+
+
+def _hash64(feature: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big"
+    )
+
+
+def simhash(features: list[str]) -> int:
+    """64-bit SimHash of weighted features, similar inputs give nearby fingerprints"""
+    weights = [0] * SIMHASH_BITS
+    for feature, count in Counter(features).items():
+        value = _hash64(feature)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def minhash(features: set[str]) -> tuple[int, ...]:
+    """MinHash signature, the share of equal positions estimates Jaccard similarity"""
+    hashes = [_hash64(feature) for feature in features]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _MINHASH_PERMUTATIONS
+    )
+
+
+def jaccard(a: set[str], b: set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+class SimHashIndex:
+    """Near-duplicate lookup over SimHash fingerprints.
+
+    Fingerprints are split into ``max_distance + 1`` bands; two fingerprints
+    within ``max_distance`` bits must agree on at least one band, so only
+    fingerprints sharing a band are compared.
+    """
+
+    def __init__(self, max_distance: int):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self._band_bits = -(-SIMHASH_BITS // self.bands)
+        self._buckets: list[dict[int, list[tuple[int, str]]]] = [
+            {} for _ in range(self.bands)
+        ]
+
+    def _band_keys(self, fingerprint: int) -> list[int]:
+        mask = (1 << self._band_bits) - 1
+        return [
+            fingerprint >> (band * self._band_bits) & mask for band in range(self.bands)
+        ]
+
+    def find(self, fingerprint: int) -> Optional[str]:
+        """Return the key of a stored near-duplicate, or None"""
+        for band, key in enumerate(self._band_keys(fingerprint)):
+            for other, other_key in self._buckets[band].get(key, ()):
+                if hamming_distance(fingerprint, other) <= self.max_distance:
+                    return other_key
+        return None
+
+    def add(self, fingerprint: int, key: str):
+        for band, band_key in enumerate(self._band_keys(fingerprint)):
+            self._buckets[band].setdefault(band_key, []).append((fingerprint, key))
+
+
+class MinHashIndex:
+    """Near-duplicate lookup over word sets using MinHash locality-sensitive hashing.
+
+    Only sets whose signatures agree on a whole band are compared, and
+    candidates are confirmed with their exact Jaccard similarity.
+    """
+
+    def __init__(self, min_similarity: float):
+        self.min_similarity = min_similarity
+        self._buckets: list[dict[tuple[int, ...], list[tuple[frozenset[str], str]]]] = [
+            {} for _ in range(MINHASH_BANDS)
+        ]
+
+    @staticmethod
+    def _band_keys(signature: tuple[int, ...]) -> list[tuple[int, ...]]:
+        return [
+            signature[band * MINHASH_ROWS : (band + 1) * MINHASH_ROWS]
+            for band in range(MINHASH_BANDS)
+        ]
+
+    def find(self, features: frozenset[str]) -> Optional[str]:
+        """Return the key of a stored near-duplicate, or None"""
+        for band, key in enumerate(self._band_keys(minhash(features))):
+            for other, other_key in self._buckets[band].get(key, ()):
+                if jaccard(features, other) >= self.min_similarity:
+                    return other_key
+        return None
+
+    def add(self, features: frozenset[str], key: str):
+        for band, band_key in enumerate(self._band_keys(minhash(features))):
+            self._buckets[band].setdefault(band_key, []).append((features, key))
+
+
+class ArticleDeduplicator:
+    """Drops repeated articles within a run.
+
+    Story items are checked by canonical URL and title before their detail
+    pages are fetched; scraped articles are checked again by their content.
+    """
+
+    def __init__(
+        self,
+        title_min_similarity: float = TITLE_MIN_SIMILARITY,
+        content_max_distance: int = CONTENT_MAX_DISTANCE,
+    ):
+        self._urls: set[str] = set()
+        self._titles: set[str] = set()
+        self._title_index = MinHashIndex(title_min_similarity)
+        self._content_index = SimHashIndex(content_max_distance)
+        self.dropped: Counter[str] = Counter()
+        # URLs of dropped articles, which were still seen in this run
+        self.dropped_urls: list[str] = []
+
+    def _drop(self, reason: str, url: str, duplicate_of: str) -> str:
+        self.dropped[reason] += 1
+        if url:
+            self.dropped_urls.append(url)
+        logging.info(
+            f"Dropping {url or 'article'} as a {reason} duplicate of {duplicate_of}"
+        )
+        return reason
+
+    def check_listing(self, url: str, title: str) -> Optional[str]:
+        """Return why a story item is a duplicate ('url' or 'title'), or register it"""
+        key = canonicalize_url(url) if url else ""
+        if key and key in self._urls:
+            return self._drop("url", url, key)
+
+        tokens = tokenize(title)
+        normalized = " ".join(tokens)
+        if normalized and normalized in self._titles:
+            return self._drop("title", url, normalized)
+        words = frozenset(tokens)
+        if len(words) >= MIN_TOKENS:
+            match = self._title_index.find(words)
+            if match is not None:
+                return self._drop("title", url, match)
+
+        if key:
+            self._urls.add(key)
+        if normalized:
+            self._titles.add(normalized)
+        if len(words) >= MIN_TOKENS:
+            self._title_index.add(words, normalized)
+        return None
+
+    def check_content(self, url: str, title: str, body: str) -> Optional[str]:
+        """Return 'content' if the article body repeats an earlier one, or register it"""
+        tokens = tokenize(body)
+        if len(tokens) < MIN_TOKENS:
+            return None
+        fingerprint = simhash(shingles(tokens, 3))
+        match = self._content_index.find(fingerprint)
+        if match is not None:
+            return self._drop("content", url, match)
+        self._content_index.add(fingerprint, url or title)
+        return None
+
+    def summary(self) -> dict[str, Any]:
+        return {"dropped": sum(self.dropped.values()), "by_reason": dict(self.dropped)}
+
+    def log_summary(self):
+        total = sum(self.dropped.values())
+        if total:
+            logging.info(
+                f"Dropped {total} duplicate articles: "
+                + ", ".join(
+                    f"{reason}={count}" for reason, count in self.dropped.items()
+                )
+            )
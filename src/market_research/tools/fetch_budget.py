@@ -0,0 +1,289 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Seconds a detail page may take across all of its attempts before the
+# article falls back to its summary
+DEFAULT_ARTICLE_DEADLINE = 20.0
+# Seconds all detail pages of a scrape may take together
+DEFAULT_RUN_DEADLINE = 60.0
+# Attempts after the first when a detail page cannot be fetched
+DEFAULT_RETRIES = 1
+# Backoff before retry n is uniform in [0, min(BACKOFF_MAX, BACKOFF_BASE * 2**n)]
+BACKOFF_BASE = 0.25
+BACKOFF_MAX = 2.0
+
+# A hedge is sent once an attempt is slower than this quantile of recent ones
+HEDGE_QUANTILE = 0.95
+# Latencies needed before the quantile is trusted, until then nothing is hedged
+MIN_HEDGE_SAMPLES = 20
+# Never hedge sooner than this, in seconds
+MIN_HEDGE_DELAY = 0.05
+# Recent attempt latencies kept per process
+LATENCY_WINDOW = 500
+
+FETCH_OUTCOMES = ("ok", "failed", "deadline")
+
+
+class PermanentFetchError(RuntimeError):
+    """Raised by a fetch attempt that would fail the same way again, e.g. a page without an article"""
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank quantile ``q`` (0 to 1) of a non-empty list of samples"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+class LatencyHistory:
+    """Latencies of recent successful attempts, the basis of the hedge delay"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging an attempt, None while there is too little history"""
+        with self._lock:
+            if len(self._samples) < MIN_HEDGE_SAMPLES:
+                return None
+            samples = list(self._samples)
+        return max(MIN_HEDGE_DELAY, percentile(samples, HEDGE_QUANTILE))
+
+
+class FetchBudget:
+    """Deadlines, retries and hedging for the detail pages of one scrape.
+
+    The run deadline starts counting at ``start()``, and does not apply
+    before. Every page gets ``article_deadline`` seconds, or whatever is
+    left of the run if that is less. A deadline of None means no limit.
+    """
+
+    def __init__(
+        self,
+        article_deadline: Optional[float] = DEFAULT_ARTICLE_DEADLINE,
+        run_deadline: Optional[float] = DEFAULT_RUN_DEADLINE,
+        retries: int = DEFAULT_RETRIES,
+        hedge: bool = False,
+    ):
+        self.article_deadline = article_deadline
+        self.run_deadline = run_deadline
+        self.retries = max(0, retries)
+        self.hedge = hedge
+        self.run_ends_at: Optional[float] = None
+
+    def start(self):
+        """Start counting the run deadline"""
+        if self.run_deadline:
+            self.run_ends_at = time.monotonic() + self.run_deadline
+
+    def ends_at(self, start: float) -> Optional[float]:
+        """When a page fetched from ``start`` on has to be done"""
+        ends = [self.run_ends_at]
+        if self.article_deadline:
+            ends.append(start + self.article_deadline)
+        return min((end for end in ends if end is not None), default=None)
+
+    @staticmethod
+    def backoff(retry: int) -> float:
+        """Jittered delay before the ``retry``-th retry, so retries do not arrive in waves"""
+        return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**retry))
+
+
+class LatencyStats:
+    """Detail page latencies of a run, with how their fetches ended"""
+
+    def __init__(self):
+        self.samples: list[float] = []
+        self.outcomes: Counter[str] = Counter()
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record(self, seconds: float, outcome: str):
+        self.samples.append(seconds)
+        self.outcomes[outcome] += 1
+
+    def percentiles(self) -> dict[str, float]:
+        if not self.samples:
+            return {}
+        return {
+            f"p{round(q * 100)}": round(percentile(self.samples, q), 3)
+            for q in (0.5, 0.95, 0.99)
+        }
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "pages": len(self.samples),
+            **self.percentiles(),
+            "max": round(max(self.samples), 3) if self.samples else None,
+            "outcomes": dict(self.outcomes),
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+        }
+
+    def log_summary(self):
+        if not self.samples:
+            return
+        percentiles = ", ".join(
+            f"{name}={seconds:.2f}s" for name, seconds in self.percentiles().items()
+        )
+        logging.info(
+            f"Detail page latency over {len(self.samples)} pages: {percentiles}, "
+            f"max={max(self.samples):.2f}s; {self.outcomes['deadline']} hit the deadline, "
+            f"{self.retries} retries, {self.hedges} hedged ({self.hedge_wins} won by the hedge)"
+        )
+
+
+async def _settle(tasks: list[asyncio.Task]):
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _race(
+    fetch: Callable[[], Awaitable[Optional[T]]],
+    ends_at: Optional[float],
+    hedge_delay: Optional[float],
+    stats: LatencyStats,
+    history: LatencyHistory,
+) -> Optional[T]:
+    """One attempt, plus a hedge if it is still running after ``hedge_delay`` seconds"""
+    start = time.monotonic()
+    first = asyncio.ensure_future(fetch())
+    started = {first: start}
+    tasks = [first]
+    hedged = hedge_delay is None
+    try:
+        while tasks:
+            now = time.monotonic()
+            if ends_at is not None and now >= ends_at:
+                return None
+            timeouts = []
+            if ends_at is not None:
+                timeouts.append(ends_at - now)
+            if not hedged:
+                timeouts.append(max(0.0, start + hedge_delay - now))
+            done, _ = await asyncio.wait(
+                tasks,
+                timeout=min(timeouts) if timeouts else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                tasks.remove(task)
+                if task.cancelled():
+                    continue
+                if isinstance(task.exception(), PermanentFetchError):
+                    raise task.exception()
+                if task.exception() is not None:
+                    logging.info(f"Fetch attempt failed: {task.exception()}")
+                    continue
+                result = task.result()
+                if result is not None:
+                    history.add(time.monotonic() - started[task])
+                    if task is not first:
+                        stats.hedge_wins += 1
+                    return result
+            if tasks and not hedged and time.monotonic() >= start + hedge_delay:
+                # The attempt is slower than almost all recent ones, race a second
+                hedged = True
+                stats.hedges += 1
+                hedge = asyncio.ensure_future(fetch())
+                started[hedge] = time.monotonic()
+                tasks.append(hedge)
+        return None
+    finally:
+        await _settle(tasks)
+
+
+async def fetch_within_budget(
+    fetch: Callable[[], Awaitable[Optional[T]]],
+    budget: FetchBudget,
+    stats: LatencyStats,
+    history: Optional[LatencyHistory] = None,
+) -> Optional[T]:
+    """Call ``fetch`` until it returns something, within the budget's deadlines.
+
+    Attempts that return None are retried after a jittered backoff, up to
+    ``budget.retries`` times, unless one raised PermanentFetchError. With
+    hedging on, an attempt that outlasts the p95 of recent ones gets a
+    second attempt racing it, and the first result wins. Returns None when every attempt failed or time ran out.
+    """
+    history = history or get_latency_history()
+    start = time.monotonic()
+    ends_at = budget.ends_at(start)
+    outcome = "failed"
+    try:
+        for attempt in range(budget.retries + 1):
+            if attempt:
+                delay = budget.backoff(attempt - 1)
+                if ends_at is not None:
+                    delay = min(delay, max(0, ends_at - time.monotonic()))
+                await asyncio.sleep(delay)
+                stats.retries += 1
+            if ends_at is not None and time.monotonic() >= ends_at:
+                outcome = "deadline"
+                return None
+            hedge_delay = history.hedge_delay() if budget.hedge else None
+            try:
+                result = await _race(fetch, ends_at, hedge_delay, stats, history)
+            except PermanentFetchError as e:
+                logging.info(f"Not retrying: {e}")
+                return None
+            if result is not None:
+                outcome = "ok"
+                return result
+            if ends_at is not None and time.monotonic() >= ends_at:
+                outcome = "deadline"
+                return None
+        return None
+    finally:
+        stats.record(time.monotonic() - start, outcome)
+
+
+_budget_settings: dict[str, Any] = {}
+_latency_history: Optional[LatencyHistory] = None
+_fetch_budget_lock = threading.Lock()
+
+
+def configure_fetch_budget(
+    article_deadline: Optional[float] = DEFAULT_ARTICLE_DEADLINE,
+    run_deadline: Optional[float] = DEFAULT_RUN_DEADLINE,
+    retries: int = DEFAULT_RETRIES,
+    hedge: bool = False,
+):
+    """Set the deadlines, retries and hedging of scrapes in this process, 0 or None for no deadline"""
+    with _fetch_budget_lock:
+        _budget_settings.update(
+            article_deadline=article_deadline or None,
+            run_deadline=run_deadline or None,
+            retries=retries,
+            hedge=hedge,
+        )
+
+
+def new_fetch_budget() -> FetchBudget:
+    """A budget with the configured settings, its run deadline not started yet"""
+    with _fetch_budget_lock:
+        settings = dict(_budget_settings)
+    return FetchBudget(**settings)
+
+
+def get_latency_history() -> LatencyHistory:
+    """Return the process-wide latency history, creating it on first use"""
+    global _latency_history
+    with _fetch_budget_lock:
+        if _latency_history is None:
+            _latency_history = LatencyHistory()
+        return _latency_history
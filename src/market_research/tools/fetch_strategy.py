@@ -0,0 +1,165 @@
+import asyncio
+import contextvars
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from market_research.tools.browser_pool import USER_AGENT
+from market_research.tools.rate_limit import get_rate_limiter
+from market_research.utils.profiling import span
+
+T = TypeVar("T")
+
+FETCH_STRATEGIES = ("auto", "http", "browser")
+
+
+class HttpFetcher:
+    """Keep-alive HTTP client that fetches pages without a browser"""
+
+    def __init__(self, pool_maxsize: int = 10, timeout: float = 10.0):
+        self.timeout = timeout
+        self._local = threading.local()
+        self._pool_maxsize = pool_maxsize
+        # A request cannot be interrupted once sent, so abandoned ones (hedged
+        # or past their deadline) hold a thread until they finish. Own threads
+        # keep them from starving asyncio's small default executor.
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_maxsize, thread_name_prefix="http-fetch"
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        # requests.Session is not guaranteed thread-safe, keep one per worker thread
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self._pool_maxsize, pool_maxsize=self._pool_maxsize
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(
+                {
+                    "User-Agent": USER_AGENT,
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Language": "en-US,en;q=0.9",
+                }
+            )
+            self._local.session = session
+        return session
+
+    def _get(self, url: str) -> Optional[requests.Response]:
+        with span("http.fetch") as s:
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+                s.set(status=str(response.status_code), bytes=len(response.content))
+                return response
+            except requests.RequestException as e:
+                logging.info(f"HTTP fetch of {url} failed: {e}")
+                return None
+
+    @staticmethod
+    def _html(url: str, response: Optional[requests.Response]) -> Optional[str]:
+        if response is None:
+            return None
+        if response.status_code != 200:
+            logging.info(f"HTTP fetch of {url} returned {response.status_code}")
+            return None
+        return response.text
+
+    def fetch_sync(self, url: str) -> Optional[str]:
+        """GET a page and return its HTML, or None on errors and non-200 responses"""
+        return self._html(url, self._get(url))
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """Async wrapper that runs the blocking GET in a worker thread, within the host's rate limit"""
+        limiter = get_rate_limiter()
+        if limiter is not None:
+            await limiter.acquire(url)
+        context = contextvars.copy_context()
+        response = await asyncio.get_running_loop().run_in_executor(
+            self._executor, context.run, self._get, url
+        )
+        if limiter is not None and response is not None:
+            limiter.report(
+                url,
+                response.status_code,
+                response.text,
+                response.headers.get("Retry-After"),
+            )
+        return self._html(url, response)
+
+
+class FetchStats:
+    """Records which strategy served each URL during a run"""
+
+    def __init__(self):
+        self.served_by: dict[str, str] = {}
+
+    def record(self, url: str, strategy: str):
+        self.served_by[url] = strategy
+
+    def counts(self) -> Counter[str]:
+        return Counter(self.served_by.values())
+
+    def summary(self) -> dict[str, Any]:
+        counts = self.counts()
+        total = sum(counts.values())
+        return {
+            "total": total,
+            "by_strategy": dict(counts),
+            "http_hit_rate": counts["http"] / total if total else 0.0,
+            "served_by": dict(self.served_by),
+        }
+
+    def log_summary(self):
+        counts = self.counts()
+        if counts:
+            logging.info(
+                "Fetch strategies: "
+                + ", ".join(f"{name}={count}" for name, count in counts.most_common())
+            )
+
+
+async def fetch_with_fallback(
+    url: str,
+    strategies: list[tuple[str, Callable[[str], Awaitable[Optional[str]]]]],
+    extract: Callable[[str], Optional[T]],
+    stats: Optional[FetchStats] = None,
+) -> Optional[T]:
+    """Try each named fetch strategy in order until one yields extractable content.
+
+    ``extract`` parses the fetched HTML and returns None when the expected
+    nodes are missing, which moves on to the next strategy.
+    """
+    for name, fetch in strategies:
+        content = await fetch(url)
+        if not content:
+            continue
+        result = extract(content)
+        if result is not None:
+            if stats is not None:
+                stats.record(url, name)
+            return result
+        logging.info(f"{name} fetch of {url} is missing expected content")
+    if stats is not None:
+        stats.record(url, "failed")
+    return None
+
+
+_http_fetcher: Optional[HttpFetcher] = None
+_http_fetcher_lock = threading.Lock()
+
+
+def get_http_fetcher() -> HttpFetcher:
+    """Return the process-wide HTTP fetcher, creating it on first use"""
+    global _http_fetcher
+    with _http_fetcher_lock:
+        if _http_fetcher is None:
+            _http_fetcher = HttpFetcher()
+        return _http_fetcher
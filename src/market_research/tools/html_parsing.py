@@ -0,0 +1,345 @@
+import logging
+import re
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+from market_research.tools.published_dates import parse_published_at
+
+# CSS equivalents of the class-substring matches the scraper has always used
+STORY_ITEM_SELECTOR = 'li[class*="story-item"]'
+ARTICLE_TITLE_SELECTOR = 'div[class*="cover-title"], h1[class*="cover-title"]'
+ARTICLE_BODY_SELECTOR = 'div[class*="body"]'
+
+# Elements that may carry the published date of a story item
+TIME_SELECTORS = [
+    "time",  # Standard time element
+    "[datetime]",  # Any element with datetime attribute
+    ".time",  # Class-based time selector
+    ".date",  # Class-based date selector
+    "[data-module='TimeAgo']",  # Yahoo-specific time module
+    "span[title]",  # Span with title attribute (often contains full date)
+]
+
+# One query for all of them, matches come back in document order
+TIME_SELECTOR = ", ".join(TIME_SELECTORS)
+
+# Parsing starts at the container we read from, everything before it is skipped
+_NEWS_STREAM_START = re.compile(r"<[a-z]+\s[^>]*class=\"[^\"]*news-stream")
+_ARTICLE_START = re.compile(r"<div\s[^>]*class=\"(?:[^\"]*\s)?article(?:\s[^\"]*)?\"")
+
+# (datetime attribute, title attribute, text) of a matched time element
+TimeElement = tuple[Optional[str], Optional[str], str]
+
+
+def _slice_from(html: str, start: re.Pattern[str]) -> str:
+    match = start.search(html)
+    return html[match.start() :] if match else html
+
+
+def pick_published_at(
+    time_elements: Iterable[TimeElement],
+    texts: Callable[[], Iterable[str]],
+    now: datetime,
+) -> str:
+    """Resolve the published date of a story item to an ISO 8601 UTC timestamp.
+
+    Time elements are tried first (datetime attribute, then title, then text),
+    then the short text nodes of the item. Text nodes are free text, so only
+    relative, named and ISO dates are read from them. Relative dates are
+    resolved against ``now``, the time the page was fetched.
+    """
+    for time_element in time_elements:
+        for value in time_element:
+            published = parse_published_at(value, now)
+            if published is not None:
+                return published.isoformat()
+
+    # Fallback: a bare "3 hours ago" next to the source name
+    for text in texts():
+        text = text.strip()
+        if text and len(text) < 50:
+            published = parse_published_at(text, now, absolute=False)
+            if published is not None:
+                return published.isoformat()
+    return "Unknown"
+
+
+class ParserBackend(ABC):
+    """Extracts story items and article bodies from Yahoo Finance HTML"""
+
+    name = "base"
+
+    @abstractmethod
+    def iter_story_items(
+        self, html: str, fetched_at: Optional[datetime] = None
+    ) -> Iterator[dict[str, str]]:
+        """Lazily yield title, href, summary and published_at of each story item.
+
+        ``published_at`` is an ISO 8601 UTC timestamp, or "Unknown". Relative
+        dates are resolved against ``fetched_at``, which defaults to now.
+        """
+
+    def parse_story_items(
+        self,
+        html: str,
+        limit: Optional[int] = None,
+        fetched_at: Optional[datetime] = None,
+    ) -> list[dict[str, str]]:
+        """Return title, href, summary and published_at for up to ``limit`` story items"""
+        return list(islice(self.iter_story_items(html, fetched_at), limit))
+
+    @abstractmethod
+    def parse_article(self, html: str) -> Optional[tuple[str, str]]:
+        """Return (body, title) of an article page, or None if there is no body"""
+
+
+class SoupParserBackend(ParserBackend):
+    """BeautifulSoup backend, only building the subtrees that are read"""
+
+    name = "bs4"
+
+    def __init__(self):
+        import soupsieve
+
+        try:
+            import lxml  # noqa: F401
+
+            self.features = "lxml"
+        except ImportError:
+            self.features = "html.parser"
+        self._story_item = soupsieve.compile(STORY_ITEM_SELECTOR)
+        self._title = soupsieve.compile(ARTICLE_TITLE_SELECTOR)
+        self._body = soupsieve.compile(ARTICLE_BODY_SELECTOR)
+        self._time = soupsieve.compile(TIME_SELECTOR)
+        self._story_strainer = SoupStrainer(
+            "li", class_=lambda x: x is not None and "story-item" in str(x)
+        )
+
+    def iter_story_items(
+        self, html: str, fetched_at: Optional[datetime] = None
+    ) -> Iterator[dict[str, str]]:
+        now = fetched_at or datetime.now(timezone.utc)
+        soup = BeautifulSoup(
+            _slice_from(html, _NEWS_STREAM_START),
+            self.features,
+            parse_only=self._story_strainer,
+        )
+        for item in self._story_item.select(soup):
+            title_elem = item.find("h3")
+            if not isinstance(title_elem, Tag):
+                continue
+            url_elem = item.find("a")
+            href = url_elem.get("href") if isinstance(url_elem, Tag) else None
+            summary_elem = item.find("p")
+            yield {
+                "title": title_elem.get_text(strip=True),
+                "href": href if isinstance(href, str) else "",
+                "summary": summary_elem.get_text(strip=True)
+                if isinstance(summary_elem, Tag)
+                else "",
+                "published_at": pick_published_at(
+                    map(self._time_element, self._time.iselect(item)),
+                    lambda item=item: item.strings,
+                    now,
+                ),
+            }
+
+    @staticmethod
+    def _time_element(elem: Tag) -> TimeElement:
+        datetime_attr = elem.get("datetime")
+        title_attr = elem.get("title")
+        return (
+            datetime_attr if isinstance(datetime_attr, str) else None,
+            title_attr if isinstance(title_attr, str) else None,
+            elem.get_text(strip=True),
+        )
+
+    def parse_article(self, html: str) -> Optional[tuple[str, str]]:
+        soup = BeautifulSoup(_slice_from(html, _ARTICLE_START), self.features)
+        title_elem = self._title.select_one(soup)
+        body_elem = self._body.select_one(soup)
+        body = body_elem.get_text(strip=True) if body_elem is not None else ""
+        if not body:
+            return None
+        return body, title_elem.get_text(strip=True) if title_elem is not None else ""
+
+
+class LxmlParserBackend(ParserBackend):
+    """lxml backend using precompiled XPath expressions"""
+
+    name = "lxml"
+
+    def __init__(self):
+        from lxml import etree
+        from lxml import html as lxml_html
+
+        def has_class(name: str) -> str:
+            return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+        self._lxml_html = lxml_html
+        self._story_item = etree.XPath('//li[contains(@class, "story-item")]')
+        self._title = etree.XPath(
+            '(//*[(self::div or self::h1) and contains(@class, "cover-title")])[1]'
+        )
+        self._body = etree.XPath('(//div[contains(@class, "body")])[1]')
+        self._h3 = etree.XPath("(.//h3)[1]")
+        self._a = etree.XPath("(.//a)[1]")
+        self._p = etree.XPath("(.//p)[1]")
+        self._time = etree.XPath(
+            " | ".join(
+                [
+                    ".//time",
+                    ".//*[@datetime]",
+                    f".//*[{has_class('time')}]",
+                    f".//*[{has_class('date')}]",
+                    ".//*[@data-module='TimeAgo']",
+                    ".//span[@title]",
+                ]
+            )
+        )
+
+    @staticmethod
+    def _text(elem: Any) -> str:
+        # Same result as BeautifulSoup's get_text(strip=True)
+        return "".join(text.strip() for text in elem.itertext())
+
+    def _first(self, xpath: Any, elem: Any) -> Any:
+        found = xpath(elem)
+        return found[0] if found else None
+
+    def _parse(self, html: str) -> Any:
+        try:
+            return self._lxml_html.document_fromstring(html)
+        except Exception:
+            return None
+
+    def iter_story_items(
+        self, html: str, fetched_at: Optional[datetime] = None
+    ) -> Iterator[dict[str, str]]:
+        now = fetched_at or datetime.now(timezone.utc)
+        root = self._parse(_slice_from(html, _NEWS_STREAM_START))
+        if root is None:
+            return
+        for item in self._story_item(root):
+            title_elem = self._first(self._h3, item)
+            if title_elem is None:
+                continue
+            url_elem = self._first(self._a, item)
+            summary_elem = self._first(self._p, item)
+            yield {
+                "title": self._text(title_elem),
+                "href": url_elem.get("href", "") if url_elem is not None else "",
+                "summary": self._text(summary_elem) if summary_elem is not None else "",
+                "published_at": pick_published_at(
+                    map(self._time_element, self._time(item)),
+                    lambda item=item: item.itertext(),
+                    now,
+                ),
+            }
+
+    def _time_element(self, elem: Any) -> TimeElement:
+        return elem.get("datetime"), elem.get("title"), self._text(elem)
+
+    def parse_article(self, html: str) -> Optional[tuple[str, str]]:
+        root = self._parse(_slice_from(html, _ARTICLE_START))
+        if root is None:
+            return None
+        body_elem = self._first(self._body, root)
+        body = self._text(body_elem) if body_elem is not None else ""
+        if not body:
+            return None
+        title_elem = self._first(self._title, root)
+        return body, self._text(title_elem) if title_elem is not None else ""
+
+
+class SelectolaxParserBackend(ParserBackend):
+    """selectolax (lexbor) backend with native CSS selectors"""
+
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser_cls = LexborHTMLParser
+
+    @staticmethod
+    def _text(node: Any) -> str:
+        return node.text(deep=True, separator="", strip=True)
+
+    def iter_story_items(
+        self, html: str, fetched_at: Optional[datetime] = None
+    ) -> Iterator[dict[str, str]]:
+        now = fetched_at or datetime.now(timezone.utc)
+        tree = self._parser_cls(_slice_from(html, _NEWS_STREAM_START))
+        for item in tree.css(STORY_ITEM_SELECTOR):
+            title_elem = item.css_first("h3")
+            if title_elem is None:
+                continue
+            url_elem = item.css_first("a")
+            summary_elem = item.css_first("p")
+            yield {
+                "title": self._text(title_elem),
+                "href": (url_elem.attributes.get("href") or "")
+                if url_elem is not None
+                else "",
+                "summary": self._text(summary_elem) if summary_elem is not None else "",
+                "published_at": pick_published_at(
+                    map(self._time_element, item.css(TIME_SELECTOR)),
+                    lambda item=item: (
+                        node.text(deep=False)
+                        for node in item.traverse(include_text=True)
+                        if node.tag == "-text"
+                    ),
+                    now,
+                ),
+            }
+
+    def _time_element(self, elem: Any) -> TimeElement:
+        attributes = elem.attributes
+        return attributes.get("datetime"), attributes.get("title"), self._text(elem)
+
+    def parse_article(self, html: str) -> Optional[tuple[str, str]]:
+        tree = self._parser_cls(_slice_from(html, _ARTICLE_START))
+        body_elem = tree.css_first(ARTICLE_BODY_SELECTOR)
+        body = self._text(body_elem) if body_elem is not None else ""
+        if not body:
+            return None
+        title_elem = tree.css_first(ARTICLE_TITLE_SELECTOR)
+        return body, self._text(title_elem) if title_elem is not None else ""
+
+
+PARSER_BACKENDS: dict[str, type[ParserBackend]] = {
+    "selectolax": SelectolaxParserBackend,
+    "lxml": LxmlParserBackend,
+    "bs4": SoupParserBackend,
+}
+
+_backends: dict[str, ParserBackend] = {}
+
+
+def get_parser_backend(name: str = "auto") -> ParserBackend:
+    """Return a parser backend by name, 'auto' picks the fastest one installed"""
+    if name in _backends:
+        return _backends[name]
+    if name == "auto":
+        candidates = list(PARSER_BACKENDS)
+    elif name in PARSER_BACKENDS:
+        candidates = [name]
+    else:
+        raise ValueError(
+            f"Unknown parser backend '{name}', "
+            f"expected one of: auto, {', '.join(PARSER_BACKENDS)}"
+        )
+    for candidate in candidates:
+        try:
+            backend = PARSER_BACKENDS[candidate]()
+        except ImportError:
+            logging.info(f"HTML parser backend '{candidate}' is not installed")
+            continue
+        _backends[name] = backend
+        return backend
+    raise ImportError(f"HTML parser backend '{name}' is not installed")
@@ -0,0 +1,107 @@
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional
+
+from market_research.tools.html_parsing import STORY_ITEM_SELECTOR, ParserBackend
+from market_research.tools.rate_limit import get_rate_limiter, rate_limit_key
+from market_research.utils.profiling import span
+
+# How long to wait for the stream to append story items after a scroll, in ms
+SCROLL_TIMEOUT = 5000
+# The end of the stream is reached after this many scrolls that append nothing
+MAX_IDLE_SCROLLS = 2
+
+# Marks story items that were already read from the page
+TAKEN_ATTRIBUTE = "data-mr-taken"
+NEW_STORY_ITEM_SELECTOR = f"{STORY_ITEM_SELECTOR}:not([{TAKEN_ATTRIBUTE}])"
+
+# Return the HTML of the story items not read yet and mark them. Read items
+# are emptied, so the page does not keep hundreds of rendered stories alive.
+_TAKE_NEW_ITEMS_JS = """
+([selector, attribute, prune]) => {
+    const html = [];
+    for (const item of document.querySelectorAll(selector)) {
+        html.push(item.outerHTML);
+        item.setAttribute(attribute, "");
+        if (prune) item.replaceChildren();
+    }
+    return html;
+}
+"""
+
+# Scroll to the end of the page and resolve true once the stream appends a
+# story item, false if it does not within the timeout
+_SCROLL_FOR_MORE_JS = """
+([selector, timeoutMs]) => new Promise((resolve) => {
+    const done = (appended) => { observer.disconnect(); clearTimeout(limit); resolve(appended); };
+    const observer = new MutationObserver(() => {
+        if (document.querySelector(selector)) done(true);
+    });
+    observer.observe(document.body, {subtree: true, childList: true});
+    const limit = setTimeout(() => done(false), timeoutMs);
+    window.scrollTo(0, document.body.scrollHeight);
+    if (document.querySelector(selector)) done(true);
+})
+"""
+
+
+def parse_story_batch(
+    parser: ParserBackend, items_html: list[str], fetched_at: datetime
+) -> list[dict[str, str]]:
+    """Parse the story items read from the page in one step"""
+    if not items_html:
+        return []
+    return list(
+        parser.iter_story_items("<ul>" + "".join(items_html) + "</ul>", fetched_at)
+    )
+
+
+async def scroll_story_items(
+    page: Any,
+    parser: ParserBackend,
+    fetched_at: datetime,
+    key: str = "",
+    max_scrolls: Optional[int] = None,
+    scroll_timeout: int = SCROLL_TIMEOUT,
+    max_idle_scrolls: int = MAX_IDLE_SCROLLS,
+    prune: bool = True,
+) -> AsyncIterator[dict[str, str]]:
+    """Yield the story items of a loaded news stream page, scrolling for more.
+
+    Each step reads only the items appended since the previous one, so the
+    memory held here does not grow with the length of the stream. The page
+    is only scrolled once the consumer asks for more items. Stops at the end
+    of the stream or after ``max_scrolls`` scrolls.
+    """
+    scrolls = 0
+    idle = 0
+    while True:
+        with span("stream.take") as s:
+            items_html = await page.evaluate(
+                _TAKE_NEW_ITEMS_JS, [NEW_STORY_ITEM_SELECTOR, TAKEN_ATTRIBUTE, prune]
+            )
+            items = parse_story_batch(parser, items_html, fetched_at)
+            s.set(items=len(items), bytes=sum(len(html) for html in items_html))
+        del items_html
+        for item in items:
+            yield item
+        del items
+
+        if max_scrolls is not None and scrolls >= max_scrolls:
+            logging.info(f"Stopped scrolling the news stream after {scrolls} scrolls")
+            return
+        # Every scroll makes the page request the next batch from the host
+        limiter = get_rate_limiter()
+        if limiter is not None:
+            with rate_limit_key(key):
+                await limiter.acquire(page.url)
+        scrolls += 1
+        with span("stream.scroll") as s:
+            appended = await page.evaluate(
+                _SCROLL_FOR_MORE_JS, [NEW_STORY_ITEM_SELECTOR, scroll_timeout]
+            )
+            s.set(appended=int(bool(appended)))
+        idle = 0 if appended else idle + 1
+        if idle >= max_idle_scrolls:
+            logging.info(f"Reached the end of the news stream after {scrolls} scrolls")
+            return
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Optional, Union
+from urllib.parse import urlsplit
+
+from market_research.utils.funcs import get_cache_dir
+from market_research.utils.profiling import span
+
+# Upper bound of a selector wait for URL patterns without history
+DEFAULT_WAIT_TIMEOUT = 15.0
+# Never wait less than this for a pattern whose pages do match
+MIN_WAIT_TIMEOUT = 2.0
+# Patterns whose pages never matched after this many loads get the shortest wait
+MIN_SAMPLES = 3
+# Outcomes of a wait, preferred in this order when several finish together
+WAIT_OUTCOMES = ("selector", "alternative", "stable", "timeout")
+# The DOM counts as stable after this long without mutations
+DOM_QUIET_MS = 750
+
+# Resolves once the DOM has not changed for quietMs, or after maxMs at the latest
+_DOM_STABLE_JS = """
+([quietMs, maxMs]) => new Promise((resolve) => {
+    let timer;
+    const done = () => { observer.disconnect(); clearTimeout(limit); resolve(true); };
+    const observer = new MutationObserver(() => {
+        clearTimeout(timer);
+        timer = setTimeout(done, quietMs);
+    });
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    timer = setTimeout(done, quietMs);
+    const limit = setTimeout(done, maxMs);
+})
+"""
+
+
+class WaitSpec:
+    """The selector a page is expected to render, and alternative layouts of it"""
+
+    def __init__(self, selector: str, alternatives: Optional[list[str]] = None):
+        self.selector = selector
+        self.alternatives = alternatives or []
+
+
+NEWS_STREAM_WAIT = WaitSpec("div.news-stream", ['li[class*="story-item"]'])
+ARTICLE_WAIT = WaitSpec(
+    "div.article",
+    [
+        'div[class*="caas-body"]',  # Older article layout
+        'div[class*="body"]',  # Anything the article parser reads
+        "video",  # Video pages never render an article body
+    ],
+)
+
+
+def url_pattern(url: str) -> str:
+    """Host and first path segment of a URL, e.g. 'finance.yahoo.com/video/'"""
+    parts = urlsplit(url)
+    segment = parts.path.strip("/").split("/", 1)[0]
+    # A bare article page like /story-123.html has no section of its own
+    if "." in segment:
+        segment = ""
+    return f"{parts.netloc}/{segment}/" if segment else f"{parts.netloc}/"
+
+
+class WaitLearner:
+    """Per URL pattern history of selector waits, kept as a small JSON file.
+
+    A pattern whose pages never rendered any of the expected selectors after
+    ``MIN_SAMPLES`` loads, such as video pages, only gets ``MIN_WAIT_TIMEOUT``.
+    Patterns that do match get twice their slowest match instead of the default.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else None
+        self.patterns: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+        if self.path is not None:
+            try:
+                self.patterns = json.loads(self.path.read_text())
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring unreadable wait history {self.path}: {e}")
+
+    def timeout(self, pattern: str) -> float:
+        """Seconds to wait for selectors on pages of ``pattern``"""
+        with self._lock:
+            history = self.patterns.get(pattern)
+        if not history or history["samples"] < MIN_SAMPLES:
+            return DEFAULT_WAIT_TIMEOUT
+        if not history["matches"]:
+            return MIN_WAIT_TIMEOUT
+        return min(
+            DEFAULT_WAIT_TIMEOUT, max(MIN_WAIT_TIMEOUT, 2 * history["slowest_match"])
+        )
+
+    def record(self, pattern: str, matched: bool, elapsed: float):
+        with self._lock:
+            history = self.patterns.setdefault(
+                pattern, {"samples": 0, "matches": 0, "slowest_match": 0.0}
+            )
+            history["samples"] += 1
+            if matched:
+                history["matches"] += 1
+                history["slowest_match"] = max(history["slowest_match"], elapsed)
+
+    def save(self):
+        # Write to a temporary file first so a crash never leaves half a file behind
+        if self.path is None:
+            return
+        with self._lock:
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.patterns, f)
+            os.replace(tmp, self.path)
+
+
+class WaitStats:
+    """Time a run spent in selector waits, by how each wait ended"""
+
+    def __init__(self):
+        self.outcomes: Counter[str] = Counter()
+        self.waited = 0.0
+        # Time spent in waits that ended without any expected selector
+        self.lost = 0.0
+
+    def record(self, outcome: str, elapsed: float):
+        self.outcomes[outcome] += 1
+        self.waited += elapsed
+        if outcome not in ("selector", "alternative"):
+            self.lost += elapsed
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "waits": sum(self.outcomes.values()),
+            "outcomes": dict(self.outcomes),
+            "waited_seconds": round(self.waited, 3),
+            "lost_seconds": round(self.lost, 3),
+        }
+
+    def log_summary(self):
+        if self.outcomes:
+            logging.info(
+                f"Page waits: {self.waited:.1f}s total, {self.lost:.1f}s lost without a match ("
+                + ", ".join(
+                    f"{name}={count}" for name, count in self.outcomes.most_common()
+                )
+                + ")"
+            )
+
+
+async def _first_success(
+    tasks: dict[asyncio.Task, str], timeout: float
+) -> Optional[str]:
+    """Name of the first task that finishes without an error, None if none does in time"""
+    deadline = time.monotonic() + timeout
+    pending = set(tasks)
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            succeeded = [
+                tasks[task]
+                for task in done
+                if not task.cancelled() and task.exception() is None
+            ]
+            if succeeded:
+                return min(succeeded, key=WAIT_OUTCOMES.index)
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def wait_for_page(
+    page: Any,
+    url: str,
+    spec: WaitSpec,
+    learner: Optional[WaitLearner] = None,
+    stats: Optional[WaitStats] = None,
+) -> str:
+    """Wait until the page renders one of the spec's selectors or its DOM settles.
+
+    Returns how the wait ended: 'selector', 'alternative', 'stable' or 'timeout'.
+    """
+    learner = learner or get_wait_learner()
+    pattern = url_pattern(url)
+    timeout = learner.timeout(pattern)
+    with span("browser.wait", pattern=pattern) as s:
+        start = time.perf_counter()
+        timeout_ms = timeout * 1000
+        tasks = {
+            asyncio.ensure_future(
+                page.wait_for_selector(spec.selector, timeout=timeout_ms)
+            ): "selector",
+            asyncio.ensure_future(
+                page.evaluate(_DOM_STABLE_JS, [DOM_QUIET_MS, timeout_ms])
+            ): "stable",
+        }
+        for selector in spec.alternatives:
+            tasks[
+                asyncio.ensure_future(
+                    page.wait_for_selector(selector, timeout=timeout_ms)
+                )
+            ] = "alternative"
+
+        outcome = await _first_success(tasks, timeout) or "timeout"
+        elapsed = time.perf_counter() - start
+        s.set(outcome=outcome)
+        if outcome == "timeout":
+            s.set(timeouts=1)
+            logging.warning(f"Timeout waiting for selector: {spec.selector}")
+
+    # The DOM settling first means none of the selectors was there at that point
+    learner.record(pattern, outcome in ("selector", "alternative"), elapsed)
+    if stats is not None:
+        stats.record(outcome, elapsed)
+    return outcome
+
+
+_learner: Optional[WaitLearner] = None
+_learner_lock = threading.Lock()
+
+
+def get_wait_learner() -> WaitLearner:
+    """Return the process-wide wait history, creating it on first use"""
+    global _learner
+    with _learner_lock:
+        if _learner is None:
+            _learner = WaitLearner(get_cache_dir() / "waits.json")
+        return _learner
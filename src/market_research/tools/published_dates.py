@@ -0,0 +1,137 @@
+import re
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Length of each relative unit; months and years are approximate
+_UNIT_SECONDS = {
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+    "w": 7 * 86400,
+    "mo": 30 * 86400,
+    "y": 365 * 86400,
+}
+
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun"]
+        + ["jul", "aug", "sep", "oct", "nov", "dec"],
+        1,
+    )
+}
+
+_TIMEZONES = {
+    "utc": timezone.utc,
+    "gmt": timezone.utc,
+    "est": timezone(timedelta(hours=-5)),
+    "edt": timezone(timedelta(hours=-4)),
+    "pst": timezone(timedelta(hours=-8)),
+    "pdt": timezone(timedelta(hours=-7)),
+}
+
+# Yahoo Finance shows dates without a timezone in US Eastern time
+try:
+    YAHOO_TIMEZONE: tzinfo = ZoneInfo("America/New_York")
+except ZoneInfoNotFoundError:
+    # No tz database (e.g. Windows without tzdata), ignore daylight saving
+    YAHOO_TIMEZONE = _TIMEZONES["est"]
+
+_ISO = (
+    r"(?P<iso>\d{4}-\d{2}-\d{2}"
+    r"(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?)"
+)
+_RELATIVE = (
+    r"(?P<count>\d+|an?|one)\s*"
+    r"(?P<unit>seconds?|secs?|minutes?|mins?|hours?|hrs?|days?|weeks?|months?"
+    r"|years?|yrs?|mo|[smhdwy])\s+ago"
+)
+_NAMED = r"(?P<named>just now|yesterday)"
+_ABSOLUTE = (
+    r"(?P<month>jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?"
+    r"|aug(?:ust)?|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?\s+"
+    r"(?P<day>\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(?P<year>\d{4}))?"
+    r"(?:,?\s+(?:at\s+)?(?P<hour>\d{1,2}):(?P<minute>\d{2})\s*(?P<meridiem>[ap])\.?m\.?)?"
+    r"(?:\s+(?P<tz>utc|gmt|[ep][sd]t))?"
+)
+
+# Every timestamp shape Yahoo Finance shows, matched in a single search
+DATE_PATTERN = re.compile(
+    rf"\b(?:{_ISO}|{_RELATIVE}|{_NAMED}|{_ABSOLUTE})\b", re.IGNORECASE
+)
+# Shapes that cannot be mistaken for prose, e.g. "may 2" in a headline
+UNAMBIGUOUS_DATE_PATTERN = re.compile(
+    rf"\b(?:{_ISO}|{_RELATIVE}|{_NAMED})\b", re.IGNORECASE
+)
+
+
+def parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp into an aware datetime, or None if it is not one"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _unit_seconds(unit: str) -> int:
+    unit = unit.lower()
+    if unit.startswith("mo"):
+        return _UNIT_SECONDS["mo"]
+    return _UNIT_SECONDS[unit[0]]
+
+
+def _resolve(match: re.Match[str], now: datetime) -> Optional[datetime]:
+    if match["iso"]:
+        return parse_iso_datetime(match["iso"])
+    if match["count"]:
+        count = match["count"].lower()
+        amount = int(count) if count.isdigit() else 1
+        return now - timedelta(seconds=amount * _unit_seconds(match["unit"]))
+    if match["named"]:
+        return now if match["named"].lower() == "just now" else now - timedelta(days=1)
+
+    hour = int(match["hour"] or 0)
+    if match["meridiem"]:
+        hour = hour % 12 + (12 if match["meridiem"].lower() == "p" else 0)
+    tz = _TIMEZONES.get((match["tz"] or "").lower(), YAHOO_TIMEZONE)
+    try:
+        published = datetime(
+            int(match["year"] or now.year),
+            _MONTHS[match["month"][:3].lower()],
+            int(match["day"]),
+            hour,
+            int(match["minute"] or 0),
+            tzinfo=tz,
+        )
+    except ValueError:
+        return None
+    # "Oct 17" without a year is the most recent Oct 17
+    if not match["year"] and published > now + timedelta(days=1):
+        published = published.replace(year=published.year - 1)
+    return published
+
+
+def parse_published_at(
+    text: Optional[str], now: Optional[datetime] = None, absolute: bool = True
+) -> Optional[datetime]:
+    """Find a timestamp in ``text`` and resolve it to an aware UTC datetime.
+
+    Relative phrases such as "3 hours ago" are resolved against ``now``, the
+    time the page was fetched. Without ``absolute``, month-and-day dates
+    are ignored. Returns None when there is no timestamp.
+    """
+    if not text:
+        return None
+    pattern = DATE_PATTERN if absolute else UNAMBIGUOUS_DATE_PATTERN
+    match = pattern.search(text)
+    if match is None:
+        return None
+    published = _resolve(match, now or datetime.now(timezone.utc))
+    if published is None:
+        return None
+    return published.astimezone(timezone.utc).replace(microsecond=0)
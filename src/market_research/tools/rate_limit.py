@@ -0,0 +1,273 @@
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Union
+from urllib.parse import urlsplit
+
+from market_research.utils.profiling import span
+
+# Requests per second per host, also the ceiling the rate climbs back to
+DEFAULT_RATE = 4.0
+# Requests a host may take at once after being idle
+DEFAULT_BURST = 8
+# Never slow a host down below this
+MIN_RATE = 0.2
+# A throttled host gets this fraction of its rate
+BACKOFF_FACTOR = 0.5
+# Every successful request raises the rate of its host by this much
+RATE_INCREASE = 0.1
+# Pause after a throttled request that came without a Retry-After header
+DEFAULT_COOLDOWN = 5.0
+# Responses this short are block pages rather than news
+EMPTY_PAGE_BYTES = 512
+THROTTLE_STATUSES = (429, 503)
+
+# Requests with the same key are queued behind each other, keys take turns
+_rate_limit_key: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "rate_limit_key", default=""
+)
+
+
+@contextmanager
+def rate_limit_key(key: str) -> Iterator[None]:
+    """Share the hosts fairly with other keys, e.g. tickers, while the block runs"""
+    token = _rate_limit_key.set(key)
+    try:
+        yield
+    finally:
+        _rate_limit_key.reset(token)
+
+
+def is_throttled(status: Optional[int], content: Optional[str]) -> bool:
+    """Whether a response means the host wants us to slow down"""
+    if status in THROTTLE_STATUSES:
+        return True
+    return status == 200 and len((content or "").strip()) < EMPTY_PAGE_BYTES
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    # Only the delta-seconds form, an HTTP date falls back to the default cooldown
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+class HostLimiter:
+    """Token bucket of one host with additive increase, multiplicative decrease.
+
+    Tokens refill at ``rate`` per second up to ``burst``. A throttled response
+    halves the rate and pauses the host for its Retry-After or
+    ``DEFAULT_COOLDOWN``; every successful one raises the rate by
+    ``RATE_INCREASE`` until it is back at ``max_rate``. Waiting requests are
+    granted round-robin over their keys, so one ticker with many articles
+    does not starve the others.
+    """
+
+    def __init__(
+        self, host: str, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST
+    ):
+        self.host = host
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.granted = 0
+        self.throttles = 0
+        self.waited = 0.0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiters: OrderedDict[str, deque[asyncio.Future]] = OrderedDict()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+
+    def _delay(self, now: float) -> float:
+        """Seconds until a token is available, refilling the bucket first"""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        """Oldest waiter of the key whose turn it is, None if nobody waits"""
+        while self._waiters:
+            key, waiters = self._waiters.popitem(last=False)
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    if waiters:
+                        # Back of the line until every other key had a turn
+                        self._waiters[key] = waiters
+                    return waiter
+        return None
+
+    async def acquire(self, key: str = ""):
+        """Wait for a token of this host"""
+        with self._lock:
+            if not self._waiters and self._delay(time.monotonic()) == 0:
+                self._tokens -= 1
+                self.granted += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.setdefault(key, deque()).append(waiter)
+            if self._dispatcher is None or self._dispatcher.done():
+                self._dispatcher = asyncio.ensure_future(self._dispatch())
+
+        with span("ratelimit.wait", host=self.host) as s:
+            start = time.perf_counter()
+            try:
+                await waiter
+            finally:
+                waited = time.perf_counter() - start
+                s.set(seconds=round(waited, 3))
+                with self._lock:
+                    self.waited += waited
+
+    async def _dispatch(self):
+        """Hand out tokens to waiting requests as the bucket refills"""
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._dispatcher = None
+                    return
+                delay = self._delay(time.monotonic())
+                if delay <= 0:
+                    waiter = self._next_waiter()
+                    if waiter is not None:
+                        self._tokens -= 1
+                        self.granted += 1
+                        waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+                    continue
+            await asyncio.sleep(delay)
+
+    def report(
+        self,
+        status: Optional[int],
+        content: Optional[str],
+        retry_after: Optional[str] = None,
+    ):
+        """Adapt the rate to the response of a request made with a token"""
+        if status is None:
+            # Network errors say nothing about our rate
+            return
+        now = time.monotonic()
+        with self._lock:
+            if not is_throttled(status, content):
+                self.rate = min(self.max_rate, self.rate + RATE_INCREASE)
+                return
+            if now < self._blocked_until:
+                # Sent before the host was paused, it is already slowed down
+                return
+            self.throttles += 1
+            self.rate = max(MIN_RATE, self.rate * BACKOFF_FACTOR)
+            cooldown = _retry_after_seconds(retry_after)
+            if cooldown is None:
+                cooldown = DEFAULT_COOLDOWN
+            self._blocked_until = now + cooldown
+            self._tokens = 0.0
+        logging.warning(
+            f"{self.host} throttled us (status {status}, {len(content or '')} bytes), "
+            f"pausing {cooldown:.1f}s and slowing down to {self.rate:.2f} req/s"
+        )
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "rate": round(self.rate, 3),
+            "max_rate": self.max_rate,
+            "granted": self.granted,
+            "throttles": self.throttles,
+            "waited_seconds": round(self.waited, 3),
+        }
+
+
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RateLimiter:
+    """Per-host token buckets shared by every scrape in the process.
+
+    Scrapes run on the background loop, so one limiter covers concurrent
+    detail fetches and every batch worker thread alike.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.hosts: dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    def host(self, url: str) -> HostLimiter:
+        host = urlsplit(url).netloc
+        with self._lock:
+            limiter = self.hosts.get(host)
+            if limiter is None:
+                limiter = self.hosts[host] = HostLimiter(host, self.rate, self.burst)
+            return limiter
+
+    async def acquire(self, url: str):
+        """Wait until a request to the URL's host is allowed"""
+        await self.host(url).acquire(_rate_limit_key.get())
+
+    def report(
+        self,
+        url: str,
+        status: Optional[int],
+        content: Optional[str],
+        retry_after: Optional[str] = None,
+    ):
+        self.host(url).report(status, content, retry_after)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            hosts = list(self.hosts.values())
+        return {limiter.host: limiter.summary() for limiter in hosts}
+
+    def log_summary(self):
+        for host, stats in self.summary().items():
+            logging.info(
+                f"Rate limit {host}: {stats['rate']:.2f}/{stats['max_rate']:.2f} req/s, "
+                f"{stats['granted']} requests, {stats['throttles']} throttled, "
+                f"{stats['waited_seconds']:.1f}s waited"
+            )
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_rate: Optional[float] = DEFAULT_RATE
+_limiter_burst = DEFAULT_BURST
+_limiter_lock = threading.Lock()
+
+
+def configure_rate_limit(
+    rate: Optional[Union[int, float]] = DEFAULT_RATE, burst: int = DEFAULT_BURST
+):
+    """Set the per-host request rate of this process, None or 0 turns limiting off.
+
+    Hosts start over at the new rate when it changes.
+    """
+    global _limiter, _limiter_rate, _limiter_burst
+    rate = float(rate) if rate else None
+    with _limiter_lock:
+        if (rate, burst) != (_limiter_rate, _limiter_burst):
+            _limiter = None
+        _limiter_rate = rate
+        _limiter_burst = burst
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Return the process-wide rate limiter, or None when limiting is off"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter_rate is None:
+            return None
+        if _limiter is None:
+            _limiter = RateLimiter(_limiter_rate, _limiter_burst)
+        return _limiter
@@ -0,0 +1,172 @@
+import logging
+import re
+from collections import Counter
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+# Third-party hosts that never contribute to the DOM we read
+AD_AND_ANALYTICS_PATTERNS = [
+    r"doubleclick\.net",
+    r"googlesyndication\.com",
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"googletagservices\.com",
+    r"amazon-adsystem\.com",
+    r"adservice\.",
+    r"scorecardresearch\.com",
+    r"taboola\.com",
+    r"outbrain\.com",
+    r"criteo\.",
+    r"chartbeat\.",
+    r"analytics\.yahoo\.com",
+    r"/beacon",
+    r"/rapid/",
+]
+
+
+class ResourceBlockPolicy(BaseModel):
+    """Which requests a page may make while it is being scraped.
+
+    A request is blocked when its resource type or URL matches a deny rule and
+    no allow rule. When ``allowed_resource_types`` is set, every other resource
+    type is denied.
+    """
+
+    name: str = Field(default="custom", description="Name of the policy")
+    blocked_resource_types: list[str] = Field(
+        default_factory=list, description="Playwright resource types to block"
+    )
+    allowed_resource_types: Optional[list[str]] = Field(
+        default=None, description="If set, only these resource types are allowed"
+    )
+    blocked_url_patterns: list[str] = Field(
+        default_factory=list, description="Regular expressions of URLs to block"
+    )
+    allowed_url_patterns: list[str] = Field(
+        default_factory=list,
+        description="Regular expressions of URLs that are never blocked",
+    )
+
+    def model_post_init(self, __context: Any) -> None:
+        self._blocked_url_re = _compile_any(self.blocked_url_patterns)
+        self._allowed_url_re = _compile_any(self.allowed_url_patterns)
+
+    def is_noop(self) -> bool:
+        """Whether the policy lets every request through"""
+        return (
+            self.allowed_resource_types is None
+            and not self.blocked_resource_types
+            and not self.blocked_url_patterns
+        )
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """Decide whether a request of the given type and URL is blocked"""
+        if self._allowed_url_re and self._allowed_url_re.search(url):
+            return False
+        if resource_type == "document":
+            return False
+        if (
+            self.allowed_resource_types is not None
+            and resource_type not in self.allowed_resource_types
+        ):
+            return True
+        if resource_type in self.blocked_resource_types:
+            return True
+        return bool(self._blocked_url_re and self._blocked_url_re.search(url))
+
+
+def _compile_any(patterns: list[str]) -> Optional[re.Pattern[str]]:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+BLOCK_PROFILES: dict[str, ResourceBlockPolicy] = {
+    # Load everything, as a regular browser would
+    "none": ResourceBlockPolicy(name="none"),
+    # Server-rendered HTML only, no subresources at all
+    "dom-only": ResourceBlockPolicy(name="dom-only", allowed_resource_types=[]),
+    # First-party scripts and data requests, no assets, ads or trackers
+    "minimal-js": ResourceBlockPolicy(
+        name="minimal-js",
+        blocked_resource_types=[
+            "image",
+            "media",
+            "font",
+            "stylesheet",
+            "texttrack",
+            "eventsource",
+            "websocket",
+            "manifest",
+            "other",
+        ],
+        blocked_url_patterns=AD_AND_ANALYTICS_PATTERNS,
+    ),
+}
+
+DEFAULT_BLOCK_PROFILE = "minimal-js"
+
+
+def get_block_policy(profile: str) -> ResourceBlockPolicy:
+    """Look up a built-in resource blocking profile by name"""
+    try:
+        return BLOCK_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown resource blocking profile '{profile}', "
+            f"expected one of: {', '.join(BLOCK_PROFILES)}"
+        ) from None
+
+
+class ResourceBlocker:
+    """Applies a policy to pages through request routing and counts the outcome"""
+
+    def __init__(self, policy: ResourceBlockPolicy):
+        self.policy = policy
+        self.blocked = 0
+        self.allowed = 0
+        self.blocked_by_type: Counter[str] = Counter()
+
+    async def _handle_route(self, route: Any):
+        request = route.request
+        resource_type = request.resource_type
+        if self.policy.should_block(resource_type, request.url):
+            self.blocked += 1
+            self.blocked_by_type[resource_type] += 1
+            await route.abort()
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    async def attach(self, page: Any):
+        """Start routing the page's requests through the policy"""
+        if not self.policy.is_noop():
+            await page.route("**/*", self._handle_route)
+
+    async def detach(self, page: Any):
+        """Stop routing the page's requests so it can be reused"""
+        if not self.policy.is_noop():
+            try:
+                await page.unroute("**/*", self._handle_route)
+            except Exception:
+                pass
+
+    def summary(self) -> dict[str, Any]:
+        """Per-run counters of blocked and allowed requests"""
+        return {
+            "profile": self.policy.name,
+            "blocked": self.blocked,
+            "allowed": self.allowed,
+            "blocked_by_type": dict(self.blocked_by_type),
+        }
+
+    def log_summary(self):
+        by_type = ", ".join(
+            f"{resource_type}={count}"
+            for resource_type, count in self.blocked_by_type.most_common()
+        )
+        logging.info(
+            f"Resource blocking ({self.policy.name}): {self.blocked} blocked, "
+            f"{self.allowed} allowed" + (f" ({by_type})" if by_type else "")
+        )
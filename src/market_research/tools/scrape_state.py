@@ -0,0 +1,117 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from market_research.tools.published_dates import parse_iso_datetime
+from market_research.utils.funcs import canonicalize_url, get_cache_dir
+
+# Remember this many article URLs per ticker, newest first
+MAX_SEEN_URLS = 500
+
+
+class ScrapeState:
+    """What was already scraped for a ticker: seen article URLs and a high-water mark"""
+
+    def __init__(
+        self,
+        ticker: str,
+        seen_urls: Optional[list[str]] = None,
+        high_water_mark: Optional[str] = None,
+        last_run_at: Optional[str] = None,
+    ):
+        self.ticker = ticker
+        self.seen_urls = seen_urls or []
+        self.high_water_mark = high_water_mark
+        self.last_run_at = last_run_at
+        self._seen = set(self.seen_urls)
+
+    def is_known(self, url: str, published_at: Optional[str] = None) -> bool:
+        """Whether an article was seen before or is not newer than the high-water mark"""
+        if url and canonicalize_url(url) in self._seen:
+            return True
+        published = parse_iso_datetime(published_at)
+        high_water_mark = parse_iso_datetime(self.high_water_mark)
+        return bool(published and high_water_mark and published <= high_water_mark)
+
+    def update(self, urls: Iterable[str], published_at: Iterable[Optional[str]] = ()):
+        """Record newly scraped article URLs (newest first) and advance the high-water mark"""
+        new_urls = [
+            key
+            for key in (canonicalize_url(url) for url in urls if url)
+            if key not in self._seen
+        ]
+        self.seen_urls = (new_urls + self.seen_urls)[:MAX_SEEN_URLS]
+        self._seen = set(self.seen_urls)
+
+        newest = parse_iso_datetime(self.high_water_mark)
+        for value in published_at:
+            published = parse_iso_datetime(value)
+            if published and (newest is None or published > newest):
+                newest = published
+        self.high_water_mark = newest.isoformat() if newest else None
+        self.last_run_at = datetime.now(timezone.utc).isoformat()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "ticker": self.ticker,
+            "seen_urls": self.seen_urls,
+            "high_water_mark": self.high_water_mark,
+            "last_run_at": self.last_run_at,
+        }
+
+
+class ScrapeStateStore:
+    """Per-ticker scrape state kept as small JSON files"""
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _path(self, ticker: str) -> Path:
+        return self.directory / f"{ticker.upper()}.json"
+
+    def load(self, ticker: str) -> ScrapeState:
+        path = self._path(ticker)
+        try:
+            data = json.loads(path.read_text())
+            if not isinstance(data, dict):
+                raise ValueError("not a JSON object")
+        except FileNotFoundError:
+            return ScrapeState(ticker)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable scrape state {path}: {e}")
+            return ScrapeState(ticker)
+        return ScrapeState(
+            ticker,
+            seen_urls=data.get("seen_urls") or [],
+            high_water_mark=data.get("high_water_mark"),
+            last_run_at=data.get("last_run_at"),
+        )
+
+    def save(self, state: ScrapeState):
+        # Write to a temporary file first so a crash never leaves half a state behind
+        path = self._path(state.ticker)
+        with self._lock:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(state.to_dict(), f)
+            os.replace(tmp, path)
+
+
+_store: Optional[ScrapeStateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_scrape_state_store() -> ScrapeStateStore:
+    """Return the process-wide scrape state store, creating it on first use"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ScrapeStateStore(get_cache_dir() / "state")
+        return _store
@@ -0,0 +1,834 @@
+import asyncio
+import logging
+import os
+import sqlite3
+from collections import deque
+from contextlib import aclosing
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from market_research.tools.article_archive import get_article_archive
+from market_research.tools.article_cache import (
+    ArticleCache,
+    article_cache_refresh,
+    get_article_cache,
+)
+from market_research.tools.articles import (
+    OUTPUT_FORMATS,
+    Article,
+    format_articles,
+)
+from market_research.tools.browser_pool import get_browser_pool
+from market_research.tools.compaction import (
+    DEFAULT_TOKEN_BUDGET,
+    compact_articles,
+    compact_text,
+)
+from market_research.tools.dedup import ArticleDeduplicator
+from market_research.tools.fetch_budget import (
+    LatencyStats,
+    PermanentFetchError,
+    fetch_within_budget,
+    new_fetch_budget,
+)
+from market_research.tools.fetch_strategy import (
+    FETCH_STRATEGIES,
+    FetchStats,
+    fetch_with_fallback,
+    get_http_fetcher,
+)
+from market_research.tools.html_parsing import get_parser_backend
+from market_research.tools.news_stream import scroll_story_items
+from market_research.tools.page_waits import (
+    ARTICLE_WAIT,
+    NEWS_STREAM_WAIT,
+    WaitSpec,
+    WaitStats,
+    get_wait_learner,
+    wait_for_page,
+)
+from market_research.tools.published_dates import parse_iso_datetime
+from market_research.tools.rate_limit import get_rate_limiter, rate_limit_key
+from market_research.tools.resource_blocking import (
+    DEFAULT_BLOCK_PROFILE,
+    ResourceBlocker,
+    get_block_policy,
+)
+from market_research.tools.scrape_state import MAX_SEEN_URLS, get_scrape_state_store
+from market_research.utils.funcs import run_sync
+from market_research.utils.profiling import span
+
+YAHOO_FINANCE_URL = "https://finance.yahoo.com"
+
+# Points the scraper at another host, e.g. the benchmark stand-in server
+BASE_URL_ENV = "MARKET_RESEARCH_YAHOO_URL"
+
+# Streamed articles are added to the archive this many at a time
+ARCHIVE_BATCH = 20
+
+
+class YahooNewsScraperError(RuntimeError):
+    """Raised when news for a ticker cannot be scraped, with a message fit for agents"""
+
+
+class ScrapeRun:
+    """Settings and counters for a single scrape, shared by all of its stages"""
+
+    def __init__(
+        self,
+        resource_profile: str = DEFAULT_BLOCK_PROFILE,
+        fetch_strategy: str = "auto",
+        cache: Optional[ArticleCache] = None,
+        refresh: bool = False,
+    ):
+        if fetch_strategy not in FETCH_STRATEGIES:
+            raise ValueError(
+                f"Unknown fetch strategy '{fetch_strategy}', "
+                f"expected one of: {', '.join(FETCH_STRATEGIES)}"
+            )
+        self.blocker = ResourceBlocker(get_block_policy(resource_profile))
+        self.fetch_strategy = fetch_strategy
+        self.fetch_stats = FetchStats()
+        self.cache = cache
+        # Skip cache reads but still store what was scraped
+        self.refresh = refresh
+        self.dedup = ArticleDeduplicator()
+        self.waits = WaitStats()
+        self.budget = new_fetch_budget()
+        self.latencies = LatencyStats()
+
+    def log_summary(self):
+        self.blocker.log_summary()
+        self.fetch_stats.log_summary()
+        self.waits.log_summary()
+        self.latencies.log_summary()
+        self.dedup.log_summary()
+        limiter = get_rate_limiter()
+        if limiter is not None:
+            limiter.log_summary()
+
+
+class YahooNewsScraper:
+    """Scrapes Yahoo Finance news for a ticker, without depending on crewAI"""
+
+    def __init__(
+        self,
+        parser_backend: str = "auto",
+        since_last: bool = False,
+        base_url: Optional[str] = None,
+    ):
+        self._http = get_http_fetcher()
+        self._parser = get_parser_backend(parser_backend)
+        # Default for since_last when the caller does not ask for it
+        self._since_last = since_last
+        self._base_url = (
+            base_url or os.environ.get(BASE_URL_ENV) or YAHOO_FINANCE_URL
+        ).rstrip("/")
+
+    async def _setup_playwright(self):
+        """Make sure the shared browser pool is running"""
+        with span("browser.setup"):
+            return await get_browser_pool().start()
+
+    async def _scrape_webpage(
+        self,
+        url: str,
+        wait: WaitSpec,
+        timeout: int = 30000,
+        blocker: Optional[ResourceBlocker] = None,
+        wait_stats: Optional[WaitStats] = None,
+    ):
+        """Scrape a webpage using a pooled Playwright page and return the HTML content"""
+        try:
+            # Wait for the host's rate limit before holding a pooled page
+            limiter = get_rate_limiter()
+            if limiter is not None:
+                await limiter.acquire(url)
+            async with get_browser_pool().page() as page:
+                # Skip resources we never read from the DOM
+                if blocker:
+                    await blocker.attach(page)
+                try:
+                    # Navigate to the page
+                    with span("browser.goto"):
+                        response = await page.goto(
+                            url, wait_until="domcontentloaded", timeout=timeout
+                        )
+
+                    # Wait for the expected layout, an alternative one or a settled DOM
+                    await wait_for_page(page, url, wait, stats=wait_stats)
+
+                    # Get the page content
+                    with span("browser.content") as s:
+                        content = await page.content()
+                        s.set(bytes=len(content))
+                    if limiter is not None and response is not None:
+                        limiter.report(
+                            url,
+                            response.status,
+                            content,
+                            response.headers.get("retry-after"),
+                        )
+                    return content
+                finally:
+                    if blocker:
+                        await blocker.detach(page)
+
+        except Exception as e:
+            logging.error(f"Error scraping webpage {url}: {e}")
+            return None
+
+    def _fetch_strategies(
+        self,
+        run: ScrapeRun,
+        fetch_with_browser: Callable[[str], Awaitable[Optional[str]]],
+    ) -> list[tuple[str, Callable[[str], Awaitable[Optional[str]]]]]:
+        """Named fetchers allowed by the run's fetch strategy, cheapest first"""
+        strategies = []
+        if run.fetch_strategy in ("auto", "http"):
+            strategies.append(("http", self._http.fetch))
+        if run.fetch_strategy in ("auto", "browser"):
+            strategies.append(("playwright", fetch_with_browser))
+        return strategies
+
+    async def _fetch_news_stream(self, url: str, run: ScrapeRun) -> Optional[str]:
+        """Load the news stream page, over plain HTTP first when the strategy allows it"""
+
+        async def _fetch_with_browser(url: str) -> Optional[str]:
+            return await self._scrape_webpage(
+                url, NEWS_STREAM_WAIT, blocker=run.blocker, wait_stats=run.waits
+            )
+
+        def _with_story_items(html: str) -> Optional[str]:
+            # A page without story items was not rendered server-side
+            return html if "story-item" in html else None
+
+        return await fetch_with_fallback(
+            url,
+            self._fetch_strategies(run, _fetch_with_browser),
+            _with_story_items,
+            run.fetch_stats,
+        )
+
+    async def _scrape_detailed_page(
+        self, url: str, run: Optional[ScrapeRun] = None
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Scrape detailed article page and return content and title"""
+        run = run or ScrapeRun()
+        try:
+            if run.cache is not None and not run.refresh:
+                with span("cache.get") as s:
+                    cached = run.cache.get(url)
+                    s.set(hits=int(cached is not None))
+                if cached is not None:
+                    run.fetch_stats.record(url, "cache")
+                    return cached
+
+            async def _fetch_with_browser(url: str) -> Optional[str]:
+                return await self._scrape_webpage(
+                    url,
+                    ARTICLE_WAIT,
+                    timeout=15000,
+                    blocker=run.blocker,
+                    wait_stats=run.waits,
+                )
+
+            strategies = self._fetch_strategies(run, _fetch_with_browser)
+
+            async def _attempt() -> Optional[tuple[str, str]]:
+                # Per strategy that ran, whether it served a page without a body
+                without_body: list[bool] = []
+
+                def _tracked(
+                    fetch: Callable[[str], Awaitable[Optional[str]]],
+                ) -> Callable[[str], Awaitable[Optional[str]]]:
+                    async def _fetch(url: str) -> Optional[str]:
+                        without_body.append(False)
+                        return await fetch(url)
+
+                    return _fetch
+
+                def _parse_article(html: str) -> Optional[tuple[str, str]]:
+                    with span("parse.article", bytes=len(html)):
+                        article = self._parser.parse_article(html)
+                    without_body[-1] = article is None
+                    return article
+
+                article = await fetch_with_fallback(
+                    url,
+                    [(name, _tracked(fetch)) for name, fetch in strategies],
+                    _parse_article,
+                    run.fetch_stats,
+                )
+                if article is None and without_body and without_body[-1]:
+                    # Video and gallery pages load fine but never have a body.
+                    # A strategy that returned nothing may still work next time.
+                    raise PermanentFetchError(f"{url} has no article body")
+                return article
+
+            # Deadlines, retries and hedging keep slow pages from holding up the run
+            with span("fetch.article") as s:
+                article = await fetch_within_budget(_attempt, run.budget, run.latencies)
+                s.set(fetched=int(article is not None))
+            if article is None:
+                return None, None
+            if run.cache is not None:
+                run.cache.put(url, *article)
+            return article
+
+        except Exception as e:
+            logging.warning(f"Error scraping detailed page {url}: {e}")
+            return None, None
+
+    async def _scrape_detailed_pages(
+        self,
+        urls: list[str],
+        max_concurrency: int = 5,
+        run: Optional[ScrapeRun] = None,
+    ) -> list[Optional[str]]:
+        """Scrape detailed article pages concurrently and return their contents in order"""
+        run = run or ScrapeRun()
+        # The run deadline covers the detail pages, not the browser launch
+        # and news stream before them
+        run.budget.start()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _scrape_one(url: str) -> Optional[str]:
+            if not url:
+                return None
+            async with semaphore:
+                detailed_content, _ = await self._scrape_detailed_page(url, run)
+                return detailed_content
+
+        with span("scrape.detail_pages", pages=len(urls)):
+            return list(await asyncio.gather(*(_scrape_one(url) for url in urls)))
+
+    def _listing_article(self, ticker: str, story_item: dict[str, str]) -> Article:
+        """Article record of a story item, with its summary as content until the detail page is fetched"""
+        # Build an absolute URL
+        href = story_item["href"]
+        url = ""
+        if href:
+            if not href.startswith("http"):
+                url = f"{self._base_url}{href}"
+            else:
+                url = href
+        return Article(
+            ticker=ticker,
+            title=story_item["title"],
+            url=url,
+            source="Yahoo Finance",
+            published_at=story_item["published_at"],
+            content=story_item["summary"],
+        )
+
+    def _archive(self, articles: list[Article]):
+        """Add the untruncated articles to the searchable archive"""
+        archive = get_article_archive()
+        if archive is None or not articles:
+            return
+        with span("archive.add", articles=len(articles)) as s:
+            try:
+                s.set(indexed=archive.add(articles))
+            except sqlite3.Error as e:
+                logging.warning(f"Could not archive articles: {e}")
+
+    async def _load_news_stream(
+        self, ticker: str, run: ScrapeRun
+    ) -> tuple[str, datetime]:
+        """Fetch the ticker's news stream page and the moment it was fetched"""
+        logging.info(f"Fetching news for ticker: '{ticker}' using Playwright")
+
+        # Setup Playwright, unless pages are only fetched over HTTP
+        if run.fetch_strategy != "http" and not await self._setup_playwright():
+            raise YahooNewsScraperError(
+                "Playwright not available. Install with: playwright install"
+            )
+
+        # Scrape the main news page
+        news_url = f"{self._base_url}/quote/{ticker}/latest-news/"
+        content = await self._fetch_news_stream(news_url, run)
+        # "3 hours ago" on the page is relative to this moment
+        fetched_at = datetime.now(timezone.utc)
+        if not content:
+            raise YahooNewsScraperError(f"Failed to load news page for ticker {ticker}")
+        return content, fetched_at
+
+    async def _list_articles_async(
+        self,
+        ticker: str,
+        max_articles: int = 5,
+        resource_profile: str = DEFAULT_BLOCK_PROFILE,
+        fetch_strategy: str = "auto",
+    ) -> list[Article]:
+        """Newest articles as listed on the news stream, with their summaries as content.
+
+        Only the news stream is loaded. No detail page is fetched and neither
+        the scrape state nor the archive is touched, so listing is cheap and
+        does not change what a later ``since_last`` scrape returns.
+        """
+        ticker = str(ticker).upper().strip()
+        if not ticker:
+            raise YahooNewsScraperError("No ticker symbol provided")
+
+        run = ScrapeRun(resource_profile, fetch_strategy)
+        with span("scrape.listing", ticker=ticker), rate_limit_key(ticker):
+            try:
+                content, fetched_at = await self._load_news_stream(ticker, run)
+                articles = []
+                for story_item in self._parser.iter_story_items(content, fetched_at):
+                    if len(articles) >= max_articles:
+                        break
+                    articles.append(self._listing_article(ticker, story_item))
+                return articles
+            finally:
+                run.log_summary()
+
+    async def _scrape_articles_async(
+        self,
+        ticker: str,
+        max_articles: int = 10,
+        max_content_length: int = 500,
+        max_concurrency: int = 5,
+        resource_profile: str = DEFAULT_BLOCK_PROFILE,
+        fetch_strategy: str = "auto",
+        since_last: bool = False,
+        token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+    ) -> list[Article]:
+        """Async method to scrape Yahoo Finance news into Article records.
+
+        With ``since_last`` the news stream is only scanned up to the first
+        article recorded by an earlier run, so only new articles are fetched.
+        Article contents are compacted to their most informative sentences,
+        at most ``max_content_length`` characters each and ``token_budget``
+        tokens together (None for no total limit).
+        """
+        # Clean up ticker symbol and validate
+        ticker = str(ticker).upper().strip()
+        if not ticker:
+            raise YahooNewsScraperError("No ticker symbol provided")
+
+        run = ScrapeRun(
+            resource_profile,
+            fetch_strategy,
+            cache=get_article_cache(),
+            refresh=article_cache_refresh(),
+        )
+        # Tickers take turns at the rate limit of each host
+        with span("scrape.articles", ticker=ticker), rate_limit_key(ticker):
+            try:
+                content, fetched_at = await self._load_news_stream(ticker, run)
+
+                store = get_scrape_state_store()
+                state = store.load(ticker)
+
+                # Parse the news stream lazily, newest story items first
+                articles = []
+
+                with span("parse.story_items", bytes=len(content)) as s:
+                    for story_item in self._parser.iter_story_items(
+                        content, fetched_at
+                    ):
+                        if len(articles) >= max_articles:
+                            break
+                        article = self._listing_article(ticker, story_item)
+
+                        if since_last and state.is_known(
+                            article.url, article.published_at
+                        ):
+                            logging.info(
+                                f"Reached an article seen in an earlier run, stopping the scan for {ticker}"
+                            )
+                            break
+
+                        # Syndicated stories show up repeatedly, only fetch them once
+                        if run.dedup.check_listing(article.url, article.title):
+                            continue
+
+                        articles.append(article)
+                    s.set(items=len(articles))
+
+                # Fetch detail pages concurrently, keeping story-item order
+                detailed_contents = await self._scrape_detailed_pages(
+                    [article.url for article in articles], max_concurrency, run
+                )
+                unique_articles = []
+                full_articles = []
+                for article, detailed_content in zip(articles, detailed_contents):
+                    # Fallback to summary from main page if detailed content not available
+                    content = detailed_content or article.content
+                    if run.dedup.check_content(article.url, article.title, content):
+                        continue
+                    full_articles.append(replace(article, content=content))
+                    article.content = content
+                    unique_articles.append(article)
+                    logging.info(f"Scraped article: {article.title[:50]}...")
+                articles = unique_articles
+                self._archive(full_articles)
+
+                # Keep the most informative sentences within the run's token budget
+                with span("compact.articles", articles=len(articles)) as s:
+                    before, after = compact_articles(
+                        articles, ticker, token_budget, max_content_length
+                    )
+                    s.set(tokens_before=before, tokens_after=after)
+
+                state.update(
+                    [article.url for article in articles] + run.dedup.dropped_urls,
+                    [article.published_at for article in articles],
+                )
+                store.save(state)
+                return articles
+            finally:
+                if run.waits.outcomes:
+                    get_wait_learner().save()
+                run.log_summary()
+
+    async def _stream_story_items(
+        self,
+        news_url: str,
+        run: ScrapeRun,
+        ticker: str,
+        fetched_at: datetime,
+        max_scrolls: Optional[int] = None,
+    ) -> AsyncIterator[dict[str, str]]:
+        """Story items of the news stream, scrolling it in a browser page for more"""
+        if run.fetch_strategy == "http":
+            # Without a browser nothing loads the stream past its first page
+            content = await self._fetch_news_stream(news_url, run)
+            if not content:
+                raise YahooNewsScraperError(
+                    f"Failed to load news page for ticker {ticker}"
+                )
+            logging.info("Only the first page of the news stream is read over HTTP")
+            for story_item in self._parser.iter_story_items(content, fetched_at):
+                yield story_item
+            return
+
+        limiter = get_rate_limiter()
+        if limiter is not None:
+            with rate_limit_key(ticker):
+                await limiter.acquire(news_url)
+        pool = get_browser_pool()
+        slot, page = await pool.acquire_page()
+        try:
+            await run.blocker.attach(page)
+            with span("browser.goto"):
+                response = await page.goto(
+                    news_url, wait_until="domcontentloaded", timeout=30000
+                )
+            await wait_for_page(page, news_url, NEWS_STREAM_WAIT, stats=run.waits)
+            if limiter is not None and response is not None:
+                # An empty first page means throttling as much as a 429 does
+                limiter.report(
+                    news_url,
+                    response.status,
+                    await page.content(),
+                    response.headers.get("retry-after"),
+                )
+            async for story_item in scroll_story_items(
+                page, self._parser, fetched_at, ticker, max_scrolls
+            ):
+                yield story_item
+        except Exception as e:
+            raise YahooNewsScraperError(
+                f"Failed to stream news for ticker {ticker}: {e}"
+            ) from e
+        finally:
+            # A long scrolled page is not worth keeping warm
+            await pool.release_page(slot, page, reusable=False)
+
+    async def iter_articles(
+        self,
+        ticker: str,
+        max_articles: Optional[int] = 100,
+        since: Optional[datetime] = None,
+        since_last: bool = False,
+        max_content_length: Optional[int] = None,
+        max_concurrency: int = 5,
+        resource_profile: str = DEFAULT_BLOCK_PROFILE,
+        fetch_strategy: str = "auto",
+        max_scrolls: Optional[int] = None,
+    ) -> AsyncIterator[Article]:
+        """Stream a ticker's news as Article records, newest first, for backfills.
+
+        The news stream is scrolled as far as needed and stops after
+        ``max_articles`` articles (None for the whole stream), at the first
+        article published before ``since``, or with ``since_last`` at the
+        first article seen in an earlier scrape. At most ``max_concurrency``
+        detail pages are in flight, and only articles not yet consumed are
+        held, so memory stays flat however far the stream goes. Contents are
+        archived in full and compacted to ``max_content_length`` characters.
+        """
+        ticker = str(ticker).upper().strip()
+        if not ticker:
+            raise YahooNewsScraperError("No ticker symbol provided")
+        if since is not None and since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        run = ScrapeRun(
+            resource_profile,
+            fetch_strategy,
+            cache=get_article_cache(),
+            refresh=article_cache_refresh(),
+        )
+        # A backfill takes as long as the stream goes, its run budget is never
+        # started and only pages have deadlines
+        if run.fetch_strategy != "http" and not await self._setup_playwright():
+            raise YahooNewsScraperError(
+                "Playwright not available. Install with: playwright install"
+            )
+        store = get_scrape_state_store()
+        state = store.load(ticker)
+        news_url = f"{self._base_url}/quote/{ticker}/latest-news/"
+        fetched_at = datetime.now(timezone.utc)
+        logging.info(f"Streaming news for ticker: '{ticker}'")
+
+        async def _detail(url: str) -> Optional[str]:
+            if not url:
+                return None
+            # Runs as its own task, so the key does not leak into the consumer
+            with rate_limit_key(ticker):
+                content, _ = await self._scrape_detailed_page(url, run)
+                return content
+
+        pending: deque[tuple[Article, asyncio.Task]] = deque()
+        to_archive: list[Article] = []
+        # Newest first, as much as the scrape state remembers
+        scraped_urls: list[str] = []
+        published: list[str] = []
+        streamed = 0
+
+        async def _finish(article: Article, task: asyncio.Task) -> Optional[Article]:
+            content = await task or article.content
+            if run.dedup.check_content(article.url, article.title, content):
+                return None
+            to_archive.append(replace(article, content=content))
+            if len(to_archive) >= ARCHIVE_BATCH:
+                self._archive(to_archive)
+                to_archive.clear()
+            article.content = compact_text(
+                content, ticker, article.title, max_chars=max_content_length
+            )
+            if len(scraped_urls) < MAX_SEEN_URLS:
+                scraped_urls.append(article.url)
+            if not published:
+                published.append(article.published_at)
+            return article
+
+        listed = 0
+        story_items = self._stream_story_items(
+            news_url, run, ticker, fetched_at, max_scrolls
+        )
+        try:
+            async with aclosing(story_items):
+                async for story_item in story_items:
+                    article = self._listing_article(ticker, story_item)
+                    published_at = parse_iso_datetime(article.published_at)
+                    if since is not None and published_at and published_at < since:
+                        logging.info(
+                            f"Reached news published before {since.date()}, stopping the stream for {ticker}"
+                        )
+                        break
+                    if since_last and state.is_known(article.url, article.published_at):
+                        logging.info(
+                            f"Reached an article seen in an earlier run, stopping the stream for {ticker}"
+                        )
+                        break
+                    if run.dedup.check_listing(article.url, article.title):
+                        continue
+
+                    listed += 1
+                    pending.append(
+                        (article, asyncio.ensure_future(_detail(article.url)))
+                    )
+                    # Hand out the oldest article before fetching more than the limit
+                    if len(pending) >= max(1, max_concurrency):
+                        article = await _finish(*pending.popleft())
+                        if article is not None:
+                            streamed += 1
+                            yield article
+                    if max_articles is not None and listed >= max_articles:
+                        break
+            while pending:
+                article = await _finish(*pending.popleft())
+                if article is not None:
+                    streamed += 1
+                    yield article
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+            self._archive(to_archive)
+            state.update(scraped_urls + run.dedup.dropped_urls, published)
+            store.save(state)
+            if run.waits.outcomes:
+                get_wait_learner().save()
+            logging.info(f"Streamed {streamed} articles for {ticker}")
+            run.log_summary()
+
+    async def _scrape_news_async(
+        self,
+        ticker: str,
+        max_articles: int = 10,
+        max_content_length: int = 500,
+        max_concurrency: int = 5,
+        resource_profile: str = DEFAULT_BLOCK_PROFILE,
+        fetch_strategy: str = "auto",
+        format: str = "markdown",
+        since_last: bool = False,
+        token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+    ) -> str:
+        """Async method to scrape Yahoo Finance news and format it for agents"""
+        if format not in OUTPUT_FORMATS:
+            return f"Error: Unknown output format '{format}', expected one of: {', '.join(OUTPUT_FORMATS)}"
+        try:
+            articles = await self._scrape_articles_async(
+                ticker,
+                max_articles,
+                max_content_length,
+                max_concurrency,
+                resource_profile,
+                fetch_strategy,
+                since_last,
+                token_budget,
+            )
+            ticker = str(ticker).upper().strip()
+            if not articles and since_last:
+                return f"No new articles found for ticker {ticker} since the last run."
+            if not articles:
+                return f"No news articles found for ticker {ticker}. The page loaded but contained no recognizable news content."
+
+            return format_articles(ticker, articles, format)
+
+        except YahooNewsScraperError as e:
+            return f"Error: {e}"
+        except Exception as e:
+            logging.error(f"Error in async scraping: {e}")
+            return f"Error scraping Yahoo Finance news for ticker {ticker}: {str(e)}"
+
+    def scrape_articles(
+        self,
+        ticker: str,
+        max_articles: int = 5,
+        max_content_length: int = 1000,
+        max_concurrency: int = 5,
+        resource_profile: str = DEFAULT_BLOCK_PROFILE,
+        fetch_strategy: str = "auto",
+        since_last: bool = False,
+        token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+    ) -> list[Article]:
+        """Scrape news and return Article records, raising YahooNewsScraperError on failure"""
+        return run_sync(
+            self._scrape_articles_async(
+                ticker,
+                max_articles,
+                max_content_length,
+                max_concurrency,
+                resource_profile,
+                fetch_strategy,
+                since_last or self._since_last,
+                token_budget,
+            )
+        )
+
+    def list_articles(
+        self,
+        ticker: str,
+        max_articles: int = 5,
+        resource_profile: str = DEFAULT_BLOCK_PROFILE,
+        fetch_strategy: str = "auto",
+    ) -> list[Article]:
+        """List the newest articles without fetching them, raising YahooNewsScraperError on failure"""
+        return run_sync(
+            self._list_articles_async(
+                ticker, max_articles, resource_profile, fetch_strategy
+            )
+        )
+
+    def scrape_news(
+        self,
+        ticker: str,
+        max_articles: int = 5,
+        max_content_length: int = 1000,
+        max_concurrency: int = 5,
+        resource_profile: str = DEFAULT_BLOCK_PROFILE,
+        fetch_strategy: str = "auto",
+        format: str = "markdown",
+        since_last: bool = False,
+        token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+    ) -> str:
+        """Scrape news and format it, returning an error message on failure"""
+        return run_sync(
+            self._scrape_news_async(
+                ticker,
+                max_articles,
+                max_content_length,
+                max_concurrency,
+                resource_profile,
+                fetch_strategy,
+                format,
+                since_last or self._since_last,
+                token_budget,
+            )
+        )
+
+    def backfill(
+        self,
+        ticker: str,
+        sink: Callable[[Article], None],
+        max_articles: Optional[int] = 100,
+        since: Optional[datetime] = None,
+        since_last: bool = False,
+        max_content_length: Optional[int] = None,
+        max_concurrency: int = 5,
+        resource_profile: str = DEFAULT_BLOCK_PROFILE,
+        fetch_strategy: str = "auto",
+        max_scrolls: Optional[int] = None,
+    ) -> int:
+        """Pass streamed articles to ``sink`` as they are scraped and return how many there were"""
+
+        async def _consume() -> int:
+            count = 0
+            articles = self.iter_articles(
+                ticker,
+                max_articles,
+                since,
+                since_last or self._since_last,
+                max_content_length,
+                max_concurrency,
+                resource_profile,
+                fetch_strategy,
+                max_scrolls,
+            )
+            async with aclosing(articles):
+                async for article in articles:
+                    sink(article)
+                    count += 1
+            return count
+
+        return run_sync(_consume())
+
+
+def scrape_yahoo_news(
+    ticker: str,
+    max_articles: int = 10,
+    max_content_length: int = 1000,
+    max_concurrency: int = 5,
+    resource_profile: str = DEFAULT_BLOCK_PROFILE,
+    fetch_strategy: str = "auto",
+    since_last: bool = False,
+    token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+) -> list[Article]:
+    """Convenience function returning Article records for batch jobs and pipelines"""
+    return YahooNewsScraper().scrape_articles(
+        ticker=ticker,
+        max_articles=max_articles,
+        max_content_length=max_content_length,
+        max_concurrency=max_concurrency,
+        resource_profile=resource_profile,
+        fetch_strategy=fetch_strategy,
+        since_last=since_last,
+        token_budget=token_budget,
+    )
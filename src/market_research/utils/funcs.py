@@ -1,20 +1,159 @@
 import asyncio
+import atexit
+import concurrent.futures
 import functools
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Coroutine, Optional, TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+from market_research.utils.profiling import span
 
-def async_to_sync(async_func: Callable[..., Any]) -> Callable[..., Any]:
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """
+    A long-lived event loop running in a daemon thread.
+
+    Sync code submits coroutines with ``run``; async resources such as the
+    browser pool and HTTP sessions live on this loop and are reused across
+    calls. Callbacks registered with ``add_shutdown_callback`` are awaited on
+    the loop before it stops.
     """
-    Convert an async function to a sync function that handles running event loops.
 
-    This wrapper automatically handles:
-    - No event loop: creates one with asyncio.run()
-    - Running event loop: tries nest_asyncio first, then thread pool as fallback
-    - Jupyter/IPython compatibility with nested event loops
+    def __init__(self, name: str = "market-research-loop"):
+        self.name = name
+        self.loop = asyncio.new_event_loop()
+        self._shutdown_callbacks: list[Callable[[], Awaitable[Any]]] = []
+        self._ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_forever, name=name, daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_forever(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def is_running(self) -> bool:
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    def in_loop_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the loop and block until it finishes.
+
+        On timeout, or when the calling thread is interrupted, the coroutine
+        is cancelled on the loop before the exception propagates.
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError(
+                "Cannot block on the background loop from its own thread, await instead"
+            )
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Coroutine did not finish within {timeout}s") from None
+        except BaseException:
+            future.cancel()
+            raise
+
+    def add_shutdown_callback(self, callback: Callable[[], Awaitable[Any]]):
+        """Register an async cleanup function to await on the loop at shutdown"""
+        self._shutdown_callbacks.append(callback)
+
+    async def _cleanup(self):
+        for callback in reversed(self._shutdown_callbacks):
+            try:
+                await callback()
+            except Exception as e:
+                logging.warning(f"Error during background loop shutdown: {e}")
+        self._shutdown_callbacks.clear()
+        tasks = [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.loop.shutdown_asyncgens()
+        await self.loop.shutdown_default_executor()
+
+    def shutdown(self, timeout: float = 10.0):
+        """Run shutdown callbacks, cancel pending tasks and stop the loop"""
+        if not self.is_running():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._cleanup(), self.loop).result(timeout)
+        except Exception as e:
+            logging.warning(f"Background loop did not shut down cleanly: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+
+
+_background_loop: Optional[BackgroundLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Return the process-wide background loop, starting it on first use"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None or not _background_loop.is_running():
+            _background_loop = BackgroundLoop()
+            atexit.register(_background_loop.shutdown)
+        return _background_loop
+
+
+def current_background_loop() -> Optional[BackgroundLoop]:
+    """Return the background loop if the caller is running on it"""
+    runner = _background_loop
+    if runner is not None and runner.in_loop_thread():
+        return runner
+    return None
+
+
+def shutdown_background_loop():
+    """Stop the process-wide background loop if it was started"""
+    global _background_loop
+    with _background_loop_lock:
+        runner, _background_loop = _background_loop, None
+    if runner is not None:
+        runner.shutdown()
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine on the process-wide background loop and return its result"""
+    return get_background_loop().run(coro, timeout)
+
+
+def async_to_sync(
+    async_func: Optional[Callable[..., Coroutine[Any, Any, Any]]] = None,
+    *,
+    timeout: Optional[float] = None,
+) -> Callable[..., Any]:
+    """
+    Convert an async function to a sync function that runs on the background loop.
+
+    Every call is submitted to one long-lived event loop in a daemon thread,
+    so it works the same with or without a running loop in the caller
+    (including Jupyter) and async resources outlive a single call.
 
     Args:
         async_func: The async function to wrap
+        timeout: Optional number of seconds after which the call is cancelled
+            and TimeoutError is raised
 
     Returns:
         A sync version of the async function
@@ -28,42 +167,72 @@ def async_to_sync(async_func: Callable[..., Any]) -> Callable[..., Any]:
 
         # Now you can call it synchronously
         data = fetch_data("https://example.com")
+
+        # Or with a timeout
+        fetch_quickly = async_to_sync(fetch_data.__wrapped__, timeout=5)
     """
 
-    @functools.wraps(async_func)
-    def wrapper(*args, **kwargs):
-        try:
-            # Check if there's a running event loop
-            loop = asyncio.get_running_loop()
+    def decorator(func: Callable[..., Coroutine[Any, Any, Any]]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span("async_to_sync", function=func.__qualname__):
+                return run_sync(func(*args, **kwargs), timeout=timeout)
 
-            # Try to enable nested event loops for Jupyter compatibility
-            try:
-                import nest_asyncio
-
-                nest_asyncio.apply()
-                # With nest_asyncio, we can run async code directly in Jupyter
-                return loop.run_until_complete(async_func(*args, **kwargs))
-            except ImportError:
-                # nest_asyncio not available, fall back to thread pool approach
-                pass
-
-            # If we get here, there's a running loop - use thread pool
-            def run_in_thread():
-                # Create new loop in thread
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    return new_loop.run_until_complete(async_func(*args, **kwargs))
-                finally:
-                    new_loop.close()
-                    asyncio.set_event_loop(None)
-
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(run_in_thread)
-                return future.result()
-
-        except RuntimeError:
-            # No event loop running - use asyncio.run
-            return asyncio.run(async_func(*args, **kwargs))
-
-    return wrapper
+        return wrapper
+
+    if async_func is not None:
+        return decorator(async_func)
+    return decorator
+
+
+TRACKING_PARAMS = {
+    "guccounter",
+    "guce_referrer",
+    "guce_referrer_sig",
+    "ncid",
+    "soc_src",
+    "soc_trk",
+    "tsrc",
+    ".tsrc",
+    "fr",
+    "yptr",
+    "gclid",
+    "fbclid",
+    "mc_cid",
+    "mc_eid",
+    "cmpid",
+}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so that the same article always maps to the same key.
+
+    Lowercases the scheme and host, drops fragments, tracking parameters
+    (``utm_*`` and the ones in ``TRACKING_PARAMS``) and trailing slashes, and
+    sorts the remaining query parameters.
+
+    Example:
+        canonicalize_url("https://Finance.Yahoo.com/news/x.html?utm_source=tw#top")
+        # -> "https://finance.yahoo.com/news/x.html"
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), "")
+    )
+
+
+def get_cache_dir() -> Path:
+    """Directory for local caches and state, overridable with MARKET_RESEARCH_CACHE_DIR"""
+    path = Path(
+        os.environ.get("MARKET_RESEARCH_CACHE_DIR")
+        or Path.home() / ".cache" / "market_research"
+    )
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -0,0 +1,207 @@
+import contextvars
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Optional, Union
+
+# Name of the innermost open span, so nested spans know their parent
+_current_span: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+def _format_attribute(value: Any) -> str:
+    """Summed attributes are floats, counts such as bytes print without decimals"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+class Profiler:
+    """Collects timed spans of a run and summarizes them per stage"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        name: str,
+        duration: float,
+        start: Optional[float] = None,
+        parent: Optional[str] = None,
+        **attrs: Any,
+    ):
+        """Add a finished span; ``start`` is a perf_counter() value"""
+        if start is None:
+            start = time.perf_counter() - duration
+        entry = {
+            "name": name,
+            "start": round(start - self.origin, 6),
+            "duration": round(duration, 6),
+            "parent": parent,
+            "thread": threading.current_thread().name,
+        }
+        if attrs:
+            entry["attrs"] = attrs
+        with self._lock:
+            self.spans.append(entry)
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Per span name: count, total/mean/max seconds and summed numeric attributes"""
+        with self._lock:
+            spans = list(self.spans)
+        stages: dict[str, dict[str, Any]] = {}
+        totals: dict[str, defaultdict[str, float]] = {}
+        for entry in spans:
+            stage = stages.setdefault(
+                entry["name"],
+                {"stage": entry["name"], "count": 0, "total": 0.0, "max": 0.0},
+            )
+            stage["count"] += 1
+            stage["total"] += entry["duration"]
+            stage["max"] = max(stage["max"], entry["duration"])
+            for key, value in entry.get("attrs", {}).items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    totals.setdefault(entry["name"], defaultdict(float))[key] += value
+        for name, stage in stages.items():
+            stage["mean"] = stage["total"] / stage["count"]
+            stage.update(totals.get(name, {}))
+        return sorted(stages.values(), key=lambda stage: -stage["total"])
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            spans = list(self.spans)
+        return {
+            "wall_seconds": round(time.perf_counter() - self.origin, 6),
+            "summary": self.summary(),
+            "spans": spans,
+        }
+
+    def write(self, path: Union[str, Path]):
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2, default=str))
+
+    def format_table(self) -> str:
+        """Readable per-stage summary, slowest stages first"""
+        summary = self.summary()
+        extra = sorted(
+            {
+                key
+                for stage in summary
+                for key in stage
+                if key not in ("stage", "count", "total", "max", "mean")
+            }
+        )
+        headers = ["stage", "count", "total s", "mean s", "max s"] + extra
+        rows = [
+            [
+                stage["stage"],
+                str(stage["count"]),
+                f"{stage['total']:.3f}",
+                f"{stage['mean']:.3f}",
+                f"{stage['max']:.3f}",
+            ]
+            + [_format_attribute(stage[key]) if key in stage else "" for key in extra]
+            for stage in summary
+        ]
+        widths = [
+            max(len(row[i]) for row in [headers] + rows) for i in range(len(headers))
+        ]
+        lines = [
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in [headers] + rows
+        ]
+        lines.insert(1, "  ".join("-" * width for width in widths))
+        return "\n".join(lines)
+
+
+class Span:
+    """Times a block and records it on exit; ``set`` adds attributes such as bytes"""
+
+    __slots__ = ("profiler", "name", "attrs", "start", "parent", "_token")
+
+    def __init__(self, profiler: Profiler, name: str, attrs: dict[str, Any]):
+        self.profiler = profiler
+        self.name = name
+        self.attrs = attrs
+        self.start = 0.0
+        self.parent: Optional[str] = None
+        self._token: Optional[contextvars.Token] = None
+
+    def set(self, **attrs: Any):
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        self.parent = _current_span.get()
+        self._token = _current_span.set(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        duration = time.perf_counter() - self.start
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # Exited in another context, e.g. across an await in a new task
+                pass
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.profiler.record(
+            self.name, duration, start=self.start, parent=self.parent, **self.attrs
+        )
+        return False
+
+
+class _NullSpan:
+    """Stand-in returned while profiling is off, so spans cost one global lookup"""
+
+    __slots__ = ()
+
+    def set(self, **attrs: Any):
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+_profiler: Optional[Profiler] = None
+
+
+def span(name: str, **attrs: Any) -> Union[Span, _NullSpan]:
+    """Time a block as a named stage when profiling is enabled.
+
+    Example:
+        with span("browser.goto", url=url) as s:
+            html = await page.content()
+            s.set(bytes=len(html))
+    """
+    profiler = _profiler
+    if profiler is None:
+        return _NULL_SPAN
+    return Span(profiler, name, attrs)
+
+
+def enable_profiling() -> Profiler:
+    """Start collecting spans for this process and return the profiler"""
+    global _profiler
+    _profiler = Profiler()
+    return _profiler
+
+
+def disable_profiling() -> Optional[Profiler]:
+    """Stop collecting spans and return what was collected"""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    return _profiler
@@ -0,0 +1,44 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from benchmarks.fixtures import article_page, news_stream_page
+from benchmarks.server import StandInServer
+from market_research.tools.fetch_budget import configure_fetch_budget
+from market_research.tools.rate_limit import configure_rate_limit
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Caches and scrape state of each test live in its own directory"""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("MARKET_RESEARCH_CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def process_settings() -> Iterator[None]:
+    # The process-wide limiter would carry throttling from one test to the next
+    configure_rate_limit(None)
+    configure_fetch_budget()
+    yield
+    configure_rate_limit(None)
+    configure_fetch_budget()
+
+
+@pytest.fixture
+def pages_dir(tmp_path: Path) -> Path:
+    """Saved news stream and article pages, as recorded from the live site"""
+    path = tmp_path / "pages"
+    path.mkdir()
+    (path / "latest-news.html").write_text(news_stream_page("AAPL", n_items=5))
+    for index in range(2):
+        (path / f"article-{index}.html").write_text(article_page(index))
+    return path
+
+
+@pytest.fixture
+def server(pages_dir: Path) -> Iterator[StandInServer]:
+    with StandInServer(pages_dir=pages_dir) as server:
+        yield server
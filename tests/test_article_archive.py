@@ -0,0 +1,160 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from market_research.tools.article_archive import (
+    ArticleArchive,
+    configure_article_archive,
+    get_article_archive,
+    split_passages,
+    tokenize,
+)
+from market_research.tools.article_search import ArticleSearchTool
+from market_research.tools.articles import Article
+
+NUCLEAR = (
+    "Talen Energy signed a power purchase agreement with Amazon for nuclear "
+    "capacity from the Susquehanna plant, and analysts raised their targets."
+)
+IPHONE = (
+    "Apple unveiled a new iPhone lineup with a faster chip and longer battery "
+    "life, and said iPhone demand in China recovered in the quarter."
+)
+EARNINGS = (
+    "Apple reported quarterly revenue of 90 billion dollars, with services "
+    "growing faster than iPhone sales and margins above expectations."
+)
+
+
+def _article(
+    ticker: str,
+    index: int,
+    content: str,
+    title: str = "",
+    published_at: str = "2026-10-01T14:00:00+00:00",
+) -> Article:
+    return Article(
+        ticker=ticker,
+        title=title or f"Story {index}",
+        url=f"https://finance.yahoo.com/news/story-{index}.html",
+        source="Reuters",
+        published_at=published_at,
+        content=content,
+    )
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Iterator[ArticleArchive]:
+    archive = ArticleArchive(tmp_path / "archive.sqlite3")
+    yield archive
+    archive.close()
+
+
+def test_tokenize_drops_stopwords_and_single_letters():
+    assert tokenize("The CEO said a 5 year plan is on track") == [
+        "ceo",
+        "5",
+        "year",
+        "plan",
+        "track",
+    ]
+
+
+def test_short_last_passage_is_folded_in():
+    text = " ".join(f"w{i}" for i in range(88))
+
+    passages = split_passages(text, words=40)
+
+    assert [len(passage.split()) for passage in passages] == [40, 48]
+    assert " ".join(passages) == text
+
+
+def test_readding_an_article_adds_no_duplicates(archive: ArticleArchive):
+    article = _article("AAPL", 1, IPHONE)
+
+    assert archive.add([article]) == 1
+    assert archive.add([article]) == 0
+    # The same story behind a tracking link is the same article
+    article.url += "?utm_source=twitter"
+    assert archive.add([article]) == 0
+
+    assert archive.stats()["articles"] == 1
+    assert len(archive.search("iphone demand")) == 1
+
+
+def test_changed_article_replaces_its_passages(archive: ArticleArchive):
+    archive.add([_article("AAPL", 1, IPHONE)])
+
+    assert archive.add([_article("AAPL", 1, EARNINGS)]) == 1
+
+    assert archive.stats() == {"articles": 1, "passages": 1, "tickers": 1, "days": 1}
+    assert archive.search("battery chip") == []
+    assert [hit.text for hit in archive.search("revenue")] == [EARNINGS]
+
+
+def test_results_are_ranked_by_query_terms(archive: ArticleArchive):
+    archive.add(
+        [
+            _article("AAPL", 1, IPHONE),
+            _article("AAPL", 2, EARNINGS),
+            _article("AAPL", 3, NUCLEAR),
+        ]
+    )
+
+    hits = archive.search("iphone china demand")
+
+    assert [hit.text for hit in hits] == [IPHONE, EARNINGS]
+    assert hits[0].score > hits[1].score
+    assert archive.search("the and of") == []
+    assert len(archive.search("iphone", top_k=1)) == 1
+
+
+def test_search_is_filtered_by_ticker_and_day(archive: ArticleArchive):
+    archive.add(
+        [
+            _article("AAPL", 1, IPHONE, published_at="2026-09-01T14:00:00+00:00"),
+            _article("AAPL", 2, EARNINGS),
+            _article("TLN", 3, NUCLEAR + " Apple is a likely buyer."),
+        ]
+    )
+
+    assert {hit.ticker for hit in archive.search("apple")} == {"AAPL", "TLN"}
+    assert {hit.ticker for hit in archive.search("apple", ticker="tln")} == {"TLN"}
+    assert archive.search("nuclear", ticker="AAPL") == []
+    assert [
+        hit.text for hit in archive.search("apple", "AAPL", since="2026-09-15")
+    ] == [EARNINGS]
+    assert [hit.day for hit in archive.search("apple", "AAPL", until="2026-09-01")] == [
+        "2026-09-01"
+    ]
+
+
+def test_fingerprint_changes_only_with_the_content(archive: ArticleArchive):
+    empty = archive.fingerprint("AAPL")
+    archive.add([_article("AAPL", 1, IPHONE)])
+    added = archive.fingerprint("AAPL")
+
+    archive.add([_article("AAPL", 1, IPHONE)])
+    archive.add([_article("TLN", 2, NUCLEAR)])
+    assert archive.fingerprint("aapl") == added != empty
+
+    archive.add([_article("AAPL", 1, EARNINGS)])
+    assert archive.fingerprint("AAPL") != added
+
+
+def test_search_tool_reads_the_configured_archive(tmp_path: Path):
+    configure_article_archive(directory=tmp_path / "archive")
+    try:
+        archive = get_article_archive()
+        assert archive is not None
+        archive.add([_article("AAPL", 1, IPHONE), _article("TLN", 2, NUCLEAR)])
+
+        found = ArticleSearchTool()._run(query="iphone", ticker="AAPL")
+        missing = ArticleSearchTool()._run(query="iphone", ticker="TLN")
+    finally:
+        configure_article_archive(directory=tmp_path / "closed")
+
+    assert "**Story 1** (AAPL, 2026-10-01)" in found
+    assert "Link: https://finance.yahoo.com/news/story-1.html" in found
+    assert missing == "No archived news passages match 'iphone'."
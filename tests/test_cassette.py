@@ -0,0 +1,167 @@
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from market_research.tools.cassette import (
+    Cassette,
+    CassetteMissError,
+    configure_cassette,
+    get_cassette,
+    recorded,
+)
+
+
+class NewsTool:
+    name = "news"
+
+    def __init__(self, failures: int = 0):
+        self.calls = 0
+        self.failures = failures
+
+    @recorded(match_on=("ticker",), failure_prefixes=("Error",))
+    def _run(self, ticker: str, max_articles: int = 5) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            return f"Error scraping news for {ticker}: timeout"
+        return f"{max_articles} articles about {ticker} (call {self.calls})"
+
+
+@pytest.fixture
+def cassette_path(tmp_path: Path) -> Iterator[Path]:
+    yield tmp_path / "cassette.json"
+    configure_cassette(None)
+
+
+def test_record_then_replay(cassette_path: Path):
+    cassette = Cassette(cassette_path, "record")
+    calls = []
+
+    def _call():
+        calls.append(1)
+        return "output"
+
+    assert cassette.play("news", {"ticker": "AAPL"}, _call) == "output"
+    assert cassette.play("news", {"ticker": "AAPL"}, _call) == "output"
+    assert len(calls) == 1
+    assert (cassette.recorded, cassette.replayed) == (1, 1)
+
+    replay = Cassette(cassette_path, "replay")
+    assert replay.play("news", {"ticker": "AAPL"}, _call) == "output"
+    assert len(calls) == 1
+    assert json.loads(cassette_path.read_text())["interactions"][0]["inputs"] == {
+        "ticker": "AAPL"
+    }
+
+
+def test_replay_falls_back_to_matching_inputs(cassette_path: Path):
+    cassette = Cassette(cassette_path, "record")
+    cassette.play("news", {"ticker": "AAPL", "max_articles": 5}, lambda: "five")
+    cassette.play("news", {"ticker": "AAPL", "max_articles": 8}, lambda: "eight")
+
+    replay = Cassette(cassette_path, "replay")
+
+    assert (
+        replay.play(
+            "news", {"ticker": "AAPL", "max_articles": 3}, lambda: "", ("ticker",)
+        )
+        == "eight"
+    )
+    with pytest.raises(CassetteMissError):
+        replay.play(
+            "news", {"ticker": "TSLA", "max_articles": 3}, lambda: "", ("ticker",)
+        )
+    with pytest.raises(CassetteMissError):
+        replay.play("news", {"ticker": "AAPL", "max_articles": 3}, lambda: "")
+
+
+def test_replay_needs_an_existing_cassette(cassette_path: Path):
+    with pytest.raises(FileNotFoundError):
+        Cassette(cassette_path, "replay")
+
+
+def test_unreadable_cassette(cassette_path: Path):
+    cassette_path.write_text("{not json")
+
+    with pytest.raises(ValueError, match="Unreadable cassette"):
+        Cassette(cassette_path, "record")
+
+
+def test_unknown_mode(cassette_path: Path):
+    with pytest.raises(ValueError, match="Unknown cassette mode"):
+        Cassette(cassette_path, "rewind")
+
+
+def test_tools_run_for_real_without_a_cassette():
+    tool = NewsTool()
+
+    tool._run("AAPL")
+    tool._run("AAPL")
+
+    assert get_cassette() is None
+    assert tool.calls == 2
+
+
+def test_recorded_tool_keys_inputs_with_defaults(cassette_path: Path):
+    configure_cassette(cassette_path, "record")
+    tool = NewsTool()
+
+    first = tool._run("AAPL")
+
+    assert tool._run("AAPL", max_articles=5) == first
+    assert tool._run(ticker="AAPL") == first
+    assert tool.calls == 1
+
+
+def test_replay_miss_is_returned_to_the_agent(cassette_path: Path):
+    configure_cassette(cassette_path, "record")
+    NewsTool()._run("AAPL")
+    configure_cassette(cassette_path, "replay")
+    tool = NewsTool()
+
+    assert tool._run("AAPL", max_articles=9) == "5 articles about AAPL (call 1)"
+    assert tool._run("TSLA").startswith("Error: No recording of news")
+    assert tool.calls == 0
+
+
+def test_failed_calls_are_not_recorded(cassette_path: Path):
+    configure_cassette(cassette_path, "record")
+    tool = NewsTool(failures=1)
+
+    # First iteration hits a transient failure, the next one scrapes again
+    assert tool._run("AAPL").startswith("Error scraping")
+    assert tool._run("AAPL") == "5 articles about AAPL (call 2)"
+    assert tool._run("AAPL") == "5 articles about AAPL (call 2)"
+    assert tool.calls == 2
+
+    cassette = get_cassette()
+    assert cassette is not None
+    assert (cassette.recorded, cassette.failed) == (1, 1)
+    outputs = [
+        item["output"] for item in json.loads(cassette_path.read_text())["interactions"]
+    ]
+    assert outputs == ["5 articles about AAPL (call 2)"]
+
+
+def test_scraper_replay_keeps_format_and_size(cassette_path: Path):
+    from market_research.tools.yahoo_news_scraper import YahooNewsScraperTool
+
+    tool = YahooNewsScraperTool()
+
+    def _scrape_news(ticker, max_articles, *args):
+        return f"{args[-3]} with {max_articles} articles about {ticker}"
+
+    tool._scraper.scrape_news = _scrape_news
+    configure_cassette(cassette_path, "record")
+    tool._run("AAPL", max_articles=5, max_concurrency=5)
+    configure_cassette(cassette_path, "replay")
+
+    # Only the concurrency differs, so the recording still fits
+    assert (
+        tool._run("AAPL", max_articles=5, max_concurrency=2)
+        == "markdown with 5 articles about AAPL"
+    )
+    assert tool._run("AAPL", max_articles=5, format="json").startswith("Error:")
+    assert tool._run("AAPL", max_articles=10).startswith("Error:")
+    assert tool._run("AAPL", max_articles=5, since_last=True).startswith("Error:")
@@ -0,0 +1,115 @@
+from typing import Optional
+
+import pytest
+
+from market_research.tools.articles import Article
+from market_research.tools.compaction import (
+    compact_articles,
+    compact_text,
+    estimate_tokens,
+    split_sentences,
+)
+
+DISCLAIMER = "The views and opinions expressed herein are the views of the author."
+
+
+def _text(index: int, sentences: int) -> str:
+    return " ".join(
+        f"Analysts at firm {index} said the quarter number {n} brought steady growth for the whole sector."
+        for n in range(sentences)
+    )
+
+
+def _article(index: int, content: str) -> Article:
+    return Article(
+        ticker="AAPL",
+        title=f"Story {index}",
+        url=f"https://finance.yahoo.com/news/story-{index}.html",
+        source="Reuters",
+        published_at="2024-05-02T10:00:00+00:00",
+        content=content,
+    )
+
+
+def _tokens(articles: list[Article]) -> int:
+    return sum(estimate_tokens(article.content) for article in articles)
+
+
+def test_split_sentences_keeps_abbreviations_and_decimals():
+    text = "Apple Inc. rose 2.5% on Friday. Mr. Cook said sales grew. Shares hit $190."
+
+    assert split_sentences(text) == [
+        "Apple Inc. rose 2.5% on Friday.",
+        "Mr. Cook said sales grew.",
+        "Shares hit $190.",
+    ]
+
+
+@pytest.mark.parametrize("budget", [40, 150, 400])
+def test_articles_fit_the_budget(budget: int):
+    articles = [_article(index, _text(index, 30)) for index in range(5)]
+
+    before, after = compact_articles(articles, "AAPL", budget)
+
+    assert before > budget
+    assert after == _tokens(articles)
+    assert after <= budget
+    assert all(article.content for article in articles)
+
+
+def test_short_articles_leave_their_share_to_long_ones():
+    short = _text(0, 1)
+    articles = [_article(0, short), _article(1, _text(1, 60))]
+
+    compact_articles(articles, "AAPL", 400)
+
+    # An even split would give the long article 200 tokens
+    assert articles[0].content == short
+    assert estimate_tokens(articles[1].content) > 300
+    assert _tokens(articles) <= 400
+
+
+@pytest.mark.parametrize("budget", [None, 0])
+def test_no_budget_keeps_the_whole_content(budget: Optional[int]):
+    texts = [_text(index, 30) for index in range(3)]
+    articles = [_article(index, text) for index, text in enumerate(texts)]
+
+    before, after = compact_articles(articles, "AAPL", budget)
+
+    assert before == after
+    assert [article.content for article in articles] == texts
+
+
+@pytest.mark.parametrize("budget", [None, 0, 1000])
+def test_max_content_length_caps_every_article(budget: Optional[int]):
+    articles = [_article(index, _text(index, 30)) for index in range(3)]
+
+    compact_articles(articles, "AAPL", budget, max_content_length=300)
+
+    assert all(0 < len(article.content) <= 300 for article in articles)
+
+
+def test_shared_disclaimers_are_dropped():
+    articles = [
+        _article(index, f"{_text(index, 3)} {DISCLAIMER}") for index in range(2)
+    ]
+
+    compact_articles(articles, "AAPL", None)
+
+    assert all(DISCLAIMER not in article.content for article in articles)
+
+
+def test_compact_text_keeps_the_informative_sentences_in_order():
+    text = (
+        "The weather in the city was pleasant for most of the week. "
+        "AAPL shares rose 4% to $190 after Apple reported revenue of $90 billion. "
+        "Many people went outside to enjoy the sunshine in the park. "
+        "Apple said iPhone sales in China fell 8% from a year earlier."
+    )
+
+    compacted = compact_text(text, "AAPL", "Apple revenue beats", max_tokens=40)
+
+    assert compacted == (
+        "AAPL shares rose 4% to $190 after Apple reported revenue of $90 billion. "
+        "Apple said iPhone sales in China fell 8% from a year earlier."
+    )
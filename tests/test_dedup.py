@@ -0,0 +1,97 @@
+from benchmarks.fixtures import article_page
+from market_research.tools.dedup import (
+    ArticleDeduplicator,
+    hamming_distance,
+    shingles,
+    simhash,
+    tokenize,
+)
+from market_research.tools.html_parsing import get_parser_backend
+
+BODY = (
+    "Talen Energy shares rose 6% on Tuesday after the company signed a 20 year "
+    "power purchase agreement with Amazon for 1.92 gigawatts of nuclear capacity "
+    "from the Susquehanna plant, analysts said the deal sets a price floor for "
+    "nuclear power sold to data centers and raised their price targets"
+)
+
+
+def test_shingles_of_short_text_is_the_whole_text():
+    assert shingles(["a", "b"], 3) == ["a b"]
+    assert shingles([], 3) == []
+    assert shingles(["a", "b", "c", "d"], 3) == ["a b c", "b c d"]
+
+
+def test_simhash_of_similar_texts_is_close():
+    edited = BODY.replace("rose 6%", "rose 6.2%")
+    other = "Apple unveiled a new iPhone lineup with a faster chip and longer battery life at its autumn event in Cupertino"
+
+    close = hamming_distance(
+        simhash(shingles(tokenize(BODY), 3)), simhash(shingles(tokenize(edited), 3))
+    )
+    far = hamming_distance(
+        simhash(shingles(tokenize(BODY), 3)), simhash(shingles(tokenize(other), 3))
+    )
+    assert close < far
+
+
+def test_same_url_after_canonicalization_is_a_duplicate():
+    dedup = ArticleDeduplicator()
+
+    assert dedup.check_listing("https://finance.yahoo.com/news/a.html", "One") is None
+    assert (
+        dedup.check_listing(
+            "https://Finance.Yahoo.com/news/a.html/?utm_source=twitter#top", "Two"
+        )
+        == "url"
+    )
+    assert dedup.dropped_urls == [
+        "https://Finance.Yahoo.com/news/a.html/?utm_source=twitter#top"
+    ]
+
+
+def test_near_identical_titles_are_duplicates():
+    dedup = ArticleDeduplicator()
+    title = "Talen Energy signs nuclear power deal with Amazon for data centers"
+
+    assert dedup.check_listing("https://a.example/1", title) is None
+    assert dedup.check_listing("https://b.example/2", title.upper() + "!") == "title"
+    assert (
+        dedup.check_listing(
+            "https://c.example/3",
+            "Talen Energy signs nuclear power deal with Amazon for its data centers",
+        )
+        == "title"
+    )
+    assert (
+        dedup.check_listing(
+            "https://d.example/4", "Apple unveils new iPhone lineup at autumn event"
+        )
+        is None
+    )
+    assert dedup.summary() == {"dropped": 2, "by_reason": {"title": 2}}
+
+
+def test_syndicated_content_is_a_duplicate():
+    dedup = ArticleDeduplicator()
+    body, _ = get_parser_backend("bs4").parse_article(article_page(0))
+    other, _ = get_parser_backend("bs4").parse_article(article_page(1))
+
+    assert dedup.check_content("https://a.example/1", "Reuters", body) is None
+    assert (
+        dedup.check_content(
+            "https://b.example/2",
+            "Syndicated",
+            f"(Reuters) - {body} Reporting by Reuters",
+        )
+        == "content"
+    )
+    assert dedup.check_content("https://c.example/3", "Other", other) is None
+    assert dedup.summary() == {"dropped": 1, "by_reason": {"content": 1}}
+
+
+def test_short_bodies_are_never_duplicates():
+    dedup = ArticleDeduplicator()
+
+    assert dedup.check_content("https://a.example/1", "A", "Read more") is None
+    assert dedup.check_content("https://b.example/2", "B", "Read more") is None
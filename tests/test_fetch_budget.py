@@ -0,0 +1,205 @@
+import asyncio
+import time
+from typing import Optional
+
+import pytest
+
+from market_research.tools.fetch_budget import (
+    BACKOFF_MAX,
+    MIN_HEDGE_DELAY,
+    MIN_HEDGE_SAMPLES,
+    FetchBudget,
+    LatencyHistory,
+    LatencyStats,
+    PermanentFetchError,
+    configure_fetch_budget,
+    fetch_within_budget,
+    new_fetch_budget,
+    percentile,
+)
+
+
+class FlakyFetch:
+    """Fetch attempt that plays back a list of (delay, result) pairs"""
+
+    def __init__(self, *attempts: tuple[float, object]):
+        self.attempts = list(attempts)
+        self.calls = 0
+
+    async def __call__(self) -> Optional[str]:
+        delay, result = self.attempts[min(self.calls, len(self.attempts) - 1)]
+        self.calls += 1
+        await asyncio.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _fetch(
+    fetch: FlakyFetch, budget: FetchBudget, history: Optional[LatencyHistory] = None
+) -> tuple[Optional[str], LatencyStats]:
+    stats = LatencyStats()
+    result = asyncio.run(
+        fetch_within_budget(fetch, budget, stats, history or LatencyHistory())
+    )
+    return result, stats
+
+
+def test_percentile():
+    samples = [float(i) for i in range(1, 101)]
+
+    assert percentile(samples, 0.5) == 51.0
+    assert percentile(samples, 0.95) == 95.0
+    assert percentile(samples, 1.0) == 100.0
+    assert percentile([3.0], 0.99) == 3.0
+
+
+def test_hedge_delay_needs_enough_history():
+    history = LatencyHistory()
+    for _ in range(MIN_HEDGE_SAMPLES - 1):
+        history.add(0.2)
+    assert history.hedge_delay() is None
+
+    history.add(0.2)
+    assert history.hedge_delay() == 0.2
+
+    fast = LatencyHistory()
+    for _ in range(MIN_HEDGE_SAMPLES):
+        fast.add(0.001)
+    assert fast.hedge_delay() == MIN_HEDGE_DELAY
+
+
+def test_run_deadline_only_counts_once_started():
+    budget = FetchBudget(article_deadline=10.0, run_deadline=1.0)
+    assert budget.ends_at(100.0) == 110.0
+
+    budget.start()
+    assert budget.run_ends_at is not None
+    assert budget.ends_at(time.monotonic()) == budget.run_ends_at
+
+    unlimited = FetchBudget(article_deadline=None, run_deadline=None)
+    unlimited.start()
+    assert unlimited.ends_at(100.0) is None
+
+
+def test_backoff_is_jittered_and_capped():
+    delays = [FetchBudget.backoff(retry) for retry in range(10) for _ in range(20)]
+
+    assert all(0 <= delay <= BACKOFF_MAX for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_first_success_is_returned():
+    fetch = FlakyFetch((0, "page"))
+
+    result, stats = _fetch(fetch, FetchBudget(retries=2))
+
+    assert result == "page"
+    assert fetch.calls == 1
+    assert stats.outcomes == {"ok": 1}
+    assert stats.retries == 0
+
+
+def test_failures_are_retried():
+    fetch = FlakyFetch((0, None), (0, RuntimeError("reset")), (0, "page"))
+
+    result, stats = _fetch(fetch, FetchBudget(retries=2))
+
+    assert result == "page"
+    assert fetch.calls == 3
+    assert stats.retries == 2
+    assert stats.outcomes == {"ok": 1}
+
+
+def test_gives_up_after_the_retries():
+    fetch = FlakyFetch((0, None))
+
+    result, stats = _fetch(fetch, FetchBudget(retries=1))
+
+    assert result is None
+    assert fetch.calls == 2
+    assert stats.outcomes == {"failed": 1}
+
+
+def test_permanent_errors_are_not_retried():
+    fetch = FlakyFetch((0, PermanentFetchError("no article body")), (0, "page"))
+
+    result, stats = _fetch(fetch, FetchBudget(retries=3))
+
+    assert result is None
+    assert fetch.calls == 1
+    assert stats.outcomes == {"failed": 1}
+
+
+def test_slow_pages_hit_the_article_deadline():
+    fetch = FlakyFetch((5, "page"))
+
+    start = time.monotonic()
+    result, stats = _fetch(fetch, FetchBudget(article_deadline=0.2, retries=3))
+
+    assert result is None
+    assert time.monotonic() - start < 1
+    assert stats.outcomes == {"deadline": 1}
+
+
+def test_spent_run_deadline_stops_fetching():
+    budget = FetchBudget(run_deadline=0.01)
+    budget.start()
+    time.sleep(0.02)
+    fetch = FlakyFetch((0, "page"))
+
+    result, stats = _fetch(fetch, budget)
+
+    assert result is None
+    assert fetch.calls == 0
+    assert stats.outcomes == {"deadline": 1}
+
+
+def test_slow_attempt_is_hedged():
+    history = LatencyHistory()
+    for _ in range(MIN_HEDGE_SAMPLES):
+        history.add(0.05)
+    fetch = FlakyFetch((5, "slow"), (0, "hedge"))
+
+    start = time.monotonic()
+    result, stats = _fetch(fetch, FetchBudget(hedge=True), history)
+
+    assert result == "hedge"
+    assert time.monotonic() - start < 1
+    assert stats.hedges == 1
+    assert stats.hedge_wins == 1
+
+
+def test_no_hedge_without_history():
+    fetch = FlakyFetch((0.2, "page"), (0, "hedge"))
+
+    result, stats = _fetch(fetch, FetchBudget(hedge=True))
+
+    assert result == "page"
+    assert fetch.calls == 1
+    assert stats.hedges == 0
+
+
+def test_latency_stats_summary():
+    stats = LatencyStats()
+    for seconds in (0.1, 0.2, 0.3, 2.0):
+        stats.record(seconds, "ok")
+    stats.record(5.0, "deadline")
+
+    summary = stats.summary()
+
+    assert summary["pages"] == 5
+    assert summary["p50"] == 0.3
+    assert summary["p99"] == 5.0
+    assert summary["outcomes"] == {"ok": 4, "deadline": 1}
+
+
+@pytest.mark.parametrize("deadline", [0, None])
+def test_configure_without_deadlines(deadline):
+    configure_fetch_budget(article_deadline=deadline, run_deadline=deadline, retries=2)
+
+    budget = new_fetch_budget()
+
+    assert budget.article_deadline is None
+    assert budget.run_deadline is None
+    assert budget.retries == 2
@@ -0,0 +1,161 @@
+import asyncio
+from typing import Optional
+
+import pytest
+
+from benchmarks.server import StandInServer
+from market_research.tools.fetch_strategy import (
+    FetchStats,
+    HttpFetcher,
+    fetch_with_fallback,
+)
+
+NEWS_PATH = "/quote/AAPL/latest-news/"
+ARTICLE_PATH = "/news/story-0000-00000.html"
+
+
+def _with_story_items(html: str) -> Optional[str]:
+    return html if "story-item" in html else None
+
+
+class FakeBrowser:
+    """Stands in for the Playwright strategy and records what it was asked for"""
+
+    def __init__(self, html: Optional[str]):
+        self.html = html
+        self.urls: list[str] = []
+
+    async def fetch(self, url: str) -> Optional[str]:
+        self.urls.append(url)
+        return self.html
+
+
+@pytest.fixture
+def fetcher() -> HttpFetcher:
+    return HttpFetcher(timeout=5.0)
+
+
+def test_http_fetch_returns_saved_page(server: StandInServer, fetcher: HttpFetcher):
+    html = asyncio.run(fetcher.fetch(server.url + NEWS_PATH))
+
+    assert html is not None
+    assert html.count("story-item") == 5
+    assert fetcher.fetch_sync(server.url + ARTICLE_PATH) is not None
+
+
+def test_http_fetch_of_missing_page_returns_none(
+    server: StandInServer, fetcher: HttpFetcher
+):
+    assert asyncio.run(fetcher.fetch(server.url + "/no-such-page")) is None
+    assert fetcher.fetch_sync(server.url + "/no-such-page") is None
+
+
+def test_http_fetch_of_unreachable_host_returns_none(fetcher: HttpFetcher):
+    assert asyncio.run(fetcher.fetch("http://127.0.0.1:9/")) is None
+
+
+def test_http_success_skips_later_strategies(
+    server: StandInServer, fetcher: HttpFetcher
+):
+    browser = FakeBrowser("<li class='story-item'></li>")
+    stats = FetchStats()
+    url = server.url + NEWS_PATH
+
+    html = asyncio.run(
+        fetch_with_fallback(
+            url,
+            [("http", fetcher.fetch), ("playwright", browser.fetch)],
+            _with_story_items,
+            stats,
+        )
+    )
+
+    assert html is not None and html.count("story-item") == 5
+    assert browser.urls == []
+    assert stats.served_by == {url: "http"}
+
+
+def test_non_200_falls_back_to_next_strategy(
+    server: StandInServer, fetcher: HttpFetcher
+):
+    browser = FakeBrowser("<li class='story-item'>rendered</li>")
+    stats = FetchStats()
+    url = server.url + "/quote/AAPL/missing/"
+
+    html = asyncio.run(
+        fetch_with_fallback(
+            url,
+            [("http", fetcher.fetch), ("playwright", browser.fetch)],
+            _with_story_items,
+            stats,
+        )
+    )
+
+    assert html == "<li class='story-item'>rendered</li>"
+    assert browser.urls == [url]
+    assert stats.served_by == {url: "playwright"}
+
+
+def test_missing_content_falls_back_to_next_strategy(
+    server: StandInServer, fetcher: HttpFetcher
+):
+    # An article page loads fine over HTTP but has no story items
+    browser = FakeBrowser("<li class='story-item'>rendered</li>")
+    stats = FetchStats()
+    url = server.url + ARTICLE_PATH
+
+    html = asyncio.run(
+        fetch_with_fallback(
+            url,
+            [("http", fetcher.fetch), ("playwright", browser.fetch)],
+            _with_story_items,
+            stats,
+        )
+    )
+
+    assert html == "<li class='story-item'>rendered</li>"
+    assert browser.urls == [url]
+    assert stats.served_by == {url: "playwright"}
+
+
+def test_every_strategy_failing_is_recorded(
+    server: StandInServer, fetcher: HttpFetcher
+):
+    stats = FetchStats()
+    url = server.url + ARTICLE_PATH
+
+    html = asyncio.run(
+        fetch_with_fallback(
+            url,
+            [("http", fetcher.fetch), ("playwright", FakeBrowser(None).fetch)],
+            _with_story_items,
+            stats,
+        )
+    )
+
+    assert html is None
+    assert stats.served_by == {url: "failed"}
+
+
+def test_fetch_stats_counts(server: StandInServer, fetcher: HttpFetcher):
+    browser = FakeBrowser("<li class='story-item'>rendered</li>")
+    stats = FetchStats()
+    strategies = [("http", fetcher.fetch), ("playwright", browser.fetch)]
+    urls = [
+        server.url + NEWS_PATH,
+        server.url + "/quote/MSFT/latest-news/",
+        server.url + "/missing/",
+        server.url + ARTICLE_PATH,
+    ]
+
+    async def _fetch_all():
+        for url in urls:
+            await fetch_with_fallback(url, strategies, _with_story_items, stats)
+
+    asyncio.run(_fetch_all())
+
+    assert stats.counts() == {"http": 2, "playwright": 2}
+    summary = stats.summary()
+    assert summary["total"] == 4
+    assert summary["http_hit_rate"] == 0.5
+    assert summary["served_by"][urls[2]] == "playwright"
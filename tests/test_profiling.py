@@ -0,0 +1,22 @@
+from market_research.utils.profiling import Profiler
+
+
+def test_format_table_keeps_attribute_values():
+    profiler = Profiler()
+    profiler.record("fetch.page", 0.25, bytes=1_234_567, hit_rate=0.25)
+    profiler.record("fetch.page", 0.5, bytes=1, hit_rate=0.5)
+    profiler.record("parse", 0.125, items=3)
+
+    lines = profiler.format_table().splitlines()
+
+    assert lines[0].split()[-3:] == ["bytes", "hit_rate", "items"]
+    assert lines[2].split() == [
+        "fetch.page",
+        "2",
+        "0.750",
+        "0.375",
+        "0.500",
+        "1234568",
+        "0.75",
+    ]
+    assert lines[3].split() == ["parse", "1", "0.125", "0.125", "0.125", "3"]
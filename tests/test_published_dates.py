@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from market_research.tools.html_parsing import pick_published_at
+from market_research.tools.published_dates import (
+    parse_iso_datetime,
+    parse_published_at,
+)
+
+NOW = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+
+def _utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("3 hours ago", _utc(2026, 10, 17, 9)),
+        ("Reuters • 45 minutes ago", _utc(2026, 10, 17, 11, 15)),
+        ("an hour ago", _utc(2026, 10, 17, 11)),
+        ("2d ago", _utc(2026, 10, 15, 12)),
+        ("just now", NOW),
+        ("yesterday", _utc(2026, 10, 16, 12)),
+    ],
+)
+def test_relative_dates_are_resolved_against_the_fetch_time(text, expected):
+    assert parse_published_at(text, NOW) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("2026-10-15T16:30:00.000Z", _utc(2026, 10, 15, 16, 30)),
+        ("2026-10-15T12:30:00-04:00", _utc(2026, 10, 15, 16, 30)),
+        # Machine timestamps without an offset are UTC
+        ("2026-10-15T16:30:00", _utc(2026, 10, 15, 16, 30)),
+    ],
+)
+def test_iso_dates(text, expected):
+    assert parse_published_at(text, NOW) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        # Yahoo shows US Eastern time, EDT in October and EST in January
+        ("Oct 15, 2026, 4:30 PM", _utc(2026, 10, 15, 20, 30)),
+        ("January 5, 2026 at 9:00 a.m.", _utc(2026, 1, 5, 14)),
+        ("Oct 16", _utc(2026, 10, 16, 4)),
+        ("Oct 15, 2026, 4:30 PM UTC", _utc(2026, 10, 15, 16, 30)),
+        ("Oct 15, 2026, 4:30 PM PDT", _utc(2026, 10, 15, 23, 30)),
+    ],
+)
+def test_absolute_dates(text, expected):
+    assert parse_published_at(text, NOW) == expected
+
+
+def test_date_without_year_is_the_most_recent_one():
+    assert parse_published_at("Dec 30", NOW) == _utc(2025, 12, 30, 5)
+
+
+def test_text_without_a_date():
+    assert parse_published_at("Motley Fool", NOW) is None
+    assert parse_published_at("", NOW) is None
+    assert parse_published_at("Feb 30, 2026", NOW) is None
+
+
+def test_parse_iso_datetime():
+    assert parse_iso_datetime("2026-10-15") == _utc(2026, 10, 15)
+    assert parse_iso_datetime("Unknown") is None
+    assert parse_iso_datetime(None) is None
+
+
+def test_words_starting_like_a_month_are_not_dates():
+    assert parse_published_at("Market 10 stocks to watch", NOW) is None
+    assert parse_published_at("Decline 5 percent", NOW) is None
+    assert parse_published_at("September 3, 2026", NOW) == _utc(2026, 9, 3, 4)
+    assert parse_published_at("Sept. 3, 2026", NOW) == _utc(2026, 9, 3, 4)
+
+
+def test_absolute_dates_can_be_left_out():
+    assert parse_published_at("Rates may 2 weeks", NOW) == _utc(2026, 5, 2, 4)
+    assert parse_published_at("Rates may 2 weeks", NOW, absolute=False) is None
+    assert parse_published_at("Oct 15, 2026", NOW, absolute=False) is None
+    assert parse_published_at("Reuters • 2d ago", NOW, absolute=False) == _utc(
+        2026, 10, 15, 12
+    )
+
+
+def test_free_text_of_a_story_item_is_not_read_as_an_absolute_date():
+    texts = ["Reuters", "Rates may 2 weeks", "3 hours ago"]
+
+    assert pick_published_at([], lambda: texts, NOW) == "2026-10-17T09:00:00+00:00"
+    assert pick_published_at([], lambda: ["Rates may 2 weeks"], NOW) == "Unknown"
+    # Time elements are markup for dates, absolute ones are read there
+    assert (
+        pick_published_at([(None, None, "Oct 15, 2026, 4:30 PM")], lambda: texts, NOW)
+        == "2026-10-15T20:30:00+00:00"
+    )
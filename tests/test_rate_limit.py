@@ -0,0 +1,143 @@
+import asyncio
+import time
+
+from market_research.tools.rate_limit import (
+    BACKOFF_FACTOR,
+    RATE_INCREASE,
+    HostLimiter,
+    RateLimiter,
+    configure_rate_limit,
+    get_rate_limiter,
+    is_throttled,
+    rate_limit_key,
+)
+
+PAGE = "<html>" + "x" * 1000 + "</html>"
+
+
+def test_throttled_responses():
+    assert is_throttled(429, "Too many requests")
+    assert is_throttled(503, PAGE)
+    # Yahoo answers some blocked requests with an empty 200
+    assert is_throttled(200, "   ")
+    assert not is_throttled(200, PAGE)
+    assert not is_throttled(404, "Not found")
+    assert not is_throttled(None, None)
+
+
+def test_burst_is_granted_without_waiting():
+    limiter = HostLimiter("example.com", rate=1.0, burst=3)
+
+    async def _acquire_all():
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(_acquire_all()) < 0.1
+    assert limiter.granted == 3
+
+
+def test_requests_beyond_the_burst_wait_for_tokens():
+    limiter = HostLimiter("example.com", rate=20.0, burst=1)
+
+    async def _acquire_all():
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+        return time.monotonic() - start
+
+    # One token at once, then four more at 20 per second
+    assert asyncio.run(_acquire_all()) >= 0.15
+    assert limiter.granted == 5
+    assert limiter.waited > 0
+
+
+def test_throttle_halves_the_rate_and_pauses_the_host():
+    limiter = HostLimiter("example.com", rate=4.0, burst=8)
+
+    limiter.report(429, "Too many requests", retry_after="0.3")
+
+    assert limiter.rate == 4.0 * BACKOFF_FACTOR
+    assert limiter.throttles == 1
+
+    async def _acquire():
+        start = time.monotonic()
+        await limiter.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(_acquire()) >= 0.25
+
+
+def test_responses_during_the_pause_count_once():
+    limiter = HostLimiter("example.com", rate=4.0)
+
+    limiter.report(429, "", retry_after="10")
+    limiter.report(429, "", retry_after="10")
+
+    assert limiter.throttles == 1
+    assert limiter.rate == 4.0 * BACKOFF_FACTOR
+
+
+def test_successes_raise_the_rate_back_to_the_limit():
+    limiter = HostLimiter("example.com", rate=1.0)
+    limiter.report(503, "", retry_after="0")
+    assert limiter.rate == 0.5
+
+    limiter.report(200, PAGE)
+    assert limiter.rate == 0.5 + RATE_INCREASE
+    for _ in range(20):
+        limiter.report(200, PAGE)
+    assert limiter.rate == 1.0
+
+
+def test_network_errors_leave_the_rate_alone():
+    limiter = HostLimiter("example.com", rate=2.0)
+
+    limiter.report(None, None)
+
+    assert limiter.rate == 2.0
+    assert limiter.throttles == 0
+
+
+def test_waiting_keys_take_turns():
+    limiter = RateLimiter(rate=50.0, burst=1)
+    url = "https://finance.yahoo.com/news/a.html"
+    order: list[str] = []
+
+    async def _fetch(key: str):
+        with rate_limit_key(key):
+            await limiter.acquire(url)
+        order.append(key)
+
+    async def _run():
+        # The burst goes to the first request, the rest queue up
+        await _fetch("warmup")
+        await asyncio.gather(*(_fetch("AAPL") for _ in range(4)), _fetch("TSLA"))
+
+    asyncio.run(_run())
+
+    assert order[1:] == ["AAPL", "TSLA", "AAPL", "AAPL", "AAPL"]
+
+
+def test_hosts_have_their_own_buckets():
+    limiter = RateLimiter(rate=2.0, burst=1)
+
+    limiter.report("https://a.example/x", 429, "", "60")
+
+    assert limiter.host("https://a.example/y").throttles == 1
+    assert limiter.host("https://b.example/y").throttles == 0
+    assert set(limiter.summary()) == {"a.example", "b.example"}
+
+
+def test_configure_rate_limit():
+    configure_rate_limit(0)
+    assert get_rate_limiter() is None
+
+    configure_rate_limit(5)
+    limiter = get_rate_limiter()
+    assert limiter is not None and limiter.rate == 5.0
+    configure_rate_limit(5)
+    assert get_rate_limiter() is limiter
+
+    configure_rate_limit(2)
+    assert get_rate_limiter() is not limiter
@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.server import StandInServer
+from market_research.tools import scrape_state
+from market_research.tools.scrape_state import ScrapeState, ScrapeStateStore
+from market_research.tools.yahoo_news import YahooNewsScraper
+
+URL = "https://finance.yahoo.com/news/story-1.html"
+OTHER_URL = "https://finance.yahoo.com/news/story-2.html"
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ScrapeStateStore:
+    return ScrapeStateStore(tmp_path / "state")
+
+
+def test_first_run_knows_nothing(store: ScrapeStateStore):
+    state = store.load("AAPL")
+
+    assert state.seen_urls == []
+    assert state.high_water_mark is None
+    assert not state.is_known(URL, "2024-05-02T10:00:00+00:00")
+
+
+def test_repeat_run_knows_the_saved_articles(store: ScrapeStateStore):
+    state = store.load("aapl")
+    state.update(
+        [URL + "?utm_source=tw", OTHER_URL],
+        ["2024-05-02T10:00:00+00:00", "2024-05-01T10:00:00+00:00"],
+    )
+    store.save(state)
+
+    state = store.load("AAPL")
+
+    assert state.is_known(URL)
+    assert state.is_known(OTHER_URL + "/")
+    assert state.high_water_mark == "2024-05-02T10:00:00+00:00"
+    assert state.last_run_at is not None
+
+
+def test_older_article_below_the_high_water_mark_is_known():
+    state = ScrapeState("AAPL")
+    state.update([URL], ["2024-05-02T10:00:00+00:00"])
+
+    unseen = "https://finance.yahoo.com/news/story-3.html"
+    assert state.is_known(unseen, "2024-05-01T10:00:00+00:00")
+    assert state.is_known(unseen, "2024-05-02T10:00:00+00:00")
+    assert not state.is_known(unseen, "2024-05-03T10:00:00+00:00")
+    # Without a date only the URL tells whether it was seen
+    assert not state.is_known(unseen)
+
+
+def test_high_water_mark_never_moves_back():
+    state = ScrapeState("AAPL")
+    state.update([URL], ["2024-05-02T10:00:00+00:00"])
+    state.update([OTHER_URL], ["2024-04-01T10:00:00+00:00", None])
+
+    assert state.high_water_mark == "2024-05-02T10:00:00+00:00"
+    assert state.seen_urls[0] == OTHER_URL
+
+
+def test_seen_urls_are_bounded(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(scrape_state, "MAX_SEEN_URLS", 3)
+    state = ScrapeState("AAPL")
+    for index in range(5):
+        state.update([f"https://finance.yahoo.com/news/story-{index}.html"])
+
+    assert len(state.seen_urls) == 3
+    assert state.is_known("https://finance.yahoo.com/news/story-4.html")
+    assert not state.is_known("https://finance.yahoo.com/news/story-0.html")
+
+
+@pytest.mark.parametrize("content", ["", "{not json", "[]"])
+def test_corrupt_state_file_starts_over(store: ScrapeStateStore, content: str):
+    (store.directory / "AAPL.json").write_text(content)
+
+    state = store.load("AAPL")
+
+    assert state.seen_urls == []
+    assert state.high_water_mark is None
+
+
+def test_save_leaves_no_temporary_files(store: ScrapeStateStore):
+    state = ScrapeState("AAPL")
+    state.update([URL])
+    store.save(state)
+    store.save(state)
+
+    assert [path.name for path in store.directory.iterdir()] == ["AAPL.json"]
+
+
+def test_repeat_scrape_since_last_fetches_nothing_new(
+    server: StandInServer, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    # The store is per process, each test keeps its state in its own cache dir
+    monkeypatch.setattr(scrape_state, "_store", None)
+    scraper = YahooNewsScraper(base_url=server.url)
+
+    first = scraper.scrape_articles("AAPL", fetch_strategy="http", since_last=True)
+    again = scraper.scrape_articles("AAPL", fetch_strategy="http", since_last=True)
+
+    assert first
+    assert again == []
+    assert (cache_dir / "state" / "AAPL.json").exists()
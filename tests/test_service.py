@@ -0,0 +1,109 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from market_research.service import (
+    Job,
+    ResearchService,
+    ServiceStoppedError,
+    make_server,
+)
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> ResearchService:
+    return ResearchService(workers=1, max_queue=4, output_dir=tmp_path / "reports")
+
+
+def _wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_stop_cancels_queued_jobs(service: ResearchService):
+    release = threading.Event()
+
+    def _run(job: Job):
+        release.wait(5)
+        return {"ticker": job.ticker}
+
+    service._run = _run
+    service.start(warm_up=False)
+    running = service.submit("scrape", "AAPL")
+    queued = [service.submit("scrape", ticker) for ticker in ("TSLA", "MSFT")]
+    _wait_for(lambda: running.status == "running")
+
+    stopper = threading.Thread(target=service.stop)
+    stopper.start()
+    _wait_for(lambda: all(job.status == "cancelled" for job in queued))
+    with pytest.raises(ServiceStoppedError):
+        service.submit("scrape", "NVDA")
+    release.set()
+    stopper.join(5)
+
+    assert not stopper.is_alive()
+    assert running.status == "succeeded"
+    assert all(job.done and job.error for job in queued)
+
+
+@pytest.mark.parametrize(
+    "options, message",
+    [
+        ({"max_articles": "x"}, "max_articles"),
+        ({"max_articles": 0}, "max_articles"),
+        ({"max_articles": True}, "max_articles"),
+        ({"fetch_strategy": "bogus"}, "fetch strategy"),
+        ({"since_last": "false"}, "since_last"),
+        ({"token_budget": -1}, "token_budget"),
+        ({"token_budget": "1500"}, "token_budget"),
+    ],
+)
+def test_invalid_options_are_rejected(service: ResearchService, options, message):
+    with pytest.raises(ValueError, match=message):
+        service.submit("scrape", "AAPL", **options)
+    assert service.stats()["queued"] == 0
+
+
+def test_valid_options_are_queued(service: ResearchService):
+    job = service.submit(
+        "scrape",
+        "aapl",
+        max_articles=3,
+        fetch_strategy="http",
+        since_last=False,
+        token_budget=None,
+    )
+
+    assert job.ticker == "AAPL"
+    assert service.stats()["queued"] == 1
+
+
+def test_api_answers_invalid_jobs_with_400(service: ResearchService):
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        for body in (
+            b'"since_last"',
+            b'{"kind": "scrape", "ticker": "AAPL", "max_articles": "x"}',
+            b'{"ticker": "AAPL", "fetch_strategy": "bogus"}',
+        ):
+            request = urllib.request.Request(
+                f"http://127.0.0.1:{server.server_address[1]}/jobs",
+                data=body,
+                method="POST",
+            )
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(request)
+            assert error.value.code == 400
+            assert json.loads(error.value.read())["error"]
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,165 @@
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+from crewai import Agent, Task
+from crewai.tasks.task_output import TaskOutput
+
+from market_research.task_cache import (
+    MemoizedTask,
+    TaskCache,
+    configure_task_cache,
+)
+from market_research.tools.article_search import ArticleSearchTool
+
+
+@pytest.fixture(autouse=True)
+def task_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    configure_task_cache(enabled=True, directory=tmp_path / "tasks")
+    yield
+    configure_task_cache(enabled=False, directory=tmp_path / "closed")
+
+
+class FakeLLMRuns:
+    """Replaces the agent run of crewAI's Task with a numbered answer"""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch):
+        self.calls = 0
+        runs = self
+
+        def _execute_core(
+            task: Task, agent: Any, context: Optional[str], tools: Any
+        ) -> TaskOutput:
+            runs.calls += 1
+            task.processed_by_agents.add(agent.role)
+            task.output = TaskOutput(
+                name=task.name,
+                description=task.description,
+                expected_output=task.expected_output,
+                raw=f"answer {runs.calls}",
+                agent=agent.role,
+            )
+            return task.output
+
+        monkeypatch.setattr(Task, "_execute_core", _execute_core)
+
+
+@pytest.fixture
+def runs(monkeypatch: pytest.MonkeyPatch) -> FakeLLMRuns:
+    return FakeLLMRuns(monkeypatch)
+
+
+def _agent(goal: str = "Write a report", tools: Optional[list] = None) -> Agent:
+    return Agent(
+        role="Analyst",
+        goal=goal,
+        backstory="Reads the news",
+        llm="gpt-4o-mini",
+        tools=tools or [],
+    )
+
+
+def _task(
+    agent: Agent, ticker: str = "AAPL", output_file: Optional[str] = None
+) -> MemoizedTask:
+    task = MemoizedTask(
+        name="reporting_task",
+        description="Report on {ticker}",
+        expected_output="A report",
+        agent=agent,
+        output_file=output_file,
+    )
+    task.interpolate_inputs_and_add_conversation_history({"ticker": ticker})
+    return task
+
+
+def _run(task: MemoizedTask, context: Optional[str] = "news") -> str:
+    return task._execute_core(task.agent, context, None).raw
+
+
+def test_same_inputs_reuse_the_output(runs: FakeLLMRuns):
+    agent = _agent()
+
+    assert _run(_task(agent)) == "answer 1"
+    task = _task(agent)
+    assert _run(task) == "answer 1"
+
+    assert runs.calls == 1
+    assert task.processed_by_agents == {"Analyst"}
+    assert task.output is not None and task.output.raw == "answer 1"
+
+
+def test_changed_upstream_output_misses(runs: FakeLLMRuns):
+    agent = _agent()
+
+    _run(_task(agent), context="news")
+    assert _run(_task(agent), context="other news") == "answer 2"
+
+
+def test_changed_agent_config_misses(runs: FakeLLMRuns):
+    _run(_task(_agent()))
+
+    assert _run(_task(_agent(goal="Write a short report"))) == "answer 2"
+
+
+def test_changed_input_misses(runs: FakeLLMRuns):
+    agent = _agent()
+
+    _run(_task(agent, ticker="AAPL"))
+    assert _run(_task(agent, ticker="TSLA")) == "answer 2"
+
+
+def test_hit_rewrites_the_output_file(
+    runs: FakeLLMRuns, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    # crewAI keeps output files relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    agent = _agent()
+    _run(_task(agent, output_file="report.md"))
+    report = tmp_path / "report.md"
+    report.unlink(missing_ok=True)
+
+    _run(_task(agent, output_file="report.md"))
+
+    assert runs.calls == 1
+    assert report.read_text() == "answer 1"
+
+
+def test_tool_task_without_fingerprint_is_never_cached(runs: FakeLLMRuns):
+    agent = _agent(tools=[ArticleSearchTool()])
+
+    _run(_task(agent), context=None)
+    _run(_task(agent), context=None)
+
+    assert runs.calls == 2
+
+
+def test_expired_entries_are_gone(tmp_path: Path):
+    cache = TaskCache(tmp_path / "tasks.sqlite3", ttl=0.05)
+    cache.put("key", "task", "output")
+    assert cache.get("key") == "output"
+
+    time.sleep(0.1)
+
+    assert cache.get("key") is None
+    cache.put("other", "task", "output")
+    assert len(cache) == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path):
+    cache = TaskCache(tmp_path / "tasks.sqlite3", max_entries=2)
+    cache.put("a", "task", "A")
+    time.sleep(0.01)
+    cache.put("b", "task", "B")
+    time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+
+    cache.put("c", "task", "C")
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
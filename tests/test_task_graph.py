@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+
+import pytest
+from crewai import Task
+
+from market_research.task_graph import (
+    schedule_tasks,
+    task_dependencies,
+    task_levels,
+    task_timeline,
+)
+
+
+def _tasks(*names: str) -> list[Task]:
+    return [
+        Task(name=name, description=f"{name} description", expected_output="text")
+        for name in names
+    ]
+
+
+def test_dependencies_are_read_from_the_config():
+    config = {
+        "news": {"depends_on": []},
+        "research": {},
+        "report": {"depends_on": "news"},
+    }
+
+    assert task_dependencies(config) == {
+        "news": [],
+        "research": None,
+        "report": ["news"],
+    }
+
+
+def test_unknown_dependency_is_an_error():
+    with pytest.raises(ValueError, match="unknown task 'missing'"):
+        task_dependencies({"report": {"depends_on": ["missing"]}})
+
+
+def test_tasks_without_depends_on_stay_sequential():
+    names = ["a", "b", "c"]
+
+    assert task_levels(names, {}) == [["a"], ["b"], ["c"]]
+
+
+def test_independent_tasks_share_a_level():
+    dependencies = {"news": [], "research": [], "report": ["news", "research"]}
+
+    assert task_levels(["news", "research", "report"], dependencies) == [
+        ["news", "research"],
+        ["report"],
+    ]
+
+
+def test_cycles_are_an_error():
+    with pytest.raises(ValueError, match="cycle"):
+        task_levels(["a", "b"], {"a": ["b"], "b": ["a"]})
+
+
+def test_independent_tasks_run_asynchronously_and_the_report_joins_them():
+    report, news, research = _tasks("report", "news", "research")
+    config = {
+        "report": {"depends_on": ["news", "research"]},
+        "news": {"depends_on": []},
+        "research": {"depends_on": []},
+    }
+
+    ordered = schedule_tasks([report, news, research], config)
+
+    assert ordered == [news, research, report]
+    assert news.async_execution and research.async_execution
+    assert not report.async_execution
+    assert report.context == [news, research]
+
+
+def test_last_task_never_runs_in_the_background():
+    first, second = _tasks("first", "second")
+    config = {"first": {"depends_on": []}, "second": {"depends_on": []}}
+
+    ordered = schedule_tasks([first, second], config)
+
+    assert first.async_execution
+    assert not ordered[-1].async_execution
+
+
+def test_sequential_crew_is_unchanged():
+    tasks = _tasks("a", "b", "c")
+
+    ordered = schedule_tasks(tasks, {"a": {}, "b": {}, "c": {}})
+
+    assert ordered == tasks
+    assert not any(task.async_execution for task in ordered)
+
+
+def test_timeline_is_relative_to_the_first_task():
+    news, report = _tasks("news", "report")
+    start = datetime(2026, 10, 17, 12, 0, 0)
+    news.start_time, news.end_time = start, start + timedelta(seconds=2)
+    report.start_time, report.end_time = (
+        start + timedelta(seconds=2),
+        start + timedelta(seconds=5),
+    )
+
+    timeline = task_timeline([report, news])
+
+    assert [(entry["task"], entry["start"], entry["end"]) for entry in timeline] == [
+        ("news", 0.0, 2.0),
+        ("report", 2.0, 5.0),
+    ]
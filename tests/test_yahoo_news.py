@@ -0,0 +1,69 @@
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from benchmarks.server import StandInServer
+from market_research.tools.fetch_budget import configure_fetch_budget
+from market_research.tools.yahoo_news import ScrapeRun, YahooNewsScraper
+
+ARTICLE_PATH = "/news/story-0000-00000.html"
+
+
+@pytest.fixture
+def video_server(tmp_path: Path):
+    """Serves an article URL whose page loads but has no article body"""
+    pages = tmp_path / "video"
+    pages.mkdir()
+    (pages / "article-0.html").write_text(
+        "<html><body><main><div class='video-player'></div></main></body></html>"
+    )
+    with StandInServer(pages_dir=pages) as server:
+        yield server
+
+
+def _scraper_with_browser(
+    server: StandInServer, html: Optional[str]
+) -> tuple[YahooNewsScraper, list[str]]:
+    scraper = YahooNewsScraper(base_url=server.url)
+    calls: list[str] = []
+
+    async def _browser(url: str, *args, **kwargs) -> Optional[str]:
+        calls.append(url)
+        return html
+
+    scraper._scrape_webpage = _browser  # type: ignore[method-assign]
+    return scraper, calls
+
+
+def test_page_without_body_after_failed_browser_fetch_is_retried(
+    video_server: StandInServer,
+):
+    configure_fetch_budget(article_deadline=10, retries=2)
+    scraper, calls = _scraper_with_browser(video_server, None)
+    run = ScrapeRun(fetch_strategy="auto")
+
+    content, _ = asyncio.run(
+        scraper._scrape_detailed_page(video_server.url + ARTICLE_PATH, run)
+    )
+
+    assert content is None
+    assert len(calls) == 3
+    assert run.latencies.retries == 2
+
+
+def test_page_without_body_from_every_strategy_is_not_retried(
+    video_server: StandInServer,
+):
+    configure_fetch_budget(article_deadline=10, retries=2)
+    scraper, calls = _scraper_with_browser(video_server, "<html>video</html>")
+    run = ScrapeRun(fetch_strategy="auto")
+
+    content, _ = asyncio.run(
+        scraper._scrape_detailed_page(video_server.url + ARTICLE_PATH, run)
+    )
+
+    assert content is None
+    assert len(calls) == 1
+    assert run.latencies.retries == 0